@@ -0,0 +1,402 @@
+"""Bulk registration and start list import from CSV or XLSX.
+
+Each row names a simple climber by `name`, `age` and `gender`, and may
+pin a `category` (category group name) and a `start_order`. Climbers are
+matched to existing simple climbers with the same name, age and gender,
+or created. The category comes from the competition's categories of that
+gender whose group's age range holds the climber's age, the narrowest
+range first. With `startlist`, each climber is also added to the first
+round of their category, at the row's start order or after the last one.
+
+Everything is written with a handful of set-based statements in one
+transaction, and the result lists what happened to every row. Rows that
+fail validation are reported and skipped; the rest are still imported.
+"""
+
+import csv
+import io
+import time
+import zipfile
+from dataclasses import dataclass, field
+from typing import IO, Any, Iterable, Iterator, Optional
+
+from django.db import transaction
+
+from accounts.authorization import require_competition_admin
+from competitions.models import Competition, CompetitionCategory, CompetitionRound
+from competitions.versions import bump_competition_version
+from core.models import CompetitionGender
+from core.upsert import CONFLICT, upsert
+from scoring.models import RoundResult
+from scoring.ordering import highest_place
+
+from .models import Climber, CompetitionRegistration
+
+try:
+    import openpyxl
+    from openpyxl.utils.exceptions import InvalidFileException
+except ImportError:  # pragma: no cover - depends on the environment
+    openpyxl = None
+    InvalidFileException = zipfile.BadZipFile
+
+MAX_ROWS = 5000
+COLUMNS = ("name", "age", "gender", "category", "start_order")
+GENDERS = {choice.lower(): choice for choice in CompetitionGender.values}
+NAME_MAX_LENGTH = 30
+
+
+def xlsx_available() -> bool:
+    return openpyxl is not None
+
+
+@dataclass
+class RowReport:
+    row: int
+    name: str = ""
+    climber_id: Optional[int] = None
+    climber_created: bool = False
+    category: Optional[str] = None
+    registration: Optional[str] = None
+    start_order: Optional[int] = None
+    errors: list[str] = field(default_factory=list)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "row": self.row,
+            "name": self.name,
+            "climber_id": self.climber_id,
+            "climber_created": self.climber_created,
+            "category": self.category,
+            "registration": self.registration,
+            "start_order": self.start_order,
+            "errors": self.errors,
+        }
+
+
+@dataclass
+class _Row:
+    report: RowReport
+    age: int
+    gender: str
+    category_name: Optional[str]
+    start_order: Optional[int]
+    # Filled in as the import resolves the row.
+    climber: Climber = None  # pyright: ignore[reportAssignmentType]
+    category: CompetitionCategory = None  # pyright: ignore[reportAssignmentType]
+    round_id: Optional[int] = None
+    new_entry: bool = False
+
+
+def read_rows(file: IO[bytes], filename: str) -> Iterator[dict[str, Any]]:
+    """Rows of a CSV or XLSX upload as dicts keyed by lowercase header.
+
+    Raises ValueError for unknown formats, unreadable workbooks, or XLSX
+    without openpyxl.
+    """
+    if filename.lower().endswith(".xlsx"):
+        if openpyxl is None:
+            raise ValueError("XLSX import needs the openpyxl package; upload CSV")
+        try:
+            workbook = openpyxl.load_workbook(file, read_only=True, data_only=True)
+        except (zipfile.BadZipFile, InvalidFileException) as e:
+            raise ValueError(f"The file is not a readable XLSX workbook: {e}") from e
+        try:
+            sheet = workbook.active
+            if sheet is None:
+                raise ValueError("The workbook has no worksheet")
+            rows = sheet.iter_rows(values_only=True)
+            header = [str(cell or "").strip().lower() for cell in next(rows, ())]
+            for values in rows:
+                if any(value not in (None, "") for value in values):
+                    yield dict(zip(header, values))
+        finally:
+            workbook.close()
+    elif filename.lower().endswith(".csv"):
+        text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+        sample = text.read(4096)
+        text.seek(0)
+        try:
+            dialect: Any = csv.Sniffer().sniff(sample, delimiters=",;\t")
+        except csv.Error:
+            dialect = csv.excel
+        reader = csv.reader(text, dialect)
+        header = [cell.strip().lower() for cell in next(reader, [])]
+        for values in reader:
+            if any(value.strip() for value in values):
+                yield dict(zip(header, values))
+    else:
+        raise ValueError("Upload a .csv or .xlsx file")
+
+
+def import_registrations(
+    user,
+    competition_id: int,
+    rows: Iterable[dict[str, Any]],
+    startlist: bool = False,
+    dry_run: bool = False,
+) -> dict[str, Any]:
+    """Register the climbers in `rows` for the competition.
+
+    `user` None skips the permission check, for management commands.
+    Raises ValueError if the competition does not exist or there are too
+    many rows, and PermissionError if `user` may not administer it.
+    """
+    started = time.monotonic()
+    try:
+        competition = Competition.objects.get(id=competition_id)
+    except Competition.DoesNotExist:
+        raise ValueError(f"Competition with id {competition_id} not found")
+    if user is not None:
+        require_competition_admin(user, competition.pk)
+
+    parsed = []
+    for number, raw in enumerate(rows, start=1):
+        if number > MAX_ROWS:
+            raise ValueError(f"Import at most {MAX_ROWS} rows at a time")
+        parsed.append(_parse_row(number, raw))
+
+    with transaction.atomic():
+        valid = _resolve_categories(competition, _valid(parsed))
+        _match_climbers(user, valid)
+        if startlist:
+            valid = _plan_start_orders(valid)
+        _create_climbers(valid)
+        _register(user, competition, valid)
+        if startlist:
+            _add_to_start_lists(user, valid)
+
+        if dry_run:
+            transaction.set_rollback(True)
+        elif valid:
+            bump_competition_version(competition.pk)
+
+    reports = [row.report for row in parsed]
+    return {
+        "competition_id": competition.pk,
+        "dry_run": dry_run,
+        "rows": len(reports),
+        "imported": sum(1 for report in reports if not report.errors),
+        "failed": sum(1 for report in reports if report.errors),
+        "climbers_created": sum(1 for report in reports if report.climber_created),
+        "elapsed_ms": round((time.monotonic() - started) * 1000, 1),
+        "report": [report.as_dict() for report in reports],
+    }
+
+
+def _valid(rows: list[_Row]) -> list[_Row]:
+    return [row for row in rows if not row.report.errors]
+
+
+def _parse_row(number: int, raw: dict[str, Any]) -> _Row:
+    values = {column: str(raw.get(column) or "").strip() for column in COLUMNS}
+    report = RowReport(row=number, name=values["name"])
+
+    if not values["name"]:
+        report.errors.append("name is required")
+    elif len(values["name"]) > NAME_MAX_LENGTH:
+        report.errors.append(f"name is longer than {NAME_MAX_LENGTH} characters")
+
+    age = _integer(values["age"])
+    if age is None or not 1 <= age <= 99:
+        report.errors.append("age must be a number from 1 to 99")
+
+    gender = GENDERS.get(values["gender"].lower())
+    if gender is None:
+        report.errors.append(f"gender must be one of {', '.join(GENDERS.values())}")
+
+    start_order = None
+    if values["start_order"]:
+        start_order = _integer(values["start_order"])
+        if start_order is None or start_order < 1:
+            report.errors.append("start_order must be a positive number")
+
+    return _Row(
+        report=report,
+        age=age or 0,
+        gender=gender or "",
+        category_name=values["category"] or None,
+        start_order=start_order,
+    )
+
+
+def _integer(value: str) -> Optional[int]:
+    # Spreadsheets hand numbers over as floats, so accept "12.0".
+    try:
+        number = float(value)
+    except ValueError:
+        return None
+    return int(number) if number.is_integer() else None
+
+
+def _resolve_categories(competition: Competition, rows: list[_Row]) -> list[_Row]:
+    categories = sorted(
+        CompetitionCategory.objects.filter(competition=competition).select_related(
+            "category_group"
+        ),
+        key=_age_span,
+    )
+
+    for row in rows:
+        for category in categories:
+            if category.gender != row.gender:
+                continue
+            group = category.category_group
+            if row.category_name:
+                matches = group.name.lower() == row.category_name.lower()
+            else:
+                matches = (group.min_age is None or group.min_age <= row.age) and (
+                    group.max_age is None or row.age <= group.max_age
+                )
+            if matches:
+                row.category = category
+                row.report.category = f"{group.name} {category.gender}"
+                break
+        else:
+            row.report.errors.append(
+                f"no {row.gender} category named {row.category_name}"
+                if row.category_name
+                else f"no {row.gender} category for age {row.age}"
+            )
+    return _valid(rows)
+
+
+def _age_span(category: CompetitionCategory) -> float:
+    """Narrow age groups win over wide ones, such as an open category."""
+    group = category.category_group
+    if group.min_age is None or group.max_age is None:
+        return float("inf")
+    return group.max_age - group.min_age
+
+
+def _match_climbers(user, rows: list[_Row]) -> None:
+    """Point every row at an existing simple climber with the same name,
+    age and gender, or at a new unsaved one shared by rows alike."""
+    climbers: dict[tuple[str, int, str], Climber] = {}
+    for climber in Climber.objects.filter(
+        is_simple_athlete=True,
+        simple_name__in={row.report.name for row in rows},
+    ).order_by("-id"):
+        key = (climber.simple_name, climber.simple_age, climber.simple_gender)
+        climbers[key] = climber  # pyright: ignore[reportArgumentType]
+
+    for row in rows:
+        key = (row.report.name, row.age, row.gender)
+        if key not in climbers:
+            climbers[key] = Climber(
+                simple_name=row.report.name,
+                simple_age=row.age,
+                simple_gender=row.gender,
+                is_simple_athlete=True,
+                created_by=user,
+                last_modified_by=user,
+            )
+        row.climber = climbers[key]
+
+
+def _create_climbers(rows: list[_Row]) -> None:
+    new = {id(row.climber): row.climber for row in rows if row.climber.pk is None}
+    Climber.objects.bulk_create(new.values())
+    for row in rows:
+        row.report.climber_id = row.climber.pk
+        row.report.climber_created = id(row.climber) in new
+
+
+def _register(user, competition: Competition, rows: list[_Row]) -> None:
+    groups: dict[tuple[int, int], list[_Row]] = {}
+    for row in rows:
+        groups.setdefault((row.climber.pk, row.category.pk), []).append(row)
+
+    results = upsert(
+        [
+            CompetitionRegistration(
+                competition=competition,
+                competition_category=group[0].category,
+                climber=group[0].climber,
+                created_by=user,
+                last_modified_by=user,
+            )
+            for group in groups.values()
+        ],
+        "unique_active_registration",
+        revive_fields=["last_modified_by"],
+    )
+    for group, result in zip(groups.values(), results):
+        for row in group:
+            row.report.registration = (
+                "existing" if result.outcome == CONFLICT else result.outcome
+            )
+
+
+def _plan_start_orders(rows: list[_Row]) -> list[_Row]:
+    """Pick each row's start order in the first round of its category.
+
+    Climbers already on that start list keep their place; rows asking
+    for a place someone else holds fail. Rows without a start order go
+    after the last one, in file order.
+    """
+    first_rounds: dict[int, int] = {}
+    for round_id, category_id in (
+        CompetitionRound.objects.filter(
+            competition_category__in={row.category.pk for row in rows}
+        )
+        .order_by("-round_order")
+        .values_list("id", "competition_category_id")
+    ):
+        first_rounds[category_id] = round_id
+
+    # Start order -> climber, and climber -> start order, per round.
+    holders: dict[int, dict[int, Any]] = {
+        round_id: {} for round_id in first_rounds.values()
+    }
+    places: dict[int, dict[Any, int]] = {
+        round_id: {} for round_id in first_rounds.values()
+    }
+    last_order = dict.fromkeys(holders, 0)
+    for round_id, climber_id, start_order, start_key in RoundResult.objects.filter(
+        round_id__in=holders
+    ).values_list("round_id", "climber_id", "start_order", "start_key"):
+        holders[round_id][start_order] = climber_id
+        places[round_id][climber_id] = start_order
+        last_order[round_id] = max(
+            last_order[round_id], highest_place(start_order, start_key)
+        )
+
+    for row in sorted(rows, key=lambda row: row.start_order is None):
+        round_id = first_rounds.get(row.category.pk)
+        if round_id is None:
+            row.report.errors.append("category has no round to start in")
+            continue
+        row.round_id = round_id
+        climber = row.climber.pk or id(row.climber)
+        if climber in places[round_id]:
+            row.report.start_order = places[round_id][climber]
+            continue
+
+        start_order = row.start_order or last_order[round_id] + 1
+        if start_order in holders[round_id]:
+            row.report.errors.append(f"start order {start_order} is already taken")
+            continue
+        holders[round_id][start_order] = climber
+        last_order[round_id] = max(last_order[round_id], start_order)
+        places[round_id][climber] = start_order
+        row.report.start_order = start_order
+        row.new_entry = True
+    return _valid(rows)
+
+
+def _add_to_start_lists(user, rows: list[_Row]) -> None:
+    upsert(
+        [
+            RoundResult(
+                round_id=row.round_id,
+                climber=row.climber,
+                start_order=row.report.start_order,
+                created_by=user,
+                last_modified_by=user,
+            )
+            for row in rows
+            if row.new_entry
+        ],
+        "unique_active_round_result",
+        revive_fields=["start_order", "start_key", "rank", "last_modified_by"],
+    )
@@ -0,0 +1,64 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from athletes import imports
+
+
+class Command(BaseCommand):
+    help = (
+        "Register climbers for a competition from a CSV or XLSX file with "
+        "name, age, gender and optional category and start_order columns"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("competition", type=int, help="Competition id")
+        parser.add_argument("path", help="CSV or XLSX file")
+        parser.add_argument(
+            "--startlist",
+            action="store_true",
+            help="Also add the climbers to the first round of their category",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report what would be imported without writing it",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            with open(options["path"], "rb") as file:
+                result = imports.import_registrations(
+                    user=None,
+                    competition_id=options["competition"],
+                    rows=imports.read_rows(file, options["path"]),
+                    startlist=options["startlist"],
+                    dry_run=options["dry_run"],
+                )
+        except (OSError, ValueError) as e:
+            raise CommandError(str(e))
+
+        for row in result["report"]:
+            if row["errors"]:
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"row {row['row']} {row['name']}: {'; '.join(row['errors'])}"
+                    )
+                )
+            elif options["verbosity"] > 1:
+                self.stdout.write(
+                    f"row {row['row']} {row['name']}: {row['category']}, "
+                    f"registration {row['registration']}"
+                    + (
+                        f", start order {row['start_order']}"
+                        if row["start_order"]
+                        else ""
+                    )
+                )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{'Would import' if result['dry_run'] else 'Imported'} "
+                f"{result['imported']} of {result['rows']} rows, "
+                f"{result['climbers_created']} new climbers, "
+                f"in {result['elapsed_ms']} ms"
+            )
+        )
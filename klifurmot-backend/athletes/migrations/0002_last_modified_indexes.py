@@ -0,0 +1,20 @@
+# Generated by Django 5.2.1 on 2026-10-19 03:26
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('athletes', '0001_initial'),
+        ('competitions', '0002_competition_discipline'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='competitionregistration',
+            index=models.Index(fields=['competition', 'last_modified_at'], name='registration_comp_modified_idx'),
+        ),
+    ]
@@ -19,6 +19,13 @@ class Climber(AuditedSoftDeleteModel):
     )
     is_simple_athlete = models.BooleanField(default=False)
 
+    soft_delete_cascade = [
+        ("athletes.CompetitionRegistration", "climber"),
+        ("scoring.RoundResult", "climber"),
+        ("scoring.ClimberRoundScore", "climber"),
+        ("scoring.Climb", "climber"),
+    ]
+
     def __str__(self):
         if self.is_simple_athlete and self.simple_name:
             return self.simple_name
@@ -57,6 +64,31 @@ class CompetitionRegistration(AuditedSoftDeleteModel):
     )
     climber = models.ForeignKey(Climber, on_delete=models.CASCADE)
 
+    # The climber's start list entries, scores and climbs in the category.
+    soft_delete_cascade = [
+        (
+            "scoring.RoundResult",
+            {
+                "climber": "climber",
+                "round__competition_category": "competition_category",
+            },
+        ),
+        (
+            "scoring.ClimberRoundScore",
+            {
+                "climber": "climber",
+                "round__competition_category": "competition_category",
+            },
+        ),
+        (
+            "scoring.Climb",
+            {
+                "climber": "climber",
+                "route__round__competition_category": "competition_category",
+            },
+        ),
+    ]
+
     class Meta:
         constraints = [
             models.UniqueConstraint(
@@ -65,6 +97,12 @@ class CompetitionRegistration(AuditedSoftDeleteModel):
                 name="unique_active_registration",
             ),
         ]
+        indexes = [
+            models.Index(
+                fields=["competition", "last_modified_at"],
+                name="registration_comp_modified_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.climber} in {self.competition_category}"
@@ -38,3 +38,10 @@ class CreateRegistrationSerializer(serializers.Serializer):
     climber = serializers.IntegerField()
     competition = serializers.IntegerField()
     competition_category = serializers.IntegerField()
+
+
+class ImportRegistrationsSerializer(serializers.Serializer):
+    file = serializers.FileField()
+    competition = serializers.IntegerField()
+    startlist = serializers.BooleanField(default=False)
+    dry_run = serializers.BooleanField(default=False)
@@ -12,7 +12,11 @@ from .utils import (
     get_age_based_category,
 )
 from competitions.models import CompetitionRound
+from competitions.versions import bump_competition_version, bump_competition_versions
+from core.cascade import restore, soft_delete
+from core.upsert import upsert_one_or_raise
 from scoring.models import RoundResult
+from scoring.utils import broadcast_bulk_change
 from django.db.models import Q
 
 
@@ -20,7 +24,6 @@ def list_public_athletes(search: Optional[str] = None) -> list[dict[str, Any]]:
     queryset = (
         Climber.objects.select_related("user_account__nationality")
         .filter(
-            deleted=False,
             is_simple_athlete=False,
             user_account__isnull=False,
         )
@@ -70,7 +73,7 @@ def list_public_athletes(search: Optional[str] = None) -> list[dict[str, Any]]:
 def get_athlete_detail(athlete_id: int) -> dict[str, Any]:
     try:
         climber = Climber.objects.select_related("user_account__nationality").get(
-            id=athlete_id, deleted=False, is_simple_athlete=False
+            id=athlete_id, is_simple_athlete=False
         )
     except Climber.DoesNotExist:
         raise ValueError(f"Athlete with id {athlete_id} not found")
@@ -93,14 +96,12 @@ def get_athlete_detail(athlete_id: int) -> dict[str, Any]:
 
     registrations = CompetitionRegistration.objects.filter(
         climber=climber,
-        deleted=False,
         competition__end_date__lt=dj_timezone.now(),
     ).select_related("competition", "competition_category__category_group")
 
     participation_count = (
         RoundResult.objects.filter(
             climber=climber,
-            deleted=False,
             round__competition_category__competition__end_date__lt=dj_timezone.now(),
             round__deleted=False,
         )
@@ -149,7 +150,6 @@ def _get_climber_results(competition, climber) -> list[dict[str, Any]]:
     rounds = (
         CompetitionRound.objects.filter(
             competition_category__competition=competition,
-            deleted=False,
         )
         .select_related("round_group")
         .order_by("-round_order")
@@ -162,7 +162,6 @@ def _get_climber_results(competition, climber) -> list[dict[str, Any]]:
         round_result = RoundResult.objects.filter(
             round=round,
             climber=climber,
-            deleted=False,
         ).first()
 
         if round_result:
@@ -183,7 +182,6 @@ def _get_climber_results(competition, climber) -> list[dict[str, Any]]:
 def _calculate_wins(competition, climber) -> int:
     rounds = CompetitionRound.objects.filter(
         competition_category__competition=competition,
-        deleted=False,
     )
 
     final_round = rounds.order_by("-round_order").first()
@@ -194,7 +192,6 @@ def _calculate_wins(competition, climber) -> int:
     final_result = RoundResult.objects.filter(
         round=final_round,
         climber=climber,
-        deleted=False,
     ).first()
 
     if final_result and final_result.rank == 1:
@@ -204,9 +201,7 @@ def _calculate_wins(competition, climber) -> int:
 
 
 def list_all_climbers(search: Optional[str] = None) -> list[dict[str, Any]]:
-    queryset = Climber.objects.select_related("user_account__nationality").filter(
-        deleted=False
-    )
+    queryset = Climber.objects.select_related("user_account__nationality")
 
     if search:
         queryset = queryset.filter(
@@ -288,7 +283,7 @@ def create_climber(user, **data: Any) -> dict[str, Any]:
 def get_climber(climber_id: int) -> dict[str, Any]:
     try:
         climber = Climber.objects.select_related("user_account__nationality").get(
-            id=climber_id, deleted=False
+            id=climber_id
         )
     except Climber.DoesNotExist:
         raise ValueError(f"Climber with id {climber_id} not found")
@@ -332,7 +327,7 @@ def get_climber(climber_id: int) -> dict[str, Any]:
 
 def update_climber(climber_id: int, user, **update_data: Any) -> dict[str, Any]:
     try:
-        climber = Climber.objects.get(id=climber_id, deleted=False)
+        climber = Climber.objects.get(id=climber_id)
     except Climber.DoesNotExist:
         raise ValueError(f"Climber with id {climber_id} not found")
 
@@ -352,6 +347,7 @@ def update_climber(climber_id: int, user, **update_data: Any) -> dict[str, Any]:
 
     climber.last_modified_by = user
     climber.save()
+    bump_competition_versions(_climber_competition_ids(climber))
 
     return {
         "id": climber.pk,
@@ -365,44 +361,47 @@ def update_climber(climber_id: int, user, **update_data: Any) -> dict[str, Any]:
     }
 
 
-def delete_climber(climber_id: int) -> None:
-    from scoring.models import Climb, ClimberRoundScore, RoundResult
-
+def delete_climber(climber_id: int) -> dict[str, int]:
     try:
-        climber = Climber.objects.get(id=climber_id, deleted=False)
+        climber = Climber.objects.get(id=climber_id)
     except Climber.DoesNotExist:
         raise ValueError(f"Climber with id {climber_id} not found")
 
     with transaction.atomic():
-        Climb.objects.filter(
-            climber=climber,
-            deleted=False,
-        ).update(deleted=True)
+        competition_ids = _climber_competition_ids(climber)
+        deleted = soft_delete(climber)
+        broadcast_bulk_change(competition_ids, deleted.round_ids)
 
-        ClimberRoundScore.objects.filter(
-            climber=climber,
-            deleted=False,
-        ).update(deleted=True)
+    return deleted.counts
 
-        RoundResult.objects.filter(
-            climber=climber,
-            deleted=False,
-        ).update(deleted=True)
 
-        CompetitionRegistration.objects.filter(
-            climber=climber,
-            deleted=False,
-        ).update(deleted=True)
+def restore_climber(climber_id: int, user=None) -> dict[str, int]:
+    try:
+        climber = Climber.all_objects.get(id=climber_id, deleted=True)
+    except Climber.DoesNotExist:
+        raise ValueError(f"Deleted climber with id {climber_id} not found")
 
-        climber.deleted = True
-        climber.save()
+    with transaction.atomic():
+        restored = restore(climber, user)
+        broadcast_bulk_change(_climber_competition_ids(climber), restored.round_ids)
+
+    return restored.counts
+
+
+def _climber_competition_ids(climber: Climber) -> set[int]:
+    """Competitions whose public payloads show the climber."""
+    registered = CompetitionRegistration.objects.filter(climber=climber).values_list(
+        "competition_id", flat=True
+    )
+    started = RoundResult.objects.filter(climber=climber).values_list(
+        "round__competition_category__competition_id", flat=True
+    )
+    return {*registered, *started}
 
 
 def link_climber(user, climber_id: int, user_account_id: int) -> dict[str, Any]:
     try:
-        climber = Climber.objects.get(
-            id=climber_id, is_simple_athlete=True, deleted=False
-        )
+        climber = Climber.objects.get(id=climber_id, is_simple_athlete=True)
     except Climber.DoesNotExist:
         raise ValueError(f"Simple climber with id {climber_id} not found")
 
@@ -411,7 +410,7 @@ def link_climber(user, climber_id: int, user_account_id: int) -> dict[str, Any]:
     except UserAccount.DoesNotExist:
         raise ValueError(f"User account with id {user_account_id} not found")
 
-    existing = Climber.objects.filter(user_account=user_account, deleted=False).exists()
+    existing = Climber.objects.filter(user_account=user_account).exists()
 
     if existing:
         raise ValueError("User account already has a climber linked")
@@ -430,6 +429,7 @@ def link_climber(user, climber_id: int, user_account_id: int) -> dict[str, Any]:
         climber.simple_gender = None
         climber.last_modified_by = user
         climber.save()
+        bump_competition_versions(_climber_competition_ids(climber))
 
     return {
         "id": climber.pk,
@@ -448,7 +448,7 @@ def list_registrations(competition_id: Optional[int] = None) -> list[dict[str, A
         "climber__user_account",
         "competition",
         "competition_category__category_group",
-    ).filter(deleted=False)
+    )
 
     if competition_id:
         queryset = queryset.filter(competition_id=competition_id)
@@ -483,19 +483,18 @@ def create_registration(user, **data: Any) -> dict[str, Any]:
     from competitions.models import Competition, CompetitionCategory
 
     try:
-        climber = Climber.objects.get(id=data["climber"], deleted=False)
+        climber = Climber.objects.get(id=data["climber"])
     except Climber.DoesNotExist:
         raise ValueError(f"Climber with id {data['climber']} not found")
 
     try:
-        competition = Competition.objects.get(id=data["competition"], deleted=False)
+        competition = Competition.objects.get(id=data["competition"])
     except Competition.DoesNotExist:
         raise ValueError(f"Competition with id {data['competition']} not found")
 
     try:
         category = CompetitionCategory.objects.get(
             id=data["competition_category"],
-            deleted=False,
         )
     except CompetitionCategory.DoesNotExist:
         raise ValueError(
@@ -505,28 +504,20 @@ def create_registration(user, **data: Any) -> dict[str, Any]:
     if category.competition.pk != competition.pk:
         raise ValueError("Category does not belong to this competition")
 
-    existing = CompetitionRegistration.objects.filter(
-        climber=climber,
-        competition=competition,
-        competition_category=category,
-    ).first()
-
-    if existing:
-        if not existing.deleted:
-            raise ValueError("Climber is already registered for this competition")
-
-        existing.deleted = False
-        existing.last_modified_by = user
-        existing.save()
-        registration = existing
-    else:
-        registration = CompetitionRegistration.objects.create(
+    registration = upsert_one_or_raise(
+        CompetitionRegistration(
             climber=climber,
             competition=competition,
             competition_category=category,
             created_by=user,
             last_modified_by=user,
-        )
+        ),
+        "unique_active_registration",
+        ["last_modified_by"],
+        conflict="Climber is already registered for this competition",
+    )
+
+    bump_competition_version(competition.pk)
 
     if climber.is_simple_athlete:
         climber_name = climber.simple_name
@@ -543,39 +534,42 @@ def create_registration(user, **data: Any) -> dict[str, Any]:
     }
 
 
-def delete_registration(registration_id: int, user) -> None:
-    from scoring.models import Climb, ClimberRoundScore, RoundResult
-
+def delete_registration(registration_id: int, user) -> dict[str, int]:
+    """Soft-delete the registration with the climber's start list entries,
+    scores and climbs in its category.
+    """
     try:
         registration = CompetitionRegistration.objects.select_related(
             "competition"
-        ).get(id=registration_id, deleted=False)
+        ).get(id=registration_id)
     except CompetitionRegistration.DoesNotExist:
         raise ValueError(f"Registration with id {registration_id} not found")
 
     require_competition_admin(user, registration.competition.pk)
 
     with transaction.atomic():
-        Climb.objects.filter(
-            route__round__competition_category__competition=registration.competition,
-            climber=registration.climber,
-            deleted=False,
-        ).update(deleted=True)
-
-        ClimberRoundScore.objects.filter(
-            round__competition_category__competition=registration.competition,
-            climber=registration.climber,
-            deleted=False,
-        ).update(deleted=True)
+        deleted = soft_delete(registration, user)
+        broadcast_bulk_change([registration.competition.pk], deleted.round_ids)
 
-        RoundResult.objects.filter(
-            round__competition_category__competition=registration.competition,
-            climber=registration.climber,
-            deleted=False,
-        ).update(deleted=True)
+    return deleted.counts
+
+
+def restore_registration(registration_id: int, user=None) -> dict[str, int]:
+    try:
+        registration = CompetitionRegistration.all_objects.select_related(
+            "climber", "competition_category"
+        ).get(id=registration_id, deleted=True)
+    except CompetitionRegistration.DoesNotExist:
+        raise ValueError(f"Deleted registration with id {registration_id} not found")
+
+    if registration.climber.deleted or registration.competition_category.deleted:
+        raise ValueError("Restore the registration's climber and category first")
+
+    with transaction.atomic():
+        restored = restore(registration, user)
+        broadcast_bulk_change([registration.competition_id], restored.round_ids)
 
-        registration.deleted = True
-        registration.save()
+    return restored.counts
 
 
 def create_climber_for_user(admin_user, user_account_id: int) -> dict[str, Any]:
@@ -586,7 +580,7 @@ def create_climber_for_user(admin_user, user_account_id: int) -> dict[str, Any]:
     except UserAccount.DoesNotExist:
         raise ValueError(f"User account with id {user_account_id} not found")
 
-    if Climber.objects.filter(user_account=user_account, deleted=False).exists():
+    if Climber.objects.filter(user_account=user_account).exists():
         raise ValueError("User already has a climber")
 
     climber = Climber.objects.create(
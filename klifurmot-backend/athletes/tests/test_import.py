@@ -0,0 +1,177 @@
+import io
+from unittest import skipUnless
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from athletes import imports
+from athletes.models import Climber, CompetitionRegistration
+from competitions.models import CategoryGroup, CompetitionCategory, CompetitionRound
+from scoring.models import RoundResult
+from scoring.tests.base import ScoringTestCase
+
+URL = "/api/athletes/registrations/import/"
+
+
+class RegistrationImportTest(ScoringTestCase):
+    def setUp(self):
+        super().setUp()
+        self.youth = CompetitionCategory.objects.create(
+            competition=self.competition,
+            category_group=CategoryGroup.objects.create(
+                name="U16", min_age=12, max_age=15
+            ),
+            gender="KK",
+        )
+        CompetitionRound.objects.create(
+            competition_category=self.youth, round_group=self.round_group, round_order=1
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def upload(self, text, **data):
+        return self.client.post(
+            URL,
+            {
+                "file": SimpleUploadedFile("keppendur.csv", text.encode()),
+                "competition": self.competition.pk,
+                **data,
+            },
+            format="multipart",
+        )
+
+    def test_imports_rows_and_reports_each_one(self):
+        anna = self.create_climber("Jón")
+        response = self.upload(
+            "name;age;gender;start_order\n"
+            "Jón;25;kk;\n"
+            "Ari;14;KK;1\n"
+            "Óli;13;KK;1\n"
+            "Björk;30;KVK;\n"
+            "Siggi;abc;KK;\n",
+            startlist=True,
+        )
+
+        self.assertEqual(response.status_code, 200, response.content)
+        data = response.json()["data"]
+        self.assertEqual((data["imported"], data["failed"]), (2, 3))
+        jon, ari, oli, bjork, siggi = data["report"]
+
+        self.assertEqual(jon["climber_id"], anna.pk)
+        self.assertFalse(jon["climber_created"])
+        self.assertEqual(jon["category"], "Opinn flokkur KK")
+        self.assertEqual(jon["start_order"], 1)
+
+        self.assertTrue(ari["climber_created"])
+        self.assertEqual(ari["category"], "U16 KK")
+        self.assertEqual(ari["registration"], "created")
+        self.assertEqual(ari["start_order"], 1)
+        self.assertEqual(oli["errors"], ["start order 1 is already taken"])
+
+        self.assertEqual(bjork["errors"], ["no KVK category for age 30"])
+        self.assertEqual(siggi["errors"], ["age must be a number from 1 to 99"])
+        self.assertEqual(
+            CompetitionRegistration.objects.get(climber=anna).competition_category,
+            self.category,
+        )
+        self.assertFalse(Climber.objects.filter(simple_name="Óli").exists())
+
+    def test_appends_to_the_start_list_and_revives_registrations(self):
+        self.create_climber("Anna")
+        first = self.upload("name,age,gender\nKári,20,KK\nGeir,22,KK\n", startlist=True)
+        CompetitionRegistration.objects.update(deleted=True)
+
+        second = self.upload(
+            "name,age,gender,start_order\nKári,20,KK,\nEinar,40,KK,7\n",
+            startlist=True,
+        )
+
+        self.assertEqual(
+            [row["start_order"] for row in first.json()["data"]["report"]], [2, 3]
+        )
+        report = second.json()["data"]["report"]
+        self.assertEqual(
+            [row["registration"] for row in report], ["revived", "created"]
+        )
+        self.assertEqual([row["start_order"] for row in report], [2, 7])
+        self.assertEqual(
+            list(
+                RoundResult.objects.filter(round=self.round)
+                .order_by("start_order")
+                .values_list("start_order", flat=True)
+            ),
+            [1, 2, 3, 7],
+        )
+
+    @skipUnless(imports.xlsx_available(), "XLSX import needs openpyxl")
+    def test_imports_a_workbook(self):
+        workbook = imports.openpyxl.Workbook()
+        sheet = workbook.worksheets[0]
+        sheet.append(["Name", "Age", "Gender", "Start_order"])
+        sheet.append(["Kári", 20, "KK", 4])
+        sheet.append([None, None, None, None])
+        sheet.append(["Ari", 14, "kk", None])
+        content = io.BytesIO()
+        workbook.save(content)
+
+        response = self.client.post(
+            URL,
+            {
+                "file": SimpleUploadedFile("keppendur.xlsx", content.getvalue()),
+                "competition": self.competition.pk,
+                "startlist": True,
+            },
+            format="multipart",
+        )
+
+        self.assertEqual(response.status_code, 200, response.content)
+        report = response.json()["data"]["report"]
+        self.assertEqual(
+            [(row["name"], row["category"], row["start_order"]) for row in report],
+            [("Kári", "Opinn flokkur KK", 4), ("Ari", "U16 KK", 1)],
+        )
+
+    def test_dry_run_writes_nothing(self):
+        response = self.upload("name,age,gender\nKári,20,KK\n", dry_run=True)
+
+        self.assertEqual(response.json()["data"]["imported"], 1)
+        self.assertFalse(Climber.objects.filter(simple_name="Kári").exists())
+
+    def test_query_count_does_not_grow_with_rows(self):
+        def run(count, prefix):
+            rows = [
+                {"name": f"{prefix} {index}", "age": 20, "gender": "KK"}
+                for index in range(count)
+            ]
+            with CaptureQueriesContext(connection) as queries:
+                imports.import_registrations(
+                    self.user, self.competition.pk, rows, startlist=True
+                )
+            return len(queries)
+
+        self.assertEqual(run(30, "Stór"), run(3, "Lítill"))
+
+    def test_rejects_unknown_files(self):
+        response = self.client.post(
+            URL,
+            {
+                "file": SimpleUploadedFile("keppendur.txt", b"name"),
+                "competition": self.competition.pk,
+            },
+            format="multipart",
+        )
+
+        self.assertEqual(response.status_code, 400)
+        response = self.client.post(
+            URL,
+            {
+                "file": SimpleUploadedFile("keppendur.xlsx", b"PK"),
+                "competition": self.competition.pk,
+            },
+            format="multipart",
+        )
+        self.assertEqual(response.status_code, 400)
+        if not imports.xlsx_available():
+            self.assertIn("openpyxl", response.json()["error"]["message"])
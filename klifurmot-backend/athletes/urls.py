@@ -14,6 +14,11 @@ urlpatterns = [
         "<int:climber_id>/link/", views.link_simple_athlete, name="link_simple_athlete"
     ),
     path("registrations/", views.registrations, name="registrations"),
+    path(
+        "registrations/import/",
+        views.import_registrations,
+        name="import_registrations",
+    ),
     path(
         "registrations/<int:registration_id>/",
         views.registration_detail,
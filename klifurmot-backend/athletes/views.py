@@ -4,6 +4,7 @@ from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.decorators import api_view, permission_classes
 
 from accounts import permissions
+from . import imports
 from . import services
 from . import serializers
 from core import utils
@@ -171,9 +172,10 @@ def athlete_detail(request, climber_id):
 
     if request.method == "DELETE":
         try:
-            services.delete_climber(climber_id=climber_id)
+            deleted = services.delete_climber(climber_id=climber_id)
 
             return utils.success_response(
+                data={"deleted": deleted},
                 message="Climber deleted successfully",
             )
 
@@ -290,15 +292,64 @@ def registrations(request):
     )
 
 
+@api_view(["POST"])
+@permission_classes([IsAuthenticated])
+def import_registrations(request):
+    serializer = serializers.ImportRegistrationsSerializer(data=request.data)
+
+    if not serializer.is_valid():
+        errors_dict = cast(Dict[str, Any], serializer.errors)
+        return utils.validation_error_response(serializer_errors=errors_dict)
+
+    validated_data = cast(Dict[str, Any], serializer.validated_data)
+    upload = validated_data["file"]
+
+    try:
+        result = imports.import_registrations(
+            user=request.user,
+            competition_id=validated_data["competition"],
+            rows=imports.read_rows(upload, upload.name),
+            startlist=validated_data["startlist"],
+            dry_run=validated_data["dry_run"],
+        )
+
+        return utils.success_response(
+            data=result,
+            message=f"Imported {result['imported']} of {result['rows']} rows",
+        )
+
+    except PermissionError as e:
+        return utils.error_response(
+            code="Access_denied",
+            message=str(e),
+            status_code=status.HTTP_403_FORBIDDEN,
+        )
+
+    except ValueError as e:
+        return utils.error_response(
+            code="Invalid_import",
+            message=str(e),
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+
+    except Exception as e:
+        return utils.error_response(
+            code="Import_failed",
+            message=str(e),
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+
+
 @api_view(["DELETE"])
 @permission_classes([IsAuthenticated])
 def registration_detail(request, registration_id):
     try:
-        services.delete_registration(
+        deleted = services.delete_registration(
             registration_id=registration_id,
             user=request.user,
         )
         return utils.success_response(
+            data={"deleted": deleted},
             message="Registration deleted successfully",
         )
 
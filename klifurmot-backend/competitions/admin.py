@@ -20,27 +20,27 @@ admin.site.register(Route)
 
 
 def advance_top_climbers(_modeladmin, request, queryset):
-    for round_obj in queryset:
-        try:
-            result = scoring_services.advance_climbers(
-                round_id=round_obj.id,
-                user=request.user,
+    rounds = {round_obj.pk: round_obj for round_obj in queryset}
+    try:
+        results = scoring_services.advance_rounds(rounds, request.user)
+    except Exception as e:
+        messages.error(request, f"Unexpected error advancing climbers: {str(e)}")
+        return
+
+    for result in results:
+        round_obj = rounds[result["round_id"]]
+        if result["error"]:
+            messages.error(
+                request,
+                f"Failed to advance climbers from round {round_obj}: "
+                f"{result['error']}",
             )
+        else:
             messages.success(
                 request,
                 f"{result['advanced']} climbers advanced from round {round_obj} "
                 f"to {result['next_round_name']}",
             )
-        except (PermissionError, ValueError) as e:
-            messages.error(
-                request,
-                f"Failed to advance climbers from round {round_obj}: {str(e)}",
-            )
-        except Exception as e:
-            messages.error(
-                request,
-                f"Unexpected error advancing climbers from round {round_obj}: {str(e)}",
-            )
 
 
 @admin.register(CompetitionRound)
@@ -34,12 +34,17 @@ class Competition(AuditedSoftDeleteModel):
         related_name="competitions_modified",
     )
 
+    soft_delete_cascade = [("competitions.CompetitionCategory", "competition")]
+
     @property
     def status(self):
-        now = timezone.now()
-        if now < self.start_date:
+        return self.status_for(self.start_date, self.end_date, timezone.now())
+
+    @staticmethod
+    def status_for(start_date, end_date, now):
+        if now < start_date:
             return "not_started"
-        elif now > self.end_date:
+        elif now > end_date:
             return "finished"
         else:
             return "ongoing"
@@ -86,6 +91,11 @@ class CompetitionCategory(AuditedSoftDeleteModel):
     category_group = models.ForeignKey(CategoryGroup, on_delete=models.CASCADE)
     gender = models.CharField(max_length=6, choices=CompetitionGender.choices)
 
+    soft_delete_cascade = [
+        ("competitions.CompetitionRound", "competition_category"),
+        ("athletes.CompetitionRegistration", "competition_category"),
+    ]
+
     def __str__(self):
         return f"{self.competition.title} - {self.category_group.name} ({self.gender})"
 
@@ -112,6 +122,12 @@ class CompetitionRound(AuditedSoftDeleteModel):
     is_self_scoring = models.BooleanField(default=False)
     is_default = models.BooleanField(default=False)
 
+    soft_delete_cascade = [
+        ("competitions.Route", "round"),
+        ("scoring.RoundResult", "round"),
+        ("scoring.ClimberRoundScore", "round"),
+    ]
+
     @property
     def status(self):
         """Calculate round status based on dates and completed flag"""
@@ -169,6 +185,8 @@ class Route(AuditedSoftDeleteModel):
     )
     image = models.ImageField(upload_to="routes/", blank=True, null=True)
 
+    soft_delete_cascade = [("scoring.Climb", "route")]
+
     class Meta:
         ordering = ["route_number"]
         constraints = [
@@ -9,16 +9,36 @@ from athletes.models import CompetitionRegistration
 from athletes.utils import (
     build_age_category_resolver,
     calculate_age,
+    calculate_age_for_category,
 )
 from django.contrib.auth.models import User
 from django.core.files.uploadedfile import UploadedFile
 from django.db import transaction
-from django.db.models import Count, Q
+from django.db.models import Count, Max, Prefetch, Q
+from core.cascade import restore, soft_delete
+from core.changes import changed_after, current_version
 from core.email import send_email_via_resend
 from core.images import compress_image
 from judges.models import JudgeLink
 from klifurmot import settings
-from scoring.models import Climb, ClimberRoundScore, RoundResult
+from scoring.models import START_POSITION, Climb, ClimberRoundScore, RoundResult
+from scoring.ordering import start_order_view
+from scoring.rows import (
+    CLIMB_RESULT_FIELDS,
+    CLIMBER_NAME_FIELDS,
+    CategoryRows,
+    ResultChange,
+    ResultRow,
+    RoundRows,
+    RouteResult,
+    ScoreRow,
+    StartlistEntry,
+    climber_name,
+    not_attempted,
+    serialize_result_changes,
+    serialize_results,
+    serialize_startlist,
+)
 
 from competitions.models import (
     CategoryGroup,
@@ -28,6 +48,10 @@ from competitions.models import (
     RoundGroup,
     Route,
 )
+from competitions.versions import (
+    bump_competition_list_version,
+    bump_competition_version,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +87,7 @@ def create_competition(
                 created_by=created_by,
                 last_modified_by=created_by,
             )
+            bump_competition_list_version(competition.pk)
             return competition
 
     except Exception as e:
@@ -77,7 +102,7 @@ def update_competition(
 ) -> Competition:
     try:
         with transaction.atomic():
-            competition = Competition.objects.get(id=competition_id, deleted=False)
+            competition = Competition.objects.get(id=competition_id)
 
             remove_image = update_data.pop("remove_image", False)
             image = update_data.pop("image", None)
@@ -95,6 +120,8 @@ def update_competition(
 
             competition.last_modified_by = user
             competition.save()
+            bump_competition_version(competition.pk)
+            bump_competition_list_version(competition.pk)
 
             return competition
 
@@ -102,63 +129,48 @@ def update_competition(
         raise ValueError(f"Competition with id {competition_id} not found")
 
 
-def delete_competition(competition_id: int) -> None:
+def delete_competition(competition_id: int) -> dict[str, int]:
+    """Soft-delete the competition with everything in it; returns the rows
+    deleted per model.
+    """
     try:
-        competition = Competition.objects.get(id=competition_id, deleted=False)
+        competition = Competition.objects.get(id=competition_id)
+    except Competition.DoesNotExist:
+        raise ValueError(f"Competition with id {competition_id} not found")
 
-        with transaction.atomic():
-            Climb.objects.filter(
-                route__round__competition_category__competition=competition,
-                deleted=False,
-            ).update(deleted=True)
-
-            ClimberRoundScore.objects.filter(
-                round__competition_category__competition=competition,
-                deleted=False,
-            ).update(deleted=True)
-
-            RoundResult.objects.filter(
-                round__competition_category__competition=competition,
-                deleted=False,
-            ).update(deleted=True)
-
-            Route.objects.filter(
-                round__competition_category__competition=competition,
-                deleted=False,
-            ).update(deleted=True)
+    with transaction.atomic():
+        deleted = soft_delete(competition)
+        bump_competition_version(competition.pk)
+        bump_competition_list_version(competition.pk)
 
-            CompetitionRound.objects.filter(
-                competition_category__competition=competition,
-                deleted=False,
-            ).update(deleted=True)
+    return deleted.counts
 
-            CompetitionCategory.objects.filter(
-                competition=competition,
-                deleted=False,
-            ).update(deleted=True)
 
-            CompetitionRegistration.objects.filter(
-                competition=competition,
-                deleted=False,
-            ).update(deleted=True)
+def restore_competition(competition_id: int, user=None) -> dict[str, int]:
+    """Undo `delete_competition`; returns the rows restored per model."""
+    try:
+        competition = Competition.all_objects.get(id=competition_id, deleted=True)
+    except Competition.DoesNotExist:
+        raise ValueError(f"Deleted competition with id {competition_id} not found")
 
-            competition.deleted = True
-            competition.save()
+    with transaction.atomic():
+        restored = restore(competition, user)
+        bump_competition_version(competition.pk)
+        bump_competition_list_version(competition.pk)
 
-    except Competition.DoesNotExist:
-        raise ValueError(f"Competition with id {competition_id} not found")
+    return restored.counts
 
 
 def get_competition(competition_id: int) -> Competition:
     try:
-        return Competition.objects.get(id=competition_id, deleted=False)
+        return Competition.objects.get(id=competition_id)
 
     except Competition.DoesNotExist:
         raise ValueError(f"Competition with id {competition_id} not found")
 
 
 def list_competitions(year: Optional[int] = None) -> list[Competition]:
-    queryset = Competition.objects.filter(deleted=False)
+    queryset = Competition.objects.all()
 
     if year:
         queryset = queryset.filter(start_date__year=year)
@@ -168,7 +180,7 @@ def list_competitions(year: Optional[int] = None) -> list[Competition]:
 
 
 def list_public_competitions(year: Optional[int] = None) -> list[Competition]:
-    queryset = Competition.objects.filter(visible=True, deleted=False)
+    queryset = Competition.objects.filter(visible=True)
 
     if year:
         queryset = queryset.filter(start_date__year=year)
@@ -188,7 +200,7 @@ def create_round(
     try:
         with transaction.atomic():
             category = CompetitionCategory.objects.select_related("competition").get(
-                id=competition_category, deleted=False
+                id=competition_category
             )
 
             if category.competition.pk != competition_id:
@@ -221,6 +233,8 @@ def create_round(
                 ]
                 Route.objects.bulk_create(routes)
 
+            bump_competition_version(competition_id)
+
             return competition_round
 
     except CompetitionCategory.DoesNotExist:
@@ -241,7 +255,7 @@ def update_round(
         with transaction.atomic():
             competition_round = CompetitionRound.objects.select_related(
                 "competition_category__competition"
-            ).get(id=round_id, deleted=False)
+            ).get(id=round_id)
 
             competition = competition_round.competition_category.competition
 
@@ -257,9 +271,7 @@ def update_round(
 
             new_route_count = update_data.pop("route_count", None)
             if new_route_count is not None:
-                current_route_count = (
-                    cast(Any, competition_round).route_set.filter(deleted=False).count()
-                )
+                current_route_count = cast(Any, competition_round).route_set.count()
 
                 if new_route_count > current_route_count:
                     routes = [
@@ -275,19 +287,14 @@ def update_round(
                     Route.objects.bulk_create(routes)
 
                 elif new_route_count < current_route_count:
-                    routes_to_delete = Route.objects.filter(
-                        round=competition_round,
-                        route_number__gt=new_route_count,
-                        deleted=False,
+                    soft_delete(
+                        Route.objects.filter(
+                            round=competition_round,
+                            route_number__gt=new_route_count,
+                        ),
+                        user,
                     )
 
-                    Climb.objects.filter(
-                        route__in=routes_to_delete,
-                        deleted=False,
-                    ).update(deleted=True)
-
-                    routes_to_delete.update(deleted=True)
-
                 competition_round.route_count = new_route_count
 
             for field, value in update_data.items():
@@ -296,6 +303,7 @@ def update_round(
 
             competition_round.last_modified_by = user
             competition_round.save()
+            bump_competition_version(competition.pk)
 
             return competition_round
 
@@ -306,11 +314,13 @@ def update_round(
         raise ValueError(f"Round group with id {round_group_id} not found")
 
 
-def delete_round(round_id: int, user) -> None:
+def delete_round(round_id: int, user) -> dict[str, int]:
+    from scoring.utils import broadcast_bulk_change
+
     try:
         competition_round = CompetitionRound.objects.select_related(
             "competition_category__competition"
-        ).get(id=round_id, deleted=False)
+        ).get(id=round_id)
     except CompetitionRound.DoesNotExist:
         raise ValueError(f"Round with id {round_id} not found")
 
@@ -326,28 +336,32 @@ def delete_round(round_id: int, user) -> None:
         raise PermissionError("Cannot delete round after competition has started")
 
     with transaction.atomic():
-        Climb.objects.filter(
-            route__round=competition_round,
-            deleted=False,
-        ).update(deleted=True)
-
-        ClimberRoundScore.objects.filter(
-            round=competition_round,
-            deleted=False,
-        ).update(deleted=True)
-
-        RoundResult.objects.filter(
-            round=competition_round,
-            deleted=False,
-        ).update(deleted=True)
-
-        Route.objects.filter(
-            round=competition_round,
-            deleted=False,
-        ).update(deleted=True)
-
-        competition_round.deleted = True
-        competition_round.save()
+        deleted = soft_delete(competition_round, user)
+        broadcast_bulk_change([competition.pk], deleted.round_ids)
+
+    return deleted.counts
+
+
+def restore_round(round_id: int, user=None) -> dict[str, int]:
+    from scoring.utils import broadcast_bulk_change
+
+    try:
+        competition_round = CompetitionRound.all_objects.select_related(
+            "competition_category"
+        ).get(id=round_id, deleted=True)
+    except CompetitionRound.DoesNotExist:
+        raise ValueError(f"Deleted round with id {round_id} not found")
+
+    if competition_round.competition_category.deleted:
+        raise ValueError("Restore the round's category first")
+
+    with transaction.atomic():
+        restored = restore(competition_round, user)
+        broadcast_bulk_change(
+            [competition_round.competition_category.competition_id], restored.round_ids
+        )
+
+    return restored.counts
 
 
 def update_round_status(
@@ -358,7 +372,7 @@ def update_round_status(
     try:
         competition_round = CompetitionRound.objects.select_related(
             "competition_category"
-        ).get(id=round_id, deleted=False)
+        ).get(id=round_id)
     except CompetitionRound.DoesNotExist:
         raise ValueError(f"Round with id {round_id} not found")
 
@@ -372,16 +386,12 @@ def update_round_status(
             CompetitionRound.objects.filter(
                 competition_category=competition_round.competition_category,
                 round_order__gt=competition_round.round_order,
-                deleted=False,
             )
             .order_by("round_order")
             .first()
         )
 
-        if (
-            next_round
-            and RoundResult.objects.filter(round=next_round, deleted=False).exists()
-        ):
+        if next_round and RoundResult.objects.filter(round=next_round).exists():
             raise ValueError(
                 "Cannot re-open this round: climbers have already been advanced to the next round. Remove them from the next round's start list first."
             )
@@ -397,7 +407,7 @@ def update_round_status(
 def list_rounds(competition_id: int) -> list[CompetitionRound]:
     return list(
         CompetitionRound.objects.filter(
-            competition_category__competition_id=competition_id, deleted=False
+            competition_category__competition_id=competition_id
         )
         .select_related("competition_category", "round_group")
         .order_by("competition_category", "round_order")
@@ -410,7 +420,7 @@ def list_round_groups() -> list[RoundGroup]:
 
 def list_categories(competition_id: int) -> list[CompetitionCategory]:
     return list(
-        CompetitionCategory.objects.filter(competition_id=competition_id, deleted=False)
+        CompetitionCategory.objects.filter(competition_id=competition_id)
         .select_related("category_group")
         .order_by("category_group__name", "gender")
     )
@@ -427,7 +437,7 @@ def create_category(
     user: User,
 ) -> CompetitionCategory:
     try:
-        competition = Competition.objects.get(id=competition_id, deleted=False)
+        competition = Competition.objects.get(id=competition_id)
     except Competition.DoesNotExist:
         raise ValueError(f"Competition with id {competition_id} not found")
 
@@ -444,19 +454,21 @@ def create_category(
             competition=competition,
             category_group=category_group,
             gender=gender,
-            deleted=False,
         ).exists()
 
         if existing:
             raise ValueError("This category already exists for this competition")
 
-        return CompetitionCategory.objects.create(
+        category = CompetitionCategory.objects.create(
             competition=competition,
             category_group=category_group,
             gender=gender,
             created_by=user,
             last_modified_by=user,
         )
+        bump_competition_version(competition.pk)
+
+        return category
 
 
 def update_category(
@@ -466,7 +478,7 @@ def update_category(
 ) -> CompetitionCategory:
     try:
         category = CompetitionCategory.objects.select_related("competition").get(
-            id=category_id, deleted=False
+            id=category_id
         )
     except CompetitionCategory.DoesNotExist:
         raise ValueError(f"Competition category with id {category_id} not found")
@@ -496,7 +508,6 @@ def update_category(
                 competition=category.competition,
                 category_group=category.category_group,
                 gender=category.gender,
-                deleted=False,
             )
             .exclude(id=category_id)
             .exists()
@@ -507,14 +518,17 @@ def update_category(
 
         category.last_modified_by = user
         category.save()
+        bump_competition_version(category.competition.pk)
 
     return category
 
 
-def delete_category(category_id: int, user) -> None:
+def delete_category(category_id: int, user) -> dict[str, int]:
+    from scoring.utils import broadcast_bulk_change
+
     try:
         category = CompetitionCategory.objects.select_related("competition").get(
-            id=category_id, deleted=False
+            id=category_id
         )
     except CompetitionCategory.DoesNotExist:
         raise ValueError(f"Competition category with id {category_id} not found")
@@ -529,50 +543,43 @@ def delete_category(category_id: int, user) -> None:
         raise PermissionError("Cannot delete category after competition has started")
 
     with transaction.atomic():
-        Climb.objects.filter(
-            route__round__competition_category=category,
-            deleted=False,
-        ).update(deleted=True)
-
-        ClimberRoundScore.objects.filter(
-            round__competition_category=category,
-            deleted=False,
-        ).update(deleted=True)
-
-        RoundResult.objects.filter(
-            round__competition_category=category,
-            deleted=False,
-        ).update(deleted=True)
-
-        Route.objects.filter(
-            round__competition_category=category,
-            deleted=False,
-        ).update(deleted=True)
+        deleted = soft_delete(category, user)
+        broadcast_bulk_change([category.competition.pk], deleted.round_ids)
 
-        CompetitionRound.objects.filter(
-            competition_category=category,
-            deleted=False,
-        ).update(deleted=True)
+    return deleted.counts
 
-        CompetitionRegistration.objects.filter(
-            competition_category=category,
-            deleted=False,
-        ).update(deleted=True)
 
-        category.deleted = True
-        category.save()
+def restore_category(category_id: int, user=None) -> dict[str, int]:
+    from scoring.utils import broadcast_bulk_change
+
+    try:
+        category = CompetitionCategory.all_objects.select_related("competition").get(
+            id=category_id, deleted=True
+        )
+    except CompetitionCategory.DoesNotExist:
+        raise ValueError(
+            f"Deleted competition category with id {category_id} not found"
+        )
+
+    if category.competition.deleted:
+        raise ValueError("Restore the category's competition first")
+
+    with transaction.atomic():
+        restored = restore(category, user)
+        broadcast_bulk_change([category.competition.pk], restored.round_ids)
+
+    return restored.counts
 
 
 def get_competition_athletes(competition_id: int) -> Dict[str, Any]:
     try:
-        competition = Competition.objects.get(id=competition_id, deleted=False)
+        competition = Competition.objects.get(id=competition_id)
     except Competition.DoesNotExist:
         raise ValueError(f"Competition with id {competition_id} not found")
 
     registrations = (
         CompetitionRegistration.objects.filter(
             competition_id=competition_id,
-            deleted=False,
             climber__deleted=False,
         )
         .select_related(
@@ -627,32 +634,45 @@ def get_competition_athletes(competition_id: int) -> Dict[str, Any]:
 
 
 def get_competition_routes(competition_id: int) -> list[Dict[str, Any]]:
-    if not Competition.objects.filter(id=competition_id, deleted=False).exists():
+    discipline = (
+        Competition.objects.filter(id=competition_id)
+        .values_list("discipline", flat=True)
+        .first()
+    )
+    if discipline is None:
         raise ValueError(f"Competition with id {competition_id} not found")
+    is_lead = discipline == "lead"
 
     categories = (
         CompetitionCategory.objects.filter(
             competition_id=competition_id,
-            deleted=False,
         )
         .select_related("category_group")
         .prefetch_related(
-            "competitionround_set__round_group",
-            "competitionround_set__route_set",
+            Prefetch(
+                "competitionround_set",
+                queryset=CompetitionRound.objects.select_related(
+                    "round_group"
+                ).order_by("round_order"),
+            ),
+            Prefetch(
+                "competitionround_set__route_set",
+                queryset=Route.objects.order_by("route_number"),
+            ),
         )
     )
 
     route_ids = Route.objects.filter(
         round__competition_category__competition_id=competition_id,
-        deleted=False,
     ).values_list("id", flat=True)
 
     climb_stats = (
-        Climb.objects.filter(route_id__in=route_ids, deleted=False)
+        Climb.objects.filter(route_id__in=route_ids)
         .values("route_id")
         .annotate(
             tops=Count("id", filter=Q(top_reached=True)),
             zones=Count("id", filter=Q(zone_reached=True)),
+            best_hold=Max("hold_reached"),
         )
     )
 
@@ -664,28 +684,23 @@ def get_competition_routes(competition_id: int) -> list[Dict[str, Any]]:
         category_label = f"{category.category_group.name} {category.gender}"
         rounds_data = []
 
-        category_rounds = (
-            cast(Any, category)
-            .competitionround_set.filter(deleted=False)
-            .order_by("round_order")
-        )
-
-        for competition_round in category_rounds:
+        for competition_round in cast(Any, category).competitionround_set.all():
             routes_data = []
 
-            for route in competition_round.route_set.filter(deleted=False).order_by(
-                "route_number"
-            ):
-                stats = stats_map.get(route.id, {"tops": 0, "zones": 0})
-
-                routes_data.append(
-                    {
-                        "number": route.route_number,
-                        "tops": stats["tops"],
-                        "zones": stats["zones"],
-                    }
+            for route in competition_round.route_set.all():
+                stats = stats_map.get(
+                    route.id, {"tops": 0, "zones": 0, "best_hold": None}
                 )
 
+                route_stats = {
+                    "number": route.route_number,
+                    "tops": stats["tops"],
+                    "zones": stats["zones"],
+                }
+                if is_lead:
+                    route_stats["best_hold"] = stats["best_hold"]
+                routes_data.append(route_stats)
+
             rounds_data.append(
                 {
                     "round_name": competition_round.round_group.name,
@@ -704,7 +719,7 @@ def get_competition_routes(competition_id: int) -> list[Dict[str, Any]]:
 
 
 def get_competition_startlist(competition_id: int) -> list[Dict[str, Any]]:
-    if not Competition.objects.filter(id=competition_id, deleted=False).exists():
+    if not Competition.objects.filter(id=competition_id).exists():
         raise ValueError(f"Competition with id {competition_id} not found")
 
     category_for_age = build_age_category_resolver()
@@ -712,190 +727,287 @@ def get_competition_startlist(competition_id: int) -> list[Dict[str, Any]]:
     categories = (
         CompetitionCategory.objects.filter(
             competition_id=competition_id,
-            deleted=False,
         )
         .select_related("category_group")
-        .prefetch_related("competitionround_set__round_group")
+        .prefetch_related(
+            Prefetch(
+                "competitionround_set",
+                queryset=CompetitionRound.objects.select_related(
+                    "round_group"
+                ).order_by("round_order"),
+            )
+        )
     )
 
     result = []
     for category in categories:
         category_label = f"{category.category_group.name} {category.gender}"
-        rounds_data = []
-        for competition_round in (
-            cast(Any, category)
-            .competitionround_set.filter(deleted=False)
-            .order_by("round_order")
-        ):
-            round_results = (
+        rounds = []
+        for competition_round in cast(Any, category).competitionround_set.all():
+            entries = list(
                 RoundResult.objects.filter(
                     round=competition_round,
-                    deleted=False,
                 )
-                .select_related("climber__user_account")
-                .order_by("start_order")
-            )
-            athletes_data = []
-            for round_result in round_results:
-                climber = round_result.climber
-                if climber.is_simple_athlete:
-                    full_name = climber.simple_name
-                else:
-                    full_name = (
-                        climber.user_account.full_name if climber.user_account else None
-                    )
-                athletes_data.append(
-                    {
-                        "start_order": round_result.start_order,
-                        "full_name": full_name,
-                        "category_name": category_for_age(climber.get_age()),
-                    }
+                .order_by(START_POSITION, "id")
+                .values_list(
+                    "start_order",
+                    *CLIMBER_NAME_FIELDS,
+                    "climber__simple_age",
+                    "climber__user_account__date_of_birth",
                 )
-            rounds_data.append(
-                {
-                    "round_name": competition_round.round_group.name,
-                    "athletes": athletes_data,
-                }
             )
-        result.append(
-            {
-                "category": category_label,
-                "rounds": rounds_data,
-            }
-        )
-    return result
+            start_orders = start_order_view([entry[0] for entry in entries])
+            athletes = [
+                StartlistEntry(
+                    start_order,
+                    climber_name(is_simple_athlete, simple_name, full_name),
+                    category_for_age(
+                        simple_age
+                        if is_simple_athlete
+                        else calculate_age_for_category(date_of_birth)
+                    ),
+                )
+                for start_order, (
+                    _,
+                    is_simple_athlete,
+                    simple_name,
+                    full_name,
+                    simple_age,
+                    date_of_birth,
+                ) in zip(start_orders, entries)
+            ]
+            rounds.append(RoundRows(competition_round.round_group.name, athletes))
+        result.append(CategoryRows(category_label, rounds))
+    return serialize_startlist(result)
 
 
 def get_competition_results(competition_id: int) -> list[Dict[str, Any]]:
+    """Ranked results per category and round.
+
+    Rows are collected into the slotted types in `scoring.rows` and turned
+    into dicts by `serialize_results` once the whole competition is built.
+    """
     from scoring.services import _rank_climbers_in_round
 
-    if not Competition.objects.filter(id=competition_id, deleted=False).exists():
+    discipline = (
+        Competition.objects.filter(id=competition_id)
+        .values_list("discipline", flat=True)
+        .first()
+    )
+    if discipline is None:
         raise ValueError(f"Competition with id {competition_id} not found")
 
     categories = (
         CompetitionCategory.objects.filter(
             competition_id=competition_id,
-            deleted=False,
         )
         .select_related("category_group")
-        .prefetch_related("competitionround_set__round_group")
+        .prefetch_related(
+            Prefetch(
+                "competitionround_set",
+                queryset=CompetitionRound.objects.select_related(
+                    "round_group"
+                ).order_by("round_order"),
+            )
+        )
     )
 
     result = []
 
     for category in categories:
         category_label = f"{category.category_group.name} {category.gender}"
-        rounds_data = []
+        rounds = []
 
-        for round_obj in (
-            cast(Any, category)
-            .competitionround_set.filter(deleted=False)
-            .order_by("round_order")
-        ):
-            routes = list(
-                Route.objects.filter(round=round_obj, deleted=False).order_by(
-                    "route_number"
-                )
+        for round_obj in cast(Any, category).competitionround_set.all():
+            route_numbers = list(
+                Route.objects.filter(round=round_obj)
+                .order_by("route_number")
+                .values_list("id", "route_number")
             )
 
             ranked = _rank_climbers_in_round(round_obj)
 
             if not ranked:
-                rounds_data.append(
-                    {
-                        "round_name": round_obj.round_group.name,
-                        "results": [],
-                    }
-                )
+                rounds.append(RoundRows(round_obj.round_group.name, []))
                 continue
 
             climber_ids = [cid for cid, _, _ in ranked]
+            numbers = dict(route_numbers)
+
+            climbs = Climb.objects.filter(
+                route__round=round_obj,
+                climber_id__in=climber_ids,
+            ).values_list("climber_id", "route_id", *CLIMB_RESULT_FIELDS)
+
+            # Equal climbs on a route share one RouteResult.
+            interned: Dict[tuple, RouteResult] = {}
+            climbs_by_climber: Dict[int, Dict[int, RouteResult]] = {}
+            for row in climbs:
+                route_id = row[1]
+                if route_id not in numbers:
+                    continue
+                entry = interned.get(row[1:])
+                if entry is None:
+                    entry = interned[row[1:]] = RouteResult.from_climb(
+                        numbers[route_id], *row[2:]
+                    )
+                climbs_by_climber.setdefault(row[0], {})[route_id] = entry
 
-            climbs = (
-                Climb.objects.filter(
-                    route__round=round_obj,
-                    climber_id__in=climber_ids,
-                    deleted=False,
+            skipped = [
+                (route_id, not_attempted(number)) for route_id, number in route_numbers
+            ]
+            rows = []
+            for climber_id, score, rank in ranked:
+                climber_climbs = climbs_by_climber.get(climber_id, {})
+                rows.append(
+                    ResultRow(
+                        rank,
+                        score,
+                        [
+                            climber_climbs.get(route_id, entry)
+                            for route_id, entry in skipped
+                        ],
+                    )
                 )
-                .select_related("route")
-                .order_by("route__route_number")
-            )
 
-            climbs_by_climber: Dict[int, Dict[int, Climb]] = {}
-            for climb in climbs:
-                climbs_by_climber.setdefault(climb.climber.pk, {})[climb.route.pk] = (
-                    climb
-                )
+            rounds.append(RoundRows(round_obj.round_group.name, rows))
 
-            formatted_results = []
-            for climber_id, score, rank in ranked:
-                climber = score.climber
-
-                if climber.is_simple_athlete:
-                    full_name = climber.simple_name or "Name unknown"
-                else:
-                    full_name = (
-                        climber.user_account.full_name
-                        if climber.user_account
-                        else "Name unknown"
-                    )
+        result.append(CategoryRows(category_label, rounds))
 
-                climber_climbs = climbs_by_climber.get(climber_id, {})
-                route_scores = []
-
-                for route in routes:
-                    climb = climber_climbs.get(route.pk)
-                    if climb:
-                        route_scores.append(
-                            {
-                                "route_number": route.route_number,
-                                "attempted": True,
-                                "top_reached": climb.top_reached or False,
-                                "zone_reached": climb.zone_reached or False,
-                                "attempts_top": climb.attempts_top or 0,
-                                "attempts_zone": climb.attempts_zone or 0,
-                            }
-                        )
-                    else:
-                        route_scores.append(
-                            {
-                                "route_number": route.route_number,
-                                "attempted": False,
-                                "top_reached": False,
-                                "zone_reached": False,
-                                "attempts_top": 0,
-                                "attempts_zone": 0,
-                            }
-                        )
+    return serialize_results(result, is_lead=discipline == "lead")
 
-                formatted_results.append(
-                    {
-                        "rank": rank,
-                        "full_name": full_name,
-                        "tops": score.tops,
-                        "attempts_top": score.attempts_tops,
-                        "zones": score.zones,
-                        "attempts_zone": score.attempts_zones,
-                        "total_score": float(round(score.total_score, 1)),
-                        "routes": route_scores,
-                    }
-                )
 
-            rounds_data.append(
-                {
-                    "round_name": round_obj.round_group.name,
-                    "results": formatted_results,
-                }
+def get_competition_results_since(competition_id: int, since: int) -> Dict[str, Any]:
+    """Result rows changed after the `since` version.
+
+    A row is one climber's entry in one round's results, identified by
+    `round_id` and `climber_id`. It changes with the climber's climbs, round
+    score, rank or start list entry. Rows that left the results are listed
+    in `deleted`, except for a client starting from version 0. Ranks are the
+    ones the rerank coordinator persists; its rank updates are changes too,
+    so climbers moved by someone else's climb are included.
+    """
+    discipline = (
+        Competition.objects.filter(id=competition_id)
+        .values_list("discipline", flat=True)
+        .first()
+    )
+    if discipline is None:
+        raise ValueError(f"Competition with id {competition_id} not found")
+
+    version = current_version()
+    cutoff = changed_after(since)
+    in_competition = {"round__competition_category__competition_id": competition_id}
+
+    pairs = set(
+        RoundResult.all_objects.filter(
+            **in_competition, last_modified_at__gt=cutoff
+        ).values_list("round_id", "climber_id")
+    )
+    pairs.update(
+        ClimberRoundScore.all_objects.filter(
+            **in_competition, last_modified_at__gt=cutoff
+        ).values_list("round_id", "climber_id")
+    )
+    pairs.update(
+        Climb.all_objects.filter(
+            route__round__competition_category__competition_id=competition_id,
+            last_modified_at__gt=cutoff,
+        ).values_list("route__round_id", "climber_id")
+    )
+    if not pairs:
+        return {"version": version, "changes": [], "deleted": []}
+
+    climber_ids = {climber_id for _, climber_id in pairs}
+    rounds = {
+        round_obj.pk: round_obj
+        for round_obj in CompetitionRound.objects.filter(
+            id__in={round_id for round_id, _ in pairs},
+            competition_category__deleted=False,
+        ).select_related("competition_category__category_group", "round_group")
+    }
+
+    ranks = {
+        (round_id, climber_id): rank
+        for round_id, climber_id, rank in RoundResult.objects.filter(
+            round_id__in=rounds,
+            climber_id__in=climber_ids,
+        ).values_list("round_id", "climber_id", "rank")
+    }
+    scores = {
+        (round_id, score.climber_id): score
+        for round_id, score in (
+            (row[0], ScoreRow.from_row(row[1:]))
+            for row in ClimberRoundScore.objects.filter(
+                round_id__in=rounds,
+                climber_id__in=climber_ids,
+            ).values_list("round_id", *ScoreRow.columns)
+        )
+    }
+
+    route_numbers: Dict[int, list] = {}
+    for round_id, route_id, number in (
+        Route.objects.filter(round_id__in=rounds)
+        .order_by("route_number")
+        .values_list("round_id", "id", "route_number")
+    ):
+        route_numbers.setdefault(round_id, []).append((route_id, number))
+
+    climbs: Dict[tuple, Dict[int, RouteResult]] = {}
+    numbers = {
+        route_id: number
+        for routes in route_numbers.values()
+        for route_id, number in routes
+    }
+    for round_id, climber_id, route_id, *fields in Climb.objects.filter(
+        route__round_id__in=rounds,
+        climber_id__in=climber_ids,
+    ).values_list("route__round_id", "climber_id", "route_id", *CLIMB_RESULT_FIELDS):
+        if route_id in numbers:
+            climbs.setdefault((round_id, climber_id), {})[route_id] = (
+                RouteResult.from_climb(numbers[route_id], *fields)
             )
 
-        result.append(
-            {
-                "category": category_label,
-                "rounds": rounds_data,
-            }
+    changes = []
+    deleted = []
+    for pair in sorted(pairs):
+        round_obj = rounds.get(pair[0])
+        score = scores.get(pair)
+        if round_obj is None or score is None or pair not in ranks:
+            if since:
+                deleted.append({"round_id": pair[0], "climber_id": pair[1]})
+            continue
+
+        rank = ranks[pair]
+        if rank is None:
+            # Not ranked yet; the coordinator's rank update is a change of
+            # its own and brings the row in.
+            continue
+
+        climber_climbs = climbs.get(pair, {})
+        category = round_obj.competition_category
+        changes.append(
+            ResultChange(
+                round_obj.pk,
+                f"{category.category_group.name} {category.gender}",
+                round_obj.round_group.name,
+                ResultRow(
+                    rank,
+                    score,
+                    [
+                        climber_climbs.get(route_id) or not_attempted(number)
+                        for route_id, number in route_numbers.get(round_obj.pk, [])
+                    ],
+                ),
+            )
         )
 
-    return result
+    changes.sort(key=lambda change: (change.round_id, change.row.rank))
+    return {
+        "version": version,
+        "changes": serialize_result_changes(changes, is_lead=discipline == "lead"),
+        "deleted": deleted,
+    }
 
 
 def get_round(round_id: int) -> CompetitionRound:
@@ -904,7 +1016,7 @@ def get_round(round_id: int) -> CompetitionRound:
             "competition_category__competition",
             "competition_category__category_group",
             "round_group",
-        ).get(id=round_id, deleted=False)
+        ).get(id=round_id)
 
     except CompetitionRound.DoesNotExist:
         raise ValueError(f"Round with id {round_id} not found")
@@ -914,7 +1026,7 @@ def get_route(route_id: int) -> dict[str, Any]:
     try:
         route = Route.objects.select_related(
             "round__competition_category__competition"
-        ).get(id=route_id, deleted=False)
+        ).get(id=route_id)
     except Route.DoesNotExist:
         raise ValueError(f"Route with id {route_id} not found")
 
@@ -936,7 +1048,7 @@ def update_route(
     try:
         route = Route.objects.select_related(
             "round__competition_category__competition"
-        ).get(id=route_id, deleted=False)
+        ).get(id=route_id)
     except Route.DoesNotExist:
         raise ValueError(f"Route with id {route_id} not found")
 
@@ -1003,7 +1115,6 @@ def send_judge_bulk_emails(competition_id: int) -> int:
     judge_roles = CompetitionRole.objects.filter(
         competition=competition,
         role="judge",
-        deleted=False,
     ).select_related("user__user")
 
     for role in judge_roles:
@@ -1036,7 +1147,6 @@ def send_judge_bulk_emails(competition_id: int) -> int:
         competition=competition,
         type="invitation",
         claimed_at__isnull=True,
-        deleted=False,
     )
 
     for invitation in pending_invitations:
@@ -0,0 +1,206 @@
+"""Per-competition version counters.
+
+Each competition has a counter in the cache that moves forward whenever
+something its public endpoints return changes: scores, ranks, start lists,
+rounds, categories, registrations and climber names. Writers call
+`bump_competition_version` and the bump lands once their transaction
+commits. Cached public payloads are keyed by the version they were built
+from, so a bump retires them without tracking which keys exist. The public
+competition list has one counter of its own, bumped by
+`bump_competition_list_version` when a competition row changes.
+
+The same versions make the ETags of the public endpoints. Next to
+each counter the cache keeps the competition dates, so a conditional
+request learns the version and the competition's status from one cache
+read and can be answered with 304 without running any service.
+
+Writes that bypass the services, such as admin edits, do not bump the
+counters; cached payloads also expire after `PUBLIC_RESPONSE_CACHE_TIMEOUT`.
+"""
+
+import bisect
+import functools
+import time
+from datetime import datetime
+from typing import Any, Iterable, Optional, cast
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from core.response_cache import cached_json_response
+
+from .models import Competition
+
+VERSION_KEY = "competition:{}:version"
+SCHEDULE_KEY = "competition:{}:schedule"
+RESPONSE_KEY = "competition:{}:public:{}:{}"
+
+LIST_VERSION_KEY = "competitions:version"
+LIST_SCHEDULE_KEY = "competitions:schedule"
+LIST_RESPONSE_KEY = "competitions:public:{}:{}.{}"
+
+
+def _seed() -> int:
+    # Counters evicted from the cache restart from the clock in
+    # microseconds, which is ahead of any version handed out before.
+    return time.time_ns() // 1000
+
+
+def _version(key: str, version: Optional[int] = None) -> int:
+    if version is None:
+        cache.add(key, _seed(), None)
+        version = cast(Optional[int], cache.get(key))
+    return version if version is not None else _seed()
+
+
+def competition_version(competition_id: int) -> int:
+    key = VERSION_KEY.format(competition_id)
+    return _version(key, cast(Optional[int], cache.get(key)))
+
+
+def competition_state(competition_id: int) -> Optional[tuple[int, str]]:
+    """The competition's version and status, or None if it does not exist."""
+    version_key = VERSION_KEY.format(competition_id)
+    schedule_key = SCHEDULE_KEY.format(competition_id)
+    cached: dict[str, Any] = cache.get_many([version_key, schedule_key])
+
+    dates: Optional[tuple[datetime, datetime]] = cached.get(schedule_key)
+    if dates is None:
+        dates = (
+            Competition.objects.filter(id=competition_id)
+            .values_list("start_date", "end_date")
+            .first()
+        )
+        if dates is None:
+            return None
+        cache.set(schedule_key, dates, None)
+
+    version = _version(version_key, cached.get(version_key))
+    start_date, end_date = dates
+    return version, Competition.status_for(start_date, end_date, timezone.now())
+
+
+def competition_list_state() -> tuple[int, int, Optional[float]]:
+    """The competition list's version, how many competition starts and ends
+    have passed, and the seconds until the next one.
+
+    Listed competitions report their status, so the list changes at each
+    start and end even without a write.
+    """
+    cached: dict[str, Any] = cache.get_many([LIST_VERSION_KEY, LIST_SCHEDULE_KEY])
+
+    # Every start and end of a listed competition as a sorted timestamp.
+    moments: Optional[list[float]] = cached.get(LIST_SCHEDULE_KEY)
+    if moments is None:
+        dates = Competition.objects.filter(visible=True).values_list(
+            "start_date", "end_date"
+        )
+        moments = sorted(
+            moment.timestamp() for start_end in dates for moment in start_end
+        )
+        cache.set(LIST_SCHEDULE_KEY, moments, None)
+
+    version = _version(LIST_VERSION_KEY, cached.get(LIST_VERSION_KEY))
+    now = timezone.now().timestamp()
+    passed = bisect.bisect_right(moments, now)
+    until_next = moments[passed] - now if passed < len(moments) else None
+    return version, passed, until_next
+
+
+def bump_competition_version(competition_id: int) -> None:
+    """Move the competition's version forward once the transaction commits."""
+    transaction.on_commit(
+        lambda: _bump(VERSION_KEY.format(competition_id)), robust=True
+    )
+
+
+def bump_competition_versions(competition_ids: Iterable[int]) -> None:
+    for competition_id in set(competition_ids):
+        bump_competition_version(competition_id)
+
+
+def bump_competition_list_version(competition_id: int) -> None:
+    """Retire the public competition list and the competition's cached
+    dates once the transaction commits; call after writing the row itself.
+    """
+
+    def bump():
+        cache.delete_many([SCHEDULE_KEY.format(competition_id), LIST_SCHEDULE_KEY])
+        _bump(LIST_VERSION_KEY)
+
+    transaction.on_commit(bump, robust=True)
+
+
+def _bump(key: str) -> None:
+    try:
+        cache.incr(key)
+    except ValueError:
+        if not cache.add(key, _seed(), None):
+            cache.incr(key)
+
+
+def max_age_for(status: str) -> int:
+    """Seconds clients may reuse a public payload of a competition with
+    this status before revalidating it.
+    """
+    return settings.PUBLIC_CACHE_MAX_AGE[status]
+
+
+def cache_public_response(endpoint: str):
+    """Serve a public `(request, competition_id)` view from the body cache,
+    keyed by the competition's current version, with conditional GETs.
+
+    Requests with query parameters, such as `?since=` delta reads, bypass
+    the cache.
+    """
+
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(request, competition_id):
+            if request.query_params:
+                return view(request, competition_id)
+
+            state = competition_state(competition_id)
+            if state is None:
+                return view(request, competition_id)
+
+            version, status = state
+            return cached_json_response(
+                request,
+                RESPONSE_KEY.format(competition_id, endpoint, version),
+                lambda: view(request, competition_id),
+                tag=f"{endpoint}.{competition_id}.{version}",
+                max_age=max_age_for(status),
+            )
+
+        return wrapper
+
+    return decorator
+
+
+def cache_competition_list(view):
+    """Serve the public competition list from the body cache, keyed by the
+    list version, the `year` filter and the starts and ends passed so far.
+    """
+
+    @functools.wraps(view)
+    def wrapper(request):
+        year = request.query_params.get("year")
+        year = year if year and year.isdigit() else "all"
+        version, passed, until_next = competition_list_state()
+
+        max_age = max_age_for("not_started")
+        if until_next is not None:
+            max_age = min(max_age, int(until_next) + 1)
+
+        return cached_json_response(
+            request,
+            LIST_RESPONSE_KEY.format(year, version, passed),
+            lambda: view(request),
+            tag=f"competitions.{year}.{version}.{passed}",
+            max_age=max_age,
+        )
+
+    return wrapper
@@ -13,13 +13,16 @@ from accounts import permissions
 from . import services
 from . import serializers
 from . import models
+from .versions import cache_competition_list, cache_public_response
 from core import utils
+from core.changes import parse_version
 
 logger = logging.getLogger(__name__)
 
 
 @api_view(["GET"])
 @permission_classes([AllowAny])
+@cache_competition_list
 def public_competitions(request):
     if request.method == "GET":
         year_param = request.query_params.get("year")
@@ -158,9 +161,10 @@ def competition_detail(request, competition_id):
             )
 
         try:
-            services.delete_competition(competition_id=competition_id)
+            deleted = services.delete_competition(competition_id=competition_id)
 
             return utils.success_response(
+                data={"deleted": deleted},
                 message="Competition deleted successfully",
             )
 
@@ -187,6 +191,7 @@ def competition_detail(request, competition_id):
 
 @api_view(["GET"])
 @permission_classes([AllowAny])
+@cache_public_response("athletes")
 def competition_athletes(_request, competition_id):
     try:
         result = services.get_competition_athletes(competition_id=competition_id)
@@ -206,6 +211,7 @@ def competition_athletes(_request, competition_id):
 
 @api_view(["GET"])
 @permission_classes([AllowAny])
+@cache_public_response("routes")
 def competition_routes(_request, competition_id):
     try:
         result = services.get_competition_routes(competition_id=competition_id)
@@ -225,6 +231,7 @@ def competition_routes(_request, competition_id):
 
 @api_view(["GET"])
 @permission_classes([AllowAny])
+@cache_public_response("startlist")
 def competition_startlist(_request, competition_id):
     try:
         result = services.get_competition_startlist(competition_id=competition_id)
@@ -244,9 +251,24 @@ def competition_startlist(_request, competition_id):
 
 @api_view(["GET"])
 @permission_classes([AllowAny])
-def competition_results(_request, competition_id):
+@cache_public_response("results")
+def competition_results(request, competition_id):
     try:
-        result = services.get_competition_results(competition_id=competition_id)
+        since = parse_version(request.query_params.get("since"))
+    except ValueError as e:
+        return utils.error_response(
+            code="Invalid_parameter",
+            message=str(e),
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+
+    try:
+        if since is not None:
+            result = services.get_competition_results_since(
+                competition_id=competition_id, since=since
+            )
+        else:
+            result = services.get_competition_results(competition_id=competition_id)
 
         return utils.success_response(
             data=result,
@@ -413,8 +435,10 @@ def round_detail(request, round_id):
 
     if request.method == "DELETE":
         try:
-            services.delete_round(round_id=round_id, user=request.user)
-            return utils.success_response(message="Round deleted successfully")
+            deleted = services.delete_round(round_id=round_id, user=request.user)
+            return utils.success_response(
+                data={"deleted": deleted}, message="Round deleted successfully"
+            )
         except PermissionError as e:
             return utils.error_response(
                 code="Access_denied",
@@ -601,8 +625,12 @@ def category_detail(request, category_id):
 
     if request.method == "DELETE":
         try:
-            services.delete_category(category_id=category_id, user=request.user)
-            return utils.success_response(message="Category deleted successfully")
+            deleted = services.delete_category(
+                category_id=category_id, user=request.user
+            )
+            return utils.success_response(
+                data={"deleted": deleted}, message="Category deleted successfully"
+            )
         except PermissionError as e:
             return utils.error_response(
                 code="Not_allowed",
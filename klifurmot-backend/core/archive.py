@@ -0,0 +1,238 @@
+"""Move long soft-deleted rows out of the hot tables, and back on demand.
+
+`archive_deleted` copies soft-deleted rows whose `last_modified_at` is
+older than the retention window into `ArchivedRow` and deletes them from
+their table, a batch at a time. Each batch is its own transaction, so an
+interrupted run keeps what it finished and the next run picks up the rest.
+Children are archived before their parents, and a parent still referenced
+by a row left in the hot tables stays put, so no foreign key dangles.
+
+`restore_archived` puts rows back exactly as they were, soft-deleted and
+carrying the stamp of the delete that took them, so `core.cascade.restore`
+can then bring a whole subtree back to life. Both directions only touch
+soft-deleted rows, so the row triggers are held back and nothing is
+announced.
+"""
+
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Iterable, Optional
+
+from django.apps import apps
+from django.db import models, transaction
+from django.db.models import Exists, F, OuterRef
+
+from .cascade import triggers_held_back
+from .models import ArchivedRow
+
+# Archived models, children before parents, with the lookup of the
+# competition each row belongs to.
+ARCHIVED_MODELS = [
+    ("scoring.Climb", "route__round__competition_category__competition"),
+    ("scoring.ClimberRoundScore", "round__competition_category__competition"),
+    ("scoring.RoundResult", "round__competition_category__competition"),
+    ("athletes.CompetitionRegistration", "competition"),
+    ("competitions.Route", "round__competition_category__competition"),
+]
+
+
+@dataclass
+class ArchiveProgress:
+    rows: int = 0
+    batches: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+def archivable(model: type[models.Model], cutoff: datetime) -> models.QuerySet:
+    """Soft-deleted rows of `model` last touched before `cutoff` that no
+    row left in the hot tables points to."""
+    manager: Any = model.all_objects  # pyright: ignore[reportAttributeAccessIssue]
+    queryset = manager.filter(deleted=True, last_modified_at__lt=cutoff)
+    for relation in model._meta.related_objects:
+        if relation.many_to_many or not relation.field.db_constraint:
+            continue
+        referencing = relation.related_model._base_manager.filter(
+            **{relation.field.name: OuterRef("pk")}
+        )
+        queryset = queryset.exclude(Exists(referencing))
+    return queryset
+
+
+def archive_batch(
+    label: str, competition_path: str, cutoff: datetime, batch_size: int, after: int
+) -> tuple[int, Optional[int]]:
+    """Archive up to `batch_size` rows of one model with ids above `after`.
+
+    Returns the number of rows archived and the id to continue after, or
+    None once the model has nothing left to archive.
+    """
+    model = apps.get_model(label)
+    manager: Any = model.all_objects  # pyright: ignore[reportAttributeAccessIssue]
+    fields = [field.attname for field in model._meta.concrete_fields]
+
+    with transaction.atomic(), triggers_held_back():
+        # Rows someone else holds a lock on are left for the next run
+        # rather than waited for.
+        ids = list(
+            archivable(model, cutoff)
+            .filter(pk__gt=after)
+            .order_by("pk")
+            .select_for_update(skip_locked=True)
+            .values_list("pk", flat=True)[:batch_size]
+        )
+        if not ids:
+            return 0, None
+
+        entries = []
+        rows = manager.filter(pk__in=ids).values(
+            *fields, archived_competition=F(competition_path)
+        )
+        for row in rows:
+            competition_id = row.pop("archived_competition")
+            entries.append(
+                ArchivedRow(
+                    model=label,
+                    object_id=row["id"],
+                    competition_id=competition_id,
+                    data=row,
+                    deleted_at=row["last_modified_at"],
+                )
+            )
+        ArchivedRow.objects.bulk_create(
+            entries,
+            update_conflicts=True,
+            unique_fields=["model", "object_id"],
+            update_fields=["competition", "data", "deleted_at", "archived_at"],
+        )
+        manager.filter(pk__in=ids).delete()
+
+    return len(ids), ids[-1] if len(ids) == batch_size else None
+
+
+def archive_deleted(
+    cutoff: datetime,
+    batch_size: int = 1000,
+    pause: float = 0.0,
+    max_rows: Optional[int] = None,
+    on_batch: Optional[Callable[[str, ArchiveProgress], None]] = None,
+) -> dict[str, ArchiveProgress]:
+    """Archive soft-deleted rows last touched before `cutoff`.
+
+    Sleeps `pause` seconds between batches to leave room for other
+    writers, and stops after about `max_rows` rows. `on_batch` is called
+    with the model label and its running totals after every batch.
+    """
+    progress: dict[str, ArchiveProgress] = {}
+    total = 0
+    for label, competition_path in ARCHIVED_MODELS:
+        stats = progress[label] = ArchiveProgress()
+        after: Optional[int] = 0
+        while after is not None:
+            if max_rows is not None and total >= max_rows:
+                return progress
+            size = batch_size if max_rows is None else min(batch_size, max_rows - total)
+
+            started = time.monotonic()
+            rows, after = archive_batch(label, competition_path, cutoff, size, after)
+            stats.seconds += time.monotonic() - started
+            if not rows:
+                break
+            stats.rows += rows
+            stats.batches += 1
+            total += rows
+            if on_batch is not None:
+                on_batch(label, stats)
+            if pause:
+                time.sleep(pause)
+    return progress
+
+
+def restore_archived(
+    competition_id: Optional[int] = None,
+    labels: Optional[Iterable[str]] = None,
+    batch_size: int = 1000,
+) -> dict[str, dict[str, int]]:
+    """Move archived rows back into their tables, parents first.
+
+    Restores a competition's rows, or every archived row, optionally
+    limited to some models. Returns per model how many rows came back and
+    how many stayed archived because a row they need is gone; nullable
+    references to missing rows, such as a deleted judge, are cleared.
+    """
+    wanted = set(labels) if labels is not None else None
+    report: dict[str, dict[str, int]] = {}
+    for label, _ in reversed(ARCHIVED_MODELS):
+        if wanted is not None and label not in wanted:
+            continue
+        archived = ArchivedRow.objects.filter(model=label)
+        if competition_id is not None:
+            archived = archived.filter(competition_id=competition_id)
+
+        counts = report[label] = {"restored": 0, "skipped": 0}
+        after = 0
+        while True:
+            batch = list(archived.filter(pk__gt=after).order_by("pk")[:batch_size])
+            if not batch:
+                break
+            after = batch[-1].pk
+            restored, skipped = _restore_batch(apps.get_model(label), batch)
+            counts["restored"] += restored
+            counts["skipped"] += skipped
+    return report
+
+
+def _restore_batch(
+    model: type[models.Model], batch: list[ArchivedRow]
+) -> tuple[int, int]:
+    objs = [
+        model(
+            **{
+                field.attname: field.to_python(entry.data.get(field.attname))
+                for field in model._meta.concrete_fields
+            }
+        )
+        for entry in batch
+    ]
+    missing = _missing_references(model, objs)
+    manager: Any = model.all_objects  # pyright: ignore[reportAttributeAccessIssue]
+
+    restorable, restored_ids = [], []
+    for obj, entry in zip(objs, batch):
+        blocked = False
+        for field in model._meta.concrete_fields:
+            if field.is_relation and getattr(obj, field.attname) in missing[field.name]:
+                if field.null:
+                    setattr(obj, field.attname, None)
+                else:
+                    blocked = True
+        if not blocked:
+            restorable.append(obj)
+            restored_ids.append(entry.pk)
+
+    with transaction.atomic(), triggers_held_back():
+        manager.bulk_create(restorable)
+        ArchivedRow.objects.filter(pk__in=restored_ids).delete()
+    return len(restorable), len(batch) - len(restorable)
+
+
+def _missing_references(
+    model: type[models.Model], objs: list[models.Model]
+) -> dict[str, set[Any]]:
+    """Per foreign key, the referenced ids that no longer exist."""
+    missing: dict[str, set[Any]] = {}
+    for field in model._meta.concrete_fields:
+        if not field.is_relation:
+            continue
+        ids = {getattr(obj, field.attname) for obj in objs} - {None}
+        found = set(
+            field.related_model._base_manager.filter(pk__in=ids).values_list(
+                "pk", flat=True
+            )
+        )
+        missing[field.name] = ids - found
+    return missing
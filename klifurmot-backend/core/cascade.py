@@ -0,0 +1,149 @@
+"""Set-based soft-delete and restore of a row and everything below it.
+
+Models list the rows that go with them in `soft_delete_cascade`, as
+`(model_label, link)` pairs. `link` names the child's foreign key to the
+parent, or maps child lookups to parent fields when a child belongs to the
+parent through more than one column.
+
+`soft_delete` walks that tree once and issues one UPDATE per edge, each
+scoped by an id subquery of its parent's scope, so the statement count
+depends on the tree and not on the number of rows. Children are updated
+before their parents, while the parent scopes still match. Every row gets
+the same `last_modified_at`, and `restore` brings back exactly the rows
+carrying the root's stamp; rows deleted on their own earlier stay deleted.
+
+On PostgreSQL the per-row result and score triggers are held back while
+the statements run, so callers announce the change once afterwards. Rows
+that feed a round's ranking name the path to their round in
+`cascade_round`; the result collects those rounds so callers can rerank
+them. A model with a `before_cascade(scope, deleted, user)` classmethod
+is handed each scope of its rows just before they change, for
+bookkeeping such as the climb event log.
+"""
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Iterator, Union
+
+from django.apps import apps
+from django.db import IntegrityError, connection, models, transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from .exceptions import ConflictError
+
+# Row triggers skip their work while this setting is "on".
+TRIGGER_GUARD = "klifurmot.bulk_cascade"
+
+Link = Union[str, dict[str, str]]
+
+
+@dataclass
+class CascadeResult:
+    stamp: datetime
+    counts: dict[str, int] = field(default_factory=dict)
+    # Rounds whose ranking rows were deleted or restored.
+    round_ids: set[int] = field(default_factory=set)
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def add(self, model: type[models.Model], rows: int) -> None:
+        label = model._meta.label
+        self.counts[label] = self.counts.get(label, 0) + rows
+
+
+def soft_delete(root: Union[models.Model, models.QuerySet], user=None) -> CascadeResult:
+    """Soft-delete `root`, a row or a queryset, with everything below it."""
+    if isinstance(root, models.Model):
+        queryset = type(root).all_objects.filter(pk=root.pk)
+    else:
+        queryset = root.model.all_objects.filter(pk__in=root.values("pk"))
+    return _apply(queryset, {"deleted": False}, deleted=True, user=user)
+
+
+def restore(root: models.Model, user=None) -> CascadeResult:
+    """Restore a soft-deleted row and the rows its soft-delete took along.
+
+    Raises ConflictError if a restored row would duplicate one created
+    since, such as a climber added back to a start list by hand.
+    """
+    match = {"deleted": True, "last_modified_at": root.last_modified_at}
+    queryset = type(root).all_objects.filter(pk=root.pk)
+    try:
+        return _apply(queryset, match, deleted=False, user=user)
+    except IntegrityError:
+        raise ConflictError(
+            f"Cannot restore {root._meta.verbose_name} {root.pk}: "
+            "some of its rows have been created again"
+        )
+
+
+def _apply(
+    queryset: models.QuerySet, match: dict[str, Any], deleted: bool, user
+) -> CascadeResult:
+    result = CascadeResult(stamp=timezone.now())
+    values: dict[str, Any] = {"deleted": deleted, "last_modified_at": result.stamp}
+    if user is not None:
+        values["last_modified_by"] = user
+
+    plan = list(_plan(queryset.model, queryset.filter(**match), match))
+    with transaction.atomic(), triggers_held_back():
+        # The plan lists parents first; run it backwards so every child is
+        # updated while its parent scope still matches.
+        for model, scope in reversed(plan):
+            round_path = getattr(model, "cascade_round", None)
+            if round_path:
+                result.round_ids.update(
+                    scope.order_by().values_list(round_path, flat=True).distinct()
+                )
+            before_cascade = getattr(model, "before_cascade", None)
+            if before_cascade is not None:
+                before_cascade(scope, deleted=deleted, user=user)
+            result.add(model, scope.update(**values))
+    return result
+
+
+def _plan(
+    model: type[models.Model], scope: models.QuerySet, match: dict[str, Any]
+) -> Iterator[tuple[type[models.Model], models.QuerySet]]:
+    yield model, scope
+    for label, link in getattr(model, "soft_delete_cascade", ()):
+        child = apps.get_model(label)
+        child_scope = _child_scope(child, scope, link).filter(**match)
+        yield from _plan(child, child_scope, match)
+
+
+def _child_scope(
+    child: type[models.Model], parent_scope: models.QuerySet, link: Link
+) -> models.QuerySet:
+    manager: Any = child.all_objects  # pyright: ignore[reportAttributeAccessIssue]
+    if isinstance(link, str):
+        return manager.filter(**{f"{link}__in": parent_scope.values("pk")})
+    return manager.filter(
+        Exists(
+            parent_scope.filter(
+                **{parent: OuterRef(lookup) for lookup, parent in link.items()}
+            )
+        )
+    )
+
+
+@contextmanager
+def triggers_held_back() -> Iterator[None]:
+    """Hold the per-row score and notify triggers back inside a transaction."""
+    if connection.vendor != "postgresql":
+        yield
+        return
+
+    _set_guard("on")
+    yield
+    # Not reached on errors; the rolled back savepoint resets the setting.
+    _set_guard("off")
+
+
+def _set_guard(value: str) -> None:
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT set_config(%s, %s, true)", [TRIGGER_GUARD, value])
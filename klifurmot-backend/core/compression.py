@@ -0,0 +1,75 @@
+"""Response body compression negotiated from `Accept-Encoding`.
+
+gzip is always available; brotli is used when the `brotli` package is
+installed and the client prefers it or weighs it equally. Compressed output
+is deterministic (gzip without a timestamp), so the same body always
+compresses to the same bytes.
+"""
+
+import gzip
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+# Bodies shorter than this are sent uncompressed, as Django's GZipMiddleware
+# does; the encoding overhead outweighs the saving.
+MIN_COMPRESS_LENGTH = 200
+
+IDENTITY = "identity"
+
+
+def brotli_available() -> bool:
+    return brotli is not None
+
+
+def supported_encodings() -> tuple[str, ...]:
+    """Encodings this server can produce, most preferred first."""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate_encoding(accept_encoding: str) -> str:
+    """Pick the content coding for an `Accept-Encoding` header value.
+
+    Returns "br", "gzip" or "identity". Codings with `q=0` are refused, `*`
+    covers codings not listed explicitly, and ties go to the server's
+    preference.
+    """
+    weights: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        weight = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[coding] = weight
+
+    best, best_weight = IDENTITY, 0.0
+    for coding in supported_encodings():
+        weight = weights.get(coding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = coding, weight
+    return best
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        if brotli is None:
+            raise ValueError("brotli is not installed")
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+    if encoding == IDENTITY:
+        return body
+    raise ValueError(f"Unsupported content coding {encoding!r}")
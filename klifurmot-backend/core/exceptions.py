@@ -0,0 +1,13 @@
+from typing import Any, Optional
+
+
+class ConflictError(Exception):
+    """Raised when a conditional write loses against a concurrent update.
+
+    `current` carries the row as it is now stored so the caller can show
+    the winning state and retry against its version.
+    """
+
+    def __init__(self, message: str, current: Optional[dict[str, Any]] = None):
+        super().__init__(message)
+        self.current = current
@@ -0,0 +1,86 @@
+import time
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from core import archive
+
+
+class Command(BaseCommand):
+    help = (
+        "Move soft-deleted rows older than the retention window into the "
+        "archive table. Safe to interrupt; the next run picks up the rest"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.SOFT_DELETE_RETENTION_DAYS,
+            help="Archive rows soft-deleted more than this many days ago "
+            "(default: SOFT_DELETE_RETENTION_DAYS)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Rows moved per transaction (default: 1000)",
+        )
+        parser.add_argument(
+            "--pause",
+            type=float,
+            default=0.1,
+            help="Seconds to sleep between batches (default: 0.1)",
+        )
+        parser.add_argument(
+            "--max-rows", type=int, help="Stop after about this many rows"
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Count the rows that would be archived",
+        )
+
+    def handle(self, *args, **options):
+        if options["days"] < 0 or options["batch_size"] < 1:
+            raise CommandError("--days must be >= 0 and --batch-size >= 1")
+        cutoff = timezone.now() - timedelta(days=options["days"])
+        self.verbosity = options["verbosity"]
+
+        if options["dry_run"]:
+            for label, _ in archive.ARCHIVED_MODELS:
+                rows = archive.archivable(apps.get_model(label), cutoff).count()
+                self.stdout.write(f"{label:<36} {rows:>8}")
+            return
+
+        started = time.monotonic()
+        progress = archive.archive_deleted(
+            cutoff,
+            batch_size=options["batch_size"],
+            pause=options["pause"],
+            max_rows=options["max_rows"],
+            on_batch=self._report_batch,
+        )
+
+        for label, stats in progress.items():
+            self.stdout.write(
+                f"{label:<36} {stats.rows:>8} rows in {stats.batches:>5} batches "
+                f"({stats.rows_per_second:.0f} rows/s)"
+            )
+        rows = sum(stats.rows for stats in progress.values())
+        elapsed = time.monotonic() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Archived {rows} rows soft-deleted before {cutoff:%Y-%m-%d} "
+                f"in {elapsed:.2f}s ({rows / elapsed if elapsed else 0:.0f} rows/s)"
+            )
+        )
+
+    def _report_batch(self, label, stats):
+        if self.verbosity > 1:
+            self.stdout.write(
+                f"  {label}: {stats.rows} rows ({stats.rows_per_second:.0f} rows/s)"
+            )
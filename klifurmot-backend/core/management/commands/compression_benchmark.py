@@ -0,0 +1,61 @@
+import timeit
+
+from django.core.management.base import BaseCommand
+
+from competitions.services import (
+    get_competition_athletes,
+    get_competition_results,
+    get_competition_routes,
+    get_competition_startlist,
+)
+from core.compression import compress, supported_encodings
+from core.renderers import FastJSONRenderer
+from core.utils import success_response
+
+
+class Command(BaseCommand):
+    help = (
+        "Show the wire size and compression time of each public competition "
+        "payload for every supported content coding"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--competition", type=int, required=True)
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args, **options):
+        competition_id = options["competition"]
+        payloads = [
+            ("results", get_competition_results),
+            ("startlist", get_competition_startlist),
+            ("routes", get_competition_routes),
+            ("athletes", get_competition_athletes),
+        ]
+
+        self.stdout.write(
+            f"{'endpoint':<10} {'encoding':<9} {'KiB':>8} {'ratio':>6} {'ms':>7}"
+        )
+        for name, service in payloads:
+            body = FastJSONRenderer().render(
+                success_response(service(competition_id)).data
+            )
+            self.stdout.write(
+                f"{name:<10} {'identity':<9} {len(body) / 1024:>8.1f} "
+                f"{1:>6.2f} {0:>7.2f}"
+            )
+            for encoding in supported_encodings():
+                compressed = compress(body, encoding)
+                ms = (
+                    min(
+                        timeit.repeat(
+                            lambda: compress(body, encoding),
+                            number=1,
+                            repeat=options["repeat"],
+                        )
+                    )
+                    * 1000
+                )
+                self.stdout.write(
+                    f"{name:<10} {encoding:<9} {len(compressed) / 1024:>8.1f} "
+                    f"{len(compressed) / len(body):>6.2f} {ms:>7.2f}"
+                )
@@ -0,0 +1,64 @@
+import timeit
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from athletes.services import list_public_athletes
+from competitions.services import get_competition_results, get_competition_startlist
+from core.renderers import FastJSONRenderer, orjson_available
+from core.utils import success_response
+
+
+class Command(BaseCommand):
+    help = "Compare DRF's JSONRenderer with FastJSONRenderer on large responses"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--competition", type=int, required=True)
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args, **options):
+        if not orjson_available():
+            raise CommandError("orjson is not installed")
+
+        competition_id = options["competition"]
+        payloads = [
+            ("results", get_competition_results(competition_id)),
+            ("startlist", get_competition_startlist(competition_id)),
+            ("athletes", list_public_athletes()),
+        ]
+
+        self.stdout.write(
+            f"{'endpoint':<10} {'KiB':>7} {'drf ms':>8} {'orjson ms':>10} "
+            f"{'speedup':>8} {'identical':>10}"
+        )
+        for name, data in payloads:
+            drf_ms, drf_body = self._time(
+                lambda: JSONRenderer().render(self._drf_envelope(data)),
+                options["repeat"],
+            )
+            fast_ms, fast_body = self._time(
+                lambda: FastJSONRenderer().render(success_response(data).data),
+                options["repeat"],
+            )
+            # Timestamps differ between runs, so compare everything else.
+            identical = drf_body[: drf_body.rindex(b',"timestamp"')] == (
+                fast_body[: fast_body.rindex(b',"timestamp"')]
+            )
+            self.stdout.write(
+                f"{name:<10} {len(fast_body) / 1024:>7.0f} {drf_ms:>8.2f} "
+                f"{fast_ms:>10.2f} {drf_ms / fast_ms:>7.1f}x {str(identical):>10}"
+            )
+
+    def _drf_envelope(self, data):
+        """The envelope as it was built before rendering moved to orjson."""
+        return {
+            "success": True,
+            "message": "Operation completed successfully",
+            "data": data,
+            "timestamp": timezone.now().isoformat(),
+        }
+
+    def _time(self, fn, repeat):
+        body = fn()
+        return min(timeit.repeat(fn, number=1, repeat=repeat)) * 1000, body
@@ -0,0 +1,54 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core import archive
+
+
+class Command(BaseCommand):
+    help = (
+        "Move archived rows back into their tables. They come back "
+        "soft-deleted; use restore_deleted to bring them back to life"
+    )
+
+    def add_arguments(self, parser):
+        target = parser.add_mutually_exclusive_group(required=True)
+        target.add_argument("--competition", type=int, help="Competition id")
+        target.add_argument("--all", action="store_true", help="Every archived row")
+        parser.add_argument(
+            "--model",
+            action="append",
+            choices=[label for label, _ in archive.ARCHIVED_MODELS],
+            help="Only rows of this model; repeat for several",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Rows moved per transaction (default: 1000)",
+        )
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be >= 1")
+
+        started = time.monotonic()
+        report = archive.restore_archived(
+            competition_id=options["competition"],
+            labels=options["model"],
+            batch_size=options["batch_size"],
+        )
+
+        for label, counts in report.items():
+            self.stdout.write(
+                f"{label:<36} {counts['restored']:>8} restored "
+                f"{counts['skipped']:>8} skipped"
+            )
+        rows = sum(counts["restored"] for counts in report.values())
+        elapsed = time.monotonic() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Restored {rows} rows in {elapsed:.2f}s "
+                f"({rows / elapsed if elapsed else 0:.0f} rows/s)"
+            )
+        )
@@ -0,0 +1,46 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from athletes.services import restore_climber, restore_registration
+from competitions.services import (
+    restore_category,
+    restore_competition,
+    restore_round,
+)
+from core.exceptions import ConflictError
+
+RESTORERS = {
+    "competition": restore_competition,
+    "category": restore_category,
+    "round": restore_round,
+    "climber": restore_climber,
+    "registration": restore_registration,
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Restore a soft-deleted competition, category, round, climber or "
+        "registration together with the rows its deletion took along"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("kind", choices=sorted(RESTORERS))
+        parser.add_argument("id", type=int)
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        try:
+            counts = RESTORERS[options["kind"]](options["id"])
+        except (ValueError, ConflictError) as e:
+            raise CommandError(str(e))
+
+        for label, rows in sorted(counts.items()):
+            self.stdout.write(f"{label:<36} {rows:>8}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Restored {sum(counts.values())} rows in "
+                f"{(time.monotonic() - started) * 1000:.1f} ms"
+            )
+        )
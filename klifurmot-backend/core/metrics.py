@@ -0,0 +1,91 @@
+"""In-process request metrics.
+
+`RequestMetricsMiddleware` records, per view, how many responses were sent,
+the body bytes put on the wire after compression, and the CPU time the
+worker thread spent on the request. Each response also reports its CPU
+time in a `Server-Timing` header. Counters live in the worker process and
+are read by admins from `GET /api/metrics/`; with several workers each
+reports its own share.
+"""
+
+import threading
+import time
+from collections import defaultdict
+from typing import Any
+
+_lock = threading.Lock()
+_views: dict[str, dict[str, Any]] = {}
+_counters: dict[str, int] = defaultdict(int)
+
+
+def _empty_view() -> dict[str, Any]:
+    return {
+        "requests": 0,
+        "bytes_sent": 0,
+        "cpu_ms": 0.0,
+        "encodings": defaultdict(int),
+    }
+
+
+def record_response(view: str, bytes_sent: int, cpu_ms: float, encoding: str) -> None:
+    with _lock:
+        stats = _views.get(view)
+        if stats is None:
+            stats = _views[view] = _empty_view()
+        stats["requests"] += 1
+        stats["bytes_sent"] += bytes_sent
+        stats["cpu_ms"] += cpu_ms
+        stats["encodings"][encoding] += 1
+
+
+def increment(name: str, amount: int = 1) -> None:
+    with _lock:
+        _counters[name] += amount
+
+
+def snapshot() -> dict[str, Any]:
+    """Totals and per-request averages since the process started."""
+    with _lock:
+        views = {
+            view: {
+                "requests": stats["requests"],
+                "bytes_sent": stats["bytes_sent"],
+                "cpu_ms": round(stats["cpu_ms"], 3),
+                "bytes_per_request": stats["bytes_sent"] // stats["requests"],
+                "cpu_ms_per_request": round(stats["cpu_ms"] / stats["requests"], 3),
+                "encodings": dict(stats["encodings"]),
+            }
+            for view, stats in sorted(_views.items())
+        }
+        return {"views": views, "counters": dict(sorted(_counters.items()))}
+
+
+def reset() -> None:
+    with _lock:
+        _views.clear()
+        _counters.clear()
+
+
+class RequestMetricsMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        started = time.thread_time()
+        response = self.get_response(request)
+        cpu_ms = (time.thread_time() - started) * 1000
+
+        if response.streaming:
+            bytes_sent = int(response.get("Content-Length") or 0)
+        else:
+            bytes_sent = len(response.content)
+
+        match = request.resolver_match
+        record_response(
+            match.view_name if match else "unresolved",
+            bytes_sent,
+            cpu_ms,
+            response.get("Content-Encoding", "identity"),
+        )
+        response["Server-Timing"] = f"cpu;dur={cpu_ms:.2f}"
+        return response
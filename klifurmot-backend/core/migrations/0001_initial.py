@@ -0,0 +1,34 @@
+# Generated by Django 5.2.1 on 2026-10-19 03:51
+
+import core.models
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('competitions', '0002_competition_discipline'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedRow',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model', models.CharField(max_length=100)),
+                ('object_id', models.BigIntegerField()),
+                ('data', models.JSONField(encoder=core.models.ArchiveJSONEncoder)),
+                ('deleted_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('competition', models.ForeignKey(db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='competitions.competition')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['competition', 'model'], name='archivedrow_competition_idx')],
+                'constraints': [models.UniqueConstraint(fields=('model', 'object_id'), name='unique_archived_row')],
+            },
+        ),
+    ]
@@ -1,4 +1,7 @@
+from datetime import datetime
+
 from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 from django.utils import timezone
 
@@ -14,6 +17,47 @@ class CompetitionGender(models.TextChoices):
     KVK = "KVK", "KVK"
 
 
+class AuditedQuerySet(models.QuerySet):
+    """Stamps `last_modified_at` on every bulk write.
+
+    `update` and `bulk_update` set it to the current time unless the caller
+    writes it explicitly, and upserting `bulk_create` calls refresh it on
+    the rows they update.
+    """
+
+    def update(self, **kwargs):
+        kwargs.setdefault("last_modified_at", timezone.now())
+        return super().update(**kwargs)
+
+    def bulk_update(self, objs, fields, batch_size=None):
+        objs = list(objs)
+        fields = list(fields)
+        if "last_modified_at" not in fields:
+            now = timezone.now()
+            for obj in objs:
+                obj.last_modified_at = now
+            fields.append("last_modified_at")
+        return super().bulk_update(objs, fields, batch_size=batch_size)
+
+    def bulk_create(self, objs, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if kwargs.get("update_conflicts") and update_fields:
+            objs = list(objs)
+            now = timezone.now()
+            for obj in objs:
+                obj.last_modified_at = now
+            if "last_modified_at" not in update_fields:
+                kwargs["update_fields"] = [*update_fields, "last_modified_at"]
+        return super().bulk_create(objs, *args, **kwargs)
+
+
+class ActiveManager(models.Manager.from_queryset(AuditedQuerySet)):
+    """Rows that are not soft-deleted."""
+
+    def get_queryset(self):
+        return super().get_queryset().filter(deleted=False)
+
+
 class AuditedSoftDeleteModel(models.Model):
     created_at = models.DateTimeField(default=timezone.now)
     created_by = models.ForeignKey(
@@ -31,5 +75,67 @@ class AuditedSoftDeleteModel(models.Model):
     )
     deleted = models.BooleanField(default=False, db_index=True)
 
+    # Rows soft-deleted and restored together with this one, as
+    # `(model_label, link)` pairs; see `core.cascade`.
+    soft_delete_cascade: list = []
+
+    # `objects` hides soft-deleted rows and is the default manager, so
+    # related managers and the admin hide them too. Reviving a row or
+    # listing tombstones goes through `all_objects`.
+    objects = ActiveManager()
+    all_objects = AuditedQuerySet.as_manager()
+
     class Meta:
         abstract = True
+
+    def save(self, *args, **kwargs):
+        self.last_modified_at = timezone.now()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "last_modified_at" not in update_fields:
+            kwargs["update_fields"] = [*update_fields, "last_modified_at"]
+        super().save(*args, **kwargs)
+
+
+class ArchiveJSONEncoder(DjangoJSONEncoder):
+    """Keeps the microseconds of datetimes, which restores match on."""
+
+    def default(self, o):
+        if isinstance(o, datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+class ArchivedRow(models.Model):
+    """A soft-deleted row moved out of its table by `core.archive`.
+
+    `data` holds the row's column values, so restoring it puts back the
+    same row, still soft-deleted and with its deletion stamp intact.
+    """
+
+    model = models.CharField(max_length=100)
+    object_id = models.BigIntegerField()
+    competition = models.ForeignKey(
+        "competitions.Competition",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        null=True,
+        related_name="+",
+    )
+    data = models.JSONField(encoder=ArchiveJSONEncoder)
+    deleted_at = models.DateTimeField()
+    archived_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["model", "object_id"], name="unique_archived_row"
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["competition", "model"], name="archivedrow_competition_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.model} {self.object_id} archived at {self.archived_at}"
@@ -0,0 +1,92 @@
+"""orjson-backed JSON renderer.
+
+orjson is optional; without it, or for requests DRF's renderer handles
+differently (indented output, ASCII or non-compact settings), rendering
+falls back to DRF's JSONRenderer. The output is byte-for-byte what DRF
+produces: values orjson does not handle natively, including every date
+and time, are encoded by DRF's JSONEncoder. The one difference is that
+NaN and infinite floats render as null, where DRF's strict mode raises.
+"""
+
+import datetime
+from typing import Any, Optional
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+if orjson is not None:
+    OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+_default = JSONEncoder().default
+
+
+def orjson_available() -> bool:
+    return orjson is not None
+
+
+def split_timestamp(data: Any) -> tuple[Any, Optional[datetime.datetime]]:
+    """Separate the `timestamp` datetime of a `core.utils` response envelope.
+
+    The envelope keeps it as a datetime so it is only formatted while
+    rendering; it is always the last key.
+    """
+    if type(data) is not dict or not data:
+        return data, None
+    timestamp = data.get("timestamp")
+    if not isinstance(timestamp, datetime.datetime) or next(reversed(data)) != (
+        "timestamp"
+    ):
+        return data, None
+    envelope = data.copy()
+    del envelope["timestamp"]
+    return envelope, timestamp
+
+
+class FastJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        renderer_context = renderer_context or {}
+        envelope, timestamp = split_timestamp(data)
+
+        if (
+            orjson is None
+            or self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context) is not None
+        ):
+            if timestamp is not None:
+                envelope["timestamp"] = timestamp.isoformat()
+            return super().render(envelope, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(envelope, default=_default, option=OPTIONS)
+            if timestamp is not None:
+                # Native datetime output matches `datetime.isoformat()`.
+                ret = b"".join(
+                    (
+                        ret[:-1],
+                        b',"timestamp":' if len(ret) > 2 else b'"timestamp":',
+                        orjson.dumps(timestamp),
+                        b"}",
+                    )
+                )
+        except orjson.JSONEncodeError:
+            # Values orjson rejects, such as integers wider than 64 bits, get
+            # DRF's behaviour.
+            if timestamp is not None:
+                envelope["timestamp"] = timestamp.isoformat()
+            return super().render(envelope, accepted_media_type, renderer_context)
+
+        # Same JavaScript-safe escaping as JSONRenderer.
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+                b"\xe2\x80\xa9", b"\\u2029"
+            )
+        return ret
@@ -0,0 +1,113 @@
+"""Cached, pre-compressed JSON response bodies.
+
+A cacheable response is rendered once and its body stored under the
+caller's key, which must change whenever the payload does. Each content
+coding is compressed on first request and stored next to the rendered
+body, so it is compressed once per key rather than once per request, and a
+hit costs one cache lookup for exactly the bytes that go on the wire.
+
+Callers that know the payload's version pass it as `tag`. Responses then
+carry an ETag built from it, and a matching `If-None-Match` is answered
+with 304 before the body cache or `build()` is touched. The ETag is weak:
+a body rendered again after the cache dropped it carries the same data
+but not the same bytes, since the envelope has a fresh timestamp.
+"""
+
+from typing import Callable, Optional, Union
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.http import parse_etags, quote_etag
+from rest_framework.response import Response
+
+from . import metrics
+from .compression import IDENTITY, MIN_COMPRESS_LENGTH, compress, negotiate_encoding
+
+
+def cached_json_response(
+    request,
+    key: str,
+    build: Callable[[], Response],
+    tag: Optional[str] = None,
+    max_age: Optional[int] = None,
+) -> Union[HttpResponse, Response]:
+    """Serve `build()` from the body cache under `key`.
+
+    Only successful responses rendered as JSON are cached; anything else,
+    such as the browsable API or an error, is returned from `build()` as is.
+    `max_age` sets a public `Cache-Control` on cached responses.
+    """
+    renderer = getattr(request, "accepted_renderer", None)
+    if renderer is None or renderer.format != "json":
+        return build()
+
+    encoding = negotiate_encoding(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+    etag = None
+    if tag is not None:
+        # Each coding is a different byte sequence, so it gets its own tag.
+        etag = "W/" + quote_etag(tag if encoding == IDENTITY else f"{tag}-{encoding}")
+        if _etag_matches(request, etag):
+            metrics.increment("response_cache.not_modified")
+            return _finish(HttpResponseNotModified(), etag, max_age)
+
+    body = cache.get(f"{key}:{encoding}")
+    if body is not None:
+        metrics.increment("response_cache.hit")
+        return _body_response(body, encoding, renderer.media_type, etag, max_age)
+
+    metrics.increment("response_cache.miss")
+    timeout = settings.PUBLIC_RESPONSE_CACHE_TIMEOUT
+    content = cache.get(f"{key}:{IDENTITY}") if encoding != IDENTITY else None
+    if content is None:
+        response = build()
+        if response.status_code != 200:
+            return response
+        content = renderer.render(
+            response.data,
+            request.accepted_media_type,
+            {"request": request, "response": response},
+        )
+        cache.set(f"{key}:{IDENTITY}", content, timeout)
+
+    if encoding == IDENTITY or len(content) < MIN_COMPRESS_LENGTH:
+        return _body_response(content, IDENTITY, renderer.media_type, etag, max_age)
+
+    body = compress(content, encoding)
+    metrics.increment(f"response_cache.compressed.{encoding}")
+    cache.set(f"{key}:{encoding}", body, timeout)
+    return _body_response(body, encoding, renderer.media_type, etag, max_age)
+
+
+def _etag_matches(request, etag: str) -> bool:
+    header = request.META.get("HTTP_IF_NONE_MATCH")
+    if not header:
+        return False
+    # If-None-Match uses the weak comparison.
+    candidates = [tag.removeprefix("W/") for tag in parse_etags(header)]
+    return "*" in candidates or etag.removeprefix("W/") in candidates
+
+
+def _body_response(
+    body: bytes,
+    encoding: str,
+    content_type: str,
+    etag: Optional[str],
+    max_age: Optional[int],
+) -> HttpResponse:
+    response = HttpResponse(body, content_type=content_type)
+    if encoding != IDENTITY:
+        response["Content-Encoding"] = encoding
+    return _finish(response, etag, max_age)
+
+
+def _finish(
+    response: HttpResponse, etag: Optional[str], max_age: Optional[int]
+) -> HttpResponse:
+    if etag is not None:
+        response["ETag"] = etag
+    if max_age is not None:
+        patch_cache_control(response, public=True, max_age=max_age)
+    patch_vary_headers(response, ("Accept-Encoding",))
+    return response
@@ -0,0 +1,48 @@
+import gzip
+
+from django.test import SimpleTestCase
+
+from core.compression import (
+    IDENTITY,
+    brotli_available,
+    compress,
+    negotiate_encoding,
+)
+
+
+class NegotiateEncodingTest(SimpleTestCase):
+    def test_picks_gzip_from_common_headers(self):
+        self.assertEqual(negotiate_encoding("gzip, deflate"), "gzip")
+        self.assertEqual(negotiate_encoding("deflate, GZIP;q=0.8"), "gzip")
+
+    def test_prefers_brotli_when_installed(self):
+        expected = "br" if brotli_available() else "gzip"
+        self.assertEqual(negotiate_encoding("gzip, deflate, br"), expected)
+        self.assertEqual(negotiate_encoding("*"), expected)
+
+    def test_honours_quality_values(self):
+        self.assertEqual(negotiate_encoding("br;q=0.2, gzip;q=0.9"), "gzip")
+        self.assertEqual(negotiate_encoding("gzip;q=0"), IDENTITY)
+        self.assertEqual(negotiate_encoding("*;q=0"), IDENTITY)
+        self.assertEqual(negotiate_encoding("gzip;q=nope"), IDENTITY)
+
+    def test_without_supported_codings_sends_identity(self):
+        self.assertEqual(negotiate_encoding(""), IDENTITY)
+        self.assertEqual(negotiate_encoding("deflate, compress"), IDENTITY)
+
+
+class CompressTest(SimpleTestCase):
+    def test_gzip_is_deterministic(self):
+        body = b'{"success":true,"data":[]}' * 20
+
+        first = compress(body, "gzip")
+
+        self.assertEqual(first, compress(body, "gzip"))
+        self.assertEqual(gzip.decompress(first), body)
+
+    def test_identity_returns_body(self):
+        self.assertEqual(compress(b"{}", IDENTITY), b"{}")
+
+    def test_rejects_unknown_codings(self):
+        with self.assertRaises(ValueError):
+            compress(b"{}", "deflate")
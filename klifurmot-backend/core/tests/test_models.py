@@ -0,0 +1,50 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from competitions.models import Competition
+
+
+class AuditedTimestampTest(TestCase):
+    def setUp(self):
+        now = timezone.now()
+        self.long_ago = now - timedelta(days=30)
+        self.competition = Competition.objects.create(
+            title="Bikarmót",
+            start_date=now,
+            end_date=now + timedelta(hours=6),
+            location="Klifurhúsið",
+        )
+        Competition.objects.filter(pk=self.competition.pk).update(
+            last_modified_at=self.long_ago
+        )
+
+    def modified_at(self):
+        return Competition.all_objects.values_list("last_modified_at", flat=True).get(
+            pk=self.competition.pk
+        )
+
+    def test_save_stamps_last_modified_at(self):
+        self.competition.title = "Íslandsmót"
+        self.competition.save(update_fields=["title"])
+
+        self.assertGreater(self.modified_at(), self.long_ago)
+
+    def test_queryset_update_stamps_last_modified_at(self):
+        Competition.objects.filter(pk=self.competition.pk).update(deleted=True)
+
+        self.assertGreater(self.modified_at(), self.long_ago)
+
+    def test_bulk_update_stamps_last_modified_at(self):
+        self.competition.visible = False
+        Competition.objects.bulk_update([self.competition], ["visible"])
+
+        self.assertGreater(self.modified_at(), self.long_ago)
+
+    def test_explicit_update_wins(self):
+        Competition.objects.filter(pk=self.competition.pk).update(
+            visible=False, last_modified_at=self.long_ago
+        )
+
+        self.assertEqual(self.modified_at(), self.long_ago)
@@ -0,0 +1,124 @@
+import datetime
+import decimal
+import io
+import uuid
+from unittest import skipUnless
+
+from django.test import SimpleTestCase
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from core.parsers import FastJSONParser
+from core.renderers import FastJSONRenderer, orjson_available, split_timestamp
+from core.utils import error_response, success_response
+
+
+def payload():
+    return {
+        "datetime": datetime.datetime(2025, 5, 1, 14, 30, 5, 120, tzinfo=datetime.UTC),
+        "naive": datetime.datetime(2025, 5, 1, 14, 30),
+        "date": datetime.date(2025, 5, 1),
+        "time": datetime.time(9, 15, 30, 500),
+        "duration": datetime.timedelta(minutes=4, seconds=30),
+        "decimal": decimal.Decimal("24.5"),
+        "uuid": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+        "lazy": gettext_lazy("Operation completed successfully"),
+        "bytes": b"raw",
+        "set": {3},
+        "tuple": (1, 2),
+        "int_keys": {1: "a", 2: "b"},
+        "text": "Björn\u2028Þór\u2029",
+        "nested": [{"score": 24.9, "rank": None, "top": True}],
+    }
+
+
+@skipUnless(orjson_available(), "orjson is not installed")
+class FastJSONRendererTest(SimpleTestCase):
+    def render(self, renderer, data, media_type="application/json"):
+        return renderer.render(data, media_type, {})
+
+    def test_matches_drf_output(self):
+        data = payload()
+
+        self.assertEqual(
+            self.render(FastJSONRenderer(), data),
+            self.render(JSONRenderer(), data),
+        )
+
+    def test_envelope_timestamp_matches_isoformat(self):
+        response = success_response(payload(), message="Done")
+        timestamp = response.data["timestamp"]
+        expected = {**response.data, "timestamp": timestamp.isoformat()}
+
+        self.assertEqual(
+            self.render(FastJSONRenderer(), response.data),
+            self.render(JSONRenderer(), expected),
+        )
+
+    def test_error_envelope(self):
+        response = error_response("Not_found", "Missing", details={"id": ["bad"]})
+        expected = {
+            **response.data,
+            "timestamp": response.data["timestamp"].isoformat(),
+        }
+
+        self.assertEqual(
+            self.render(FastJSONRenderer(), response.data),
+            self.render(JSONRenderer(), expected),
+        )
+
+    def test_indented_request_falls_back(self):
+        response = success_response({"a": 1})
+        expected = {
+            **response.data,
+            "timestamp": response.data["timestamp"].isoformat(),
+        }
+        media_type = "application/json; indent=4"
+
+        self.assertEqual(
+            self.render(FastJSONRenderer(), response.data, media_type),
+            self.render(JSONRenderer(), expected, media_type),
+        )
+
+    def test_wide_integers_fall_back(self):
+        data = {"big": 2**70}
+
+        self.assertEqual(
+            self.render(FastJSONRenderer(), data),
+            self.render(JSONRenderer(), data),
+        )
+
+    def test_none_renders_empty(self):
+        self.assertEqual(FastJSONRenderer().render(None), b"")
+
+    def test_timestamp_must_be_last_key(self):
+        now = timezone.now()
+        data = {"timestamp": now, "data": 1}
+
+        self.assertEqual(split_timestamp(data), (data, None))
+
+
+@skipUnless(orjson_available(), "orjson is not installed")
+class FastJSONParserTest(SimpleTestCase):
+    def parse(self, parser, body):
+        return parser.parse(io.BytesIO(body), "application/json", {})
+
+    def test_matches_drf(self):
+        for body in [
+            '{"name": "Björn", "scores": [1, 2.5, null, true]}'.encode(),
+            b'{"big": 1180591620717411303424}',
+        ]:
+            with self.subTest(body=body):
+                self.assertEqual(
+                    self.parse(FastJSONParser(), body),
+                    self.parse(JSONParser(), body),
+                )
+
+    def test_invalid_json(self):
+        for body in [b"{", b'{"score": NaN}']:
+            with self.subTest(body=body):
+                with self.assertRaises(ParseError):
+                    self.parse(FastJSONParser(), body)
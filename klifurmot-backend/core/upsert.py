@@ -0,0 +1,256 @@
+"""Create-or-revive writes against the partial unique constraints.
+
+Start list entries, climbs and registrations are unique among live rows
+only, so adding one back after a soft-delete revives the old row instead
+of inserting a second. `upsert` does that for a batch of unsaved
+instances. On PostgreSQL it is one statement: a data-modifying CTE
+revives the soft-deleted row of each key that has no live one, inserts
+the remaining keys with `ON CONFLICT ... DO NOTHING` against the
+constraint, and returns both. Keys that already have a live row come
+back as conflicts, also when a concurrent writer got there first. Other
+databases run the revive and the insert as two statements. Large batches
+are split to stay under the backend's query parameter limit.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Generic, Optional, Sequence, TypeVar
+
+from django.db import connection, models, transaction
+from django.db.models.sql import Query
+from django.utils import timezone
+
+from .models import AuditedSoftDeleteModel
+
+CREATED = "created"
+REVIVED = "revived"
+CONFLICT = "conflict"
+
+T = TypeVar("T", bound=AuditedSoftDeleteModel)
+
+
+@dataclass
+class Upsert(Generic[T]):
+    outcome: str
+    # The written row, or None on a conflict.
+    obj: Optional[T]
+
+
+def upsert_one(obj: T, constraint: str, revive_fields: Sequence[str]) -> Upsert[T]:
+    return upsert([obj], constraint, revive_fields)[0]
+
+
+def upsert_one_or_raise(
+    obj: T, constraint: str, revive_fields: Sequence[str], conflict: str
+) -> T:
+    """`upsert_one` that returns the written row and raises ValueError
+    with the `conflict` message if a live row already has the key."""
+    written = upsert_one(obj, constraint, revive_fields).obj
+    if written is None:
+        raise ValueError(conflict)
+    return written
+
+
+def upsert(
+    objs: Sequence[T], constraint: str, revive_fields: Sequence[str]
+) -> list[Upsert[T]]:
+    """Insert `objs`, reviving soft-deleted rows with the same key instead.
+
+    `constraint` names the model's partial unique constraint whose fields
+    form the key; the keys of `objs` must be distinct. A revived row takes
+    `revive_fields` from its instance, is undeleted and stamped, and has
+    its `version` bumped if the model keeps one; its other columns, such
+    as `created_by`, keep their values. Results follow the order of `objs`.
+    """
+    if not objs:
+        return []
+
+    statement: _Statement[T] = _Statement(type(objs[0]), constraint, revive_fields)
+    now = timezone.now()
+    for obj in objs:
+        obj.last_modified_at = now
+        obj.deleted = False
+    if len({statement.key_of(obj) for obj in objs}) != len(objs):
+        raise ValueError("Rows to upsert must have distinct keys")
+
+    written = []
+    batch_size = connection.ops.bulk_batch_size(statement.columns, objs)
+    with transaction.atomic(savepoint=False), connection.cursor() as cursor:
+        for start in range(0, len(objs), batch_size):
+            written += _write(cursor, statement, objs[start : start + batch_size])
+
+    by_key = {
+        statement.key_of_row(row[1:]): Upsert(row[0], statement.instance(row[1:]))
+        for row in written
+    }
+    return [by_key.get(statement.key_of(obj), Upsert(CONFLICT, None)) for obj in objs]
+
+
+def _write(cursor, statement: "_Statement[T]", objs: Sequence[T]) -> list:
+    values, params = statement.values(objs)
+    if connection.vendor == "postgresql":
+        cursor.execute(statement.revive_and_insert(values), params)
+        return cursor.fetchall()
+
+    cursor.execute(statement.revive(values), params)
+    written = [(REVIVED, *row) for row in cursor.fetchall()]
+    revived = {statement.key_of_row(row[1:]) for row in written}
+    rest = [obj for obj in objs if statement.key_of(obj) not in revived]
+    if rest:
+        values, params = statement.values(rest)
+        cursor.execute(statement.insert(values), params)
+        written += [(CREATED, *row) for row in cursor.fetchall()]
+    return written
+
+
+class _Statement(Generic[T]):
+    """SQL for one model, constraint and set of revived columns."""
+
+    def __init__(self, model: type[T], constraint: str, revive_fields: Sequence[str]):
+        opts = model._meta
+        unique = next((c for c in opts.constraints if c.name == constraint), None)
+        if not isinstance(unique, models.UniqueConstraint) or unique.condition is None:
+            raise ValueError(f"{opts.label} has no partial unique {constraint!r}")
+
+        self.model = model
+        self.keys = [opts.get_field(name) for name in unique.fields]
+        self.columns = [
+            field for field in opts.concrete_fields if not field.primary_key
+        ]
+        self.returned = list(opts.concrete_fields)
+        self.key_positions = [self.returned.index(key) for key in self.keys]
+        revived = [opts.get_field(name) for name in revive_fields]
+        self.revived = list(
+            dict.fromkeys(
+                [
+                    *revived,
+                    opts.get_field("deleted"),
+                    opts.get_field("last_modified_at"),
+                ]
+            )
+        )
+        self.versioned = any(field.name == "version" for field in self.columns)
+
+        qn = connection.ops.quote_name
+        self.table = qn(opts.db_table)
+        self.pk = qn(next(field for field in self.returned if field.primary_key).column)
+        query = Query(model, alias_cols=False)
+        where = query.build_where(unique.condition)
+        self.live, condition_params = where.as_sql(
+            query.get_compiler(connection=connection), connection
+        )
+        if condition_params:
+            raise ValueError(f"{constraint!r} condition must not take parameters")
+        query = Query(model)
+        self.live_target, _ = query.build_where(unique.condition).as_sql(
+            query.get_compiler(connection=connection), connection
+        )
+
+        # Raw rows still need the backend's conversions, such as parsing
+        # SQLite's text datetimes.
+        self.cols = [field.get_col(opts.db_table) for field in self.returned]
+        self.converters = [
+            connection.ops.get_db_converters(col) + col.get_db_converters(connection)
+            for col in self.cols
+        ]
+
+    def key_of(self, obj: T) -> tuple:
+        return tuple(getattr(obj, key.attname) for key in self.keys)
+
+    def key_of_row(self, row: Sequence[Any]) -> tuple:
+        return tuple(
+            self._convert(position, row[position]) for position in self.key_positions
+        )
+
+    def instance(self, row: Sequence[Any]) -> T:
+        values = [self._convert(position, value) for position, value in enumerate(row)]
+        return self.model.from_db(
+            connection.alias, [field.attname for field in self.returned], values
+        )
+
+    def _convert(self, position: int, value: Any) -> Any:
+        for converter in self.converters[position]:
+            value = converter(value, self.cols[position], connection)
+        return value
+
+    def values(self, objs: Sequence[T]) -> tuple[str, list[Any]]:
+        if connection.vendor == "postgresql":
+            # VALUES columns are untyped until cast.
+            placeholders = [
+                f"%s::{field.cast_db_type(connection)}" for field in self.columns
+            ]
+        else:
+            placeholders = ["%s"] * len(self.columns)
+        row = f"({', '.join(placeholders)})"
+        params = [
+            field.get_db_prep_save(getattr(obj, field.attname), connection)
+            for obj in objs
+            for field in self.columns
+        ]
+        return f"VALUES {', '.join([row] * len(objs))}", params
+
+    def _names(self, fields, prefix: str = "") -> str:
+        qn = connection.ops.quote_name
+        return ", ".join(f"{prefix}{qn(field.column)}" for field in fields)
+
+    def _match(self, alias: str, other: str) -> str:
+        qn = connection.ops.quote_name
+        return " AND ".join(
+            f"{alias}.{qn(key.column)} = {other}.{qn(key.column)}" for key in self.keys
+        )
+
+    def _with_input(self, values: str) -> str:
+        return f"WITH input ({self._names(self.columns)}) AS ({values})"
+
+    def _revive_sql(self) -> str:
+        qn = connection.ops.quote_name
+        sets = [
+            f"{qn(field.column)} = input.{qn(field.column)}" for field in self.revived
+        ]
+        if self.versioned:
+            sets.append(f"{qn('version')} = {self.table}.{qn('version')} + 1")
+        # Unqualified columns in the constraint condition resolve to the
+        # innermost table, `dead` or `live`. Checking the target row itself
+        # as well makes a writer that waited on a concurrent revive of the
+        # same row skip it, and then conflict on the insert.
+        return (
+            f"UPDATE {self.table} SET {', '.join(sets)} FROM input "
+            f"WHERE {self.table}.{self.pk} = ("
+            f"SELECT dead.{self.pk} FROM {self.table} dead "
+            f"WHERE {self._match('dead', 'input')} AND NOT ({self.live}) "
+            f"ORDER BY dead.{self.pk} DESC LIMIT 1"
+            f") AND NOT ({self.live_target}) AND NOT EXISTS ("
+            f"SELECT 1 FROM {self.table} live "
+            f"WHERE {self._match('live', 'input')} AND {self.live}"
+            f") RETURNING {self._names(self.returned, f'{self.table}.')}"
+        )
+
+    def _on_conflict(self) -> str:
+        return (
+            f"ON CONFLICT ({self._names(self.keys)}) WHERE {self.live} DO NOTHING "
+            f"RETURNING {self._names(self.returned, f'{self.table}.')}"
+        )
+
+    def revive(self, values: str) -> str:
+        return f"{self._with_input(values)} {self._revive_sql()}"
+
+    def insert(self, values: str) -> str:
+        return (
+            f"INSERT INTO {self.table} ({self._names(self.columns)}) {values} "
+            f"{self._on_conflict()}"
+        )
+
+    def revive_and_insert(self, values: str) -> str:
+        columns = self._names(self.columns)
+        return (
+            f"{self._with_input(values)}, "
+            f"revived AS ({self._revive_sql()}), "
+            f"created AS ("
+            f"INSERT INTO {self.table} ({columns}) "
+            f"SELECT {self._names(self.columns, 'input.')} FROM input "
+            f"WHERE NOT EXISTS ("
+            f"SELECT 1 FROM revived WHERE {self._match('revived', 'input')}"
+            f") {self._on_conflict()}"
+            f") "
+            f"SELECT '{REVIVED}', * FROM revived "
+            f"UNION ALL SELECT '{CREATED}', * FROM created"
+        )
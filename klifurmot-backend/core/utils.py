@@ -25,7 +25,7 @@ def success_response(
             "success": True,
             "message": message,
             "data": data,
-            "timestamp": timezone.now().isoformat(),
+            "timestamp": timezone.now(),
         },
         status=status_code,
     )
@@ -55,7 +55,7 @@ def error_response(
             "code": code,
             "message": message,
         },
-        "timestamp": timezone.now().isoformat(),
+        "timestamp": timezone.now(),
     }
 
     if details is not None:
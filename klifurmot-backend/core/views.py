@@ -0,0 +1,14 @@
+from rest_framework.decorators import api_view, permission_classes
+
+from accounts import permissions
+from . import metrics as request_metrics
+from . import utils
+
+
+@api_view(["GET"])
+@permission_classes([permissions.IsAdmin])
+def metrics(_request):
+    return utils.success_response(
+        data=request_metrics.snapshot(),
+        message="Metrics retrieved successfully",
+    )
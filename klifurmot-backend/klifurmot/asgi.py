@@ -1,6 +1,6 @@
 import os
 from django.core.asgi import get_asgi_application
-from channels.routing import ProtocolTypeRouter, URLRouter
+from channels.routing import ChannelNameRouter, ProtocolTypeRouter, URLRouter
 from channels.auth import AuthMiddlewareStack
 from channels.security.websocket import AllowedHostsOriginValidator
 from django.conf import settings
@@ -17,6 +17,7 @@ if settings.DEBUG:
             "websocket": AuthMiddlewareStack(
                 URLRouter(scoring.routing.websocket_urlpatterns)
             ),
+            "channel": ChannelNameRouter(scoring.routing.channel_routes),
         }
     )
 else:
@@ -26,5 +27,6 @@ else:
             "websocket": AllowedHostsOriginValidator(
                 AuthMiddlewareStack(URLRouter(scoring.routing.websocket_urlpatterns))
             ),
+            "channel": ChannelNameRouter(scoring.routing.channel_routes),
         }
     )
@@ -62,6 +62,7 @@ INSTALLED_APPS = [
 
 # Middleware
 MIDDLEWARE = [
+    "core.metrics.RequestMetricsMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
@@ -119,6 +120,15 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
     ],
+    "DEFAULT_RENDERER_CLASSES": [
+        "core.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "core.parsers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
 }
 
 SIMPLE_JWT = {
@@ -218,6 +228,72 @@ else:
     }
 
 
+# Cascaded round reranks are sent to this worker channel when set
+# (`python manage.py runworker <channel>`); empty runs them inline.
+SCORING_RERANK_CHANNEL = config("SCORING_RERANK_CHANNEL", default="", cast=str)
+
+
+# Let PostgreSQL triggers maintain ClimberRoundScore on climb writes
+# (`python manage.py scoring_triggers enable`). Ignored on other databases.
+SCORING_DB_TRIGGERS = config("SCORING_DB_TRIGGERS", default=False, cast=bool)
+
+
+# Let `python manage.py results_notifier` own websocket result pushes,
+# driven by PostgreSQL notifications, instead of broadcasting in requests.
+RESULTS_PUSH_VIA_NOTIFY = config("RESULTS_PUSH_VIA_NOTIFY", default=False, cast=bool)
+
+# Rank rounds with at least this many climbers with the NumPy kernel when
+# NumPy is installed (`python manage.py scoring_benchmark` shows the cutoff).
+SCORING_NUMPY_MIN_CLIMBERS = config(
+    "SCORING_NUMPY_MIN_CLIMBERS", default=200, cast=int
+)
+
+# Seconds a rendered public competition payload stays cached. Service
+# writes retire it sooner by bumping the competition's version.
+PUBLIC_RESPONSE_CACHE_TIMEOUT = config(
+    "PUBLIC_RESPONSE_CACHE_TIMEOUT", default=600, cast=int
+)
+
+# Cache-Control max-age of public competition payloads by competition
+# status; clients revalidate with the ETag once it runs out.
+PUBLIC_CACHE_MAX_AGE = {
+    "not_started": config("PUBLIC_CACHE_MAX_AGE_NOT_STARTED", default=60, cast=int),
+    "ongoing": config("PUBLIC_CACHE_MAX_AGE_ONGOING", default=2, cast=int),
+    "finished": config("PUBLIC_CACHE_MAX_AGE_FINISHED", default=86400, cast=int),
+}
+
+# Seconds `?since=` delta reads look back past the client's version, to
+# catch rows whose transaction committed after that version was handed out.
+CHANGES_SINCE_OVERLAP_SECONDS = config(
+    "CHANGES_SINCE_OVERLAP_SECONDS", default=5, cast=int
+)
+
+# Days a soft-deleted row stays in its table before `archive_deleted`
+# moves it to the archive. Delta reads older than this are refused, since
+# the tombstones they would need may be gone.
+SOFT_DELETE_RETENTION_DAYS = config(
+    "SOFT_DELETE_RETENTION_DAYS", default=90, cast=int
+)
+
+
+# Cache
+# Shared across workers in production; the scoring coordinator keeps its
+# per-round dirty markers here.
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        },
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        },
+    }
+
+
 # AWS / S3
 AWS_ACCESS_KEY_ID = config("AWS_ACCESS_KEY_ID", cast=str)
 AWS_SECRET_ACCESS_KEY = config("AWS_SECRET_ACCESS_KEY", cast=str)
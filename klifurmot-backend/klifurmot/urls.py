@@ -33,6 +33,7 @@ urlpatterns = [
     path("api/judges/", include("judges.urls")),
     path("api/scoring/", include("scoring.urls")),
     path("api/competitions/", include("competitions.urls")),
+    path("api/metrics/", include("core.urls")),
     path("sentry-debug/", trigger_error),
 ]
 
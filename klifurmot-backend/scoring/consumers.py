@@ -1,5 +1,8 @@
+from channels.consumer import SyncConsumer
 from channels.generic.websocket import AsyncJsonWebsocketConsumer
 
+from .coordinator import request_rerank
+
 
 class ResultsConsumer(AsyncJsonWebsocketConsumer):
     group_name: str
@@ -24,3 +27,9 @@ class ResultsConsumer(AsyncJsonWebsocketConsumer):
     async def score_update(self, event):
         await self.send_json(event["data"])
 
+
+class RerankConsumer(SyncConsumer):
+    """Background worker for cascaded reranks (`manage.py runworker`)."""
+
+    def rerank_round(self, message):
+        request_rerank(message["round_id"])
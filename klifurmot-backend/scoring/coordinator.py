@@ -0,0 +1,197 @@
+"""Per-round rerank coordination.
+
+Every climb write used to rank its round inline, so a burst of judges
+scoring the same round each did the full ranking work in separate
+transactions and the last writer won with possibly stale ranks.
+
+Writers now call `request_rerank` once their transaction has committed.
+The round is marked dirty and only the worker holding the round's lock
+reranks it; writers arriving while a rerank runs just leave the dirty
+marker behind and return, and the lock holder loops until the round is
+clean. Rank writes for a round are therefore serialized and a burst of
+writes collapses to roughly one ranking pass.
+
+Rounds of a category form a chain ordered by `round_order`; each round
+uses the previous round's ranks as countback. When a rerank moves the rank
+of a climber who also has a score in the next round, that round is
+reranked too. With `SCORING_RERANK_CHANNEL` set and a channel layer
+configured the cascade is handed to a `runworker` process instead of
+running on the request path.
+"""
+
+import logging
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+
+logger = logging.getLogger(__name__)
+
+DIRTY_KEY = "scoring:round:{}:dirty"
+LOCK_KEY = "scoring:round:{}:lock"
+MARKER_TIMEOUT = 60
+
+# First half of the two-int advisory lock key, so round ids cannot collide
+# with advisory locks taken elsewhere.
+ADVISORY_LOCK_NAMESPACE = 0x4B4D
+
+
+def request_rerank(round_id: int) -> None:
+    """Mark the round dirty and rerank it unless another worker already is."""
+    dirty_key = DIRTY_KEY.format(round_id)
+    cache.set(dirty_key, True, MARKER_TIMEOUT)
+
+    cascade = False
+    while True:
+        with _round_lock(round_id) as acquired:
+            if not acquired:
+                break
+
+            reranked = False
+            while cache.get(dirty_key):
+                cache.delete(dirty_key)
+                try:
+                    cascade = _rerank(round_id) or cascade
+                except Exception:
+                    cache.set(dirty_key, True, MARKER_TIMEOUT)
+                    raise
+                reranked = True
+
+            if reranked:
+                _broadcast(round_id)
+
+        # A writer may have marked the round dirty after our last check and
+        # given up because we still held the lock; pick that up ourselves.
+        if not cache.get(dirty_key):
+            break
+
+    if cascade:
+        next_round_id = dependent_round_id(round_id)
+        if next_round_id is not None:
+            _dispatch_rerank(next_round_id)
+
+
+def dependent_round_id(round_id: int) -> Optional[int]:
+    """Return the next round in the category, whose countback uses this round."""
+    from competitions.models import CompetitionRound
+
+    current = (
+        CompetitionRound.objects.filter(id=round_id)
+        .values("competition_category_id", "round_order")
+        .first()
+    )
+    if current is None:
+        return None
+
+    return (
+        CompetitionRound.objects.filter(
+            competition_category_id=current["competition_category_id"],
+            round_order__gt=current["round_order"],
+        )
+        .order_by("round_order")
+        .values_list("id", flat=True)
+        .first()
+    )
+
+
+def _rerank(round_id: int) -> bool:
+    """Rerank the round; return whether the next round needs reranking."""
+    from competitions.models import CompetitionRound
+    from .models import ClimberRoundScore
+    from .services import _update_round_results
+
+    try:
+        round_obj = CompetitionRound.objects.select_related("competition_category").get(
+            id=round_id
+        )
+    except CompetitionRound.DoesNotExist:
+        return False
+
+    moved = _update_round_results(round_obj)
+    if not moved:
+        return False
+
+    # Only climbers who also scored in the next round use these ranks as
+    # countback, so other movement cannot change that round's standings.
+    next_round_id = dependent_round_id(round_id)
+    if next_round_id is None:
+        return False
+
+    return ClimberRoundScore.objects.filter(
+        round_id=next_round_id,
+        climber_id__in=moved,
+    ).exists()
+
+
+def _dispatch_rerank(round_id: int) -> None:
+    channel = getattr(settings, "SCORING_RERANK_CHANNEL", "")
+    channel_layer = get_channel_layer() if channel else None
+    if channel_layer is None:
+        request_rerank(round_id)
+        return
+
+    async_to_sync(channel_layer.send)(
+        channel,
+        {
+            "type": "rerank.round",
+            "round_id": round_id,
+        },
+    )
+
+
+def _broadcast(round_id: int) -> None:
+    from competitions.models import CompetitionRound
+    from .utils import BroadcastScoreUpdate
+
+    competition_id = (
+        CompetitionRound.objects.filter(id=round_id)
+        .values_list("competition_category__competition_id", flat=True)
+        .first()
+    )
+
+    if competition_id is not None:
+        BroadcastScoreUpdate(competition_id)
+
+
+@contextmanager
+def _round_lock(round_id: int) -> Iterator[bool]:
+    """Non-blocking per-round lock.
+
+    Uses a PostgreSQL session advisory lock when available so the lock dies
+    with the connection, and falls back to an atomic cache add elsewhere.
+    """
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_try_advisory_lock(%s, %s)",
+                [ADVISORY_LOCK_NAMESPACE, round_id],
+            )
+            row = cursor.fetchone()
+            acquired = row is not None and bool(row[0])
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        "SELECT pg_advisory_unlock(%s, %s)",
+                        [ADVISORY_LOCK_NAMESPACE, round_id],
+                    )
+        return
+
+    lock_key = LOCK_KEY.format(round_id)
+    acquired = cache.add(lock_key, True, MARKER_TIMEOUT)
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            cache.delete(lock_key)
+
+
+def schedule_rerank(round_id: int) -> None:
+    """Rerank the round once the current transaction commits."""
+    transaction.on_commit(lambda: request_rerank(round_id), robust=True)
@@ -0,0 +1,381 @@
+"""Discipline scoring engines.
+
+An engine turns a round's climbs into per-climber ClimberRoundScore values
+and orders those scores into ranks. Climbs are handed over as rows of
+`(climber_id, *engine.climb_fields)`, straight from `values_list`, and the
+whole round is folded in a single pass instead of one query and one
+aggregate per climber.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Sequence
+from types import SimpleNamespace
+from typing import Any, Optional
+
+from .kernels import lexsort_ranks, use_kernel
+
+NO_PREVIOUS_RANK = 9999
+
+# Scores are integer tenths of a point: 24.9 points is stored as 249.
+SCORE_SCALE = 10
+TOP_TENTHS = 25 * SCORE_SCALE
+ZONE_TENTHS = 10 * SCORE_SCALE
+PLUS_TENTHS = SCORE_SCALE // 2
+
+
+def points(tenths: int) -> float:
+    """Score in points for API output; the only place tenths become floats."""
+    return tenths / SCORE_SCALE
+
+
+class ScoringEngine(ABC):
+    discipline: str
+    # Climb columns the engine reads, in row order after climber_id.
+    climb_fields: tuple[str, ...]
+    # ClimberRoundScore columns the engine writes.
+    score_fields: tuple[str, ...]
+    # ClimberRoundScore columns rank_key reads.
+    rank_fields: tuple[str, ...]
+    # Values used for climb fields a create request leaves out.
+    climb_defaults: dict[str, Any]
+
+    @abstractmethod
+    def normalize(self, **fields: Any) -> dict[str, Any]:
+        """Validate and adjust climb input; raises ValueError."""
+
+    @abstractmethod
+    def aggregate_round(self, rows: Iterable[Sequence]) -> dict[int, dict[str, Any]]:
+        """Aggregate values for every climber in `rows`, keyed by climber id."""
+
+    @abstractmethod
+    def empty_aggregate(self) -> dict[str, Any]:
+        """Aggregate for a climber whose climbs were all deleted."""
+
+    @abstractmethod
+    def rank_key(self, score, prev_rank_map: dict[int, int]) -> tuple:
+        """Sort key of one score; a smaller key ranks higher."""
+
+    @abstractmethod
+    def key_columns(
+        self, climber_ids: Sequence[int], columns: dict, prev_rank_map: dict[int, int]
+    ) -> list:
+        """`rank_key` as one list per key component, most significant first."""
+
+    def aggregate(self, climbs: Iterable) -> dict[str, Any]:
+        """Aggregate for one climber from climb objects or namespaces."""
+        rows = [
+            (0, *(getattr(climb, name) for name in self.climb_fields))
+            for climb in climbs
+        ]
+        return self.aggregate_round(rows).get(0) or self.empty_aggregate()
+
+    def rank(self, scores: Iterable, prev_rank_map: dict[int, int]) -> list:
+        """Return [(score, rank)] in rank order; ties share a rank.
+
+        `prev_rank_map` maps climber id to the previous round's rank and
+        is used for countback.
+        """
+        scores = list(scores)
+        if use_kernel(len(scores)):
+            ranked = self.rank_columns(
+                [score.climber_id for score in scores],
+                {
+                    name: [getattr(score, name) for score in scores]
+                    for name in self.rank_fields
+                },
+                prev_rank_map,
+            )
+            return [(scores[index], rank) for index, rank in ranked]
+
+        return assign_ranks(
+            scores, key=lambda score: self.rank_key(score, prev_rank_map)
+        )
+
+    def rank_columns(
+        self, climber_ids: Sequence[int], columns: dict, prev_rank_map: dict[int, int]
+    ) -> list[tuple[int, int]]:
+        """Rank rows given as columns; returns [(row_index, rank)] in rank order.
+
+        `columns` maps each of `rank_fields` to a sequence aligned with
+        `climber_ids`, e.g. straight from `values_list`.
+        """
+        if use_kernel(len(climber_ids)):
+            result = lexsort_ranks(
+                self.key_columns(climber_ids, columns, prev_rank_map)
+            )
+            if result is not None:
+                return list(zip(*result))
+
+        rows = [
+            SimpleNamespace(
+                climber_id=climber_id,
+                **{name: columns[name][index] for name in self.rank_fields},
+            )
+            for index, climber_id in enumerate(climber_ids)
+        ]
+        return assign_ranks(
+            range(len(rows)),
+            key=lambda index: self.rank_key(rows[index], prev_rank_map),
+        )
+
+
+class BoulderEngine(ScoringEngine):
+    """
+    IFSC boulder scoring: 25 points per top and 10 per zone, minus 0.1 for
+    every extra attempt. Ranking (Annex C §7.1):
+      1. total score descending
+      2. countback to previous round rank (no group-split for klifurmot)
+      3. attempts_tops ascending
+      4. attempts_zones ascending
+    """
+
+    discipline = "boulder"
+    climb_fields = ("top_reached", "zone_reached", "attempts_top", "attempts_zone")
+    score_fields = (
+        "total_score_tenths",
+        "tops",
+        "zones",
+        "attempts_tops",
+        "attempts_zones",
+    )
+    rank_fields = ("total_score_tenths", "attempts_tops", "attempts_zones")
+    climb_defaults = {
+        "attempts_top": 0,
+        "attempts_zone": 0,
+        "top_reached": False,
+        "zone_reached": False,
+    }
+
+    def normalize(self, **fields: Any) -> dict[str, Any]:
+        """
+        Rules (matching World Climbing boulder scoring):
+          - A top implies a zone was reached on the way (so attempts_zone >= 1)
+          - attempts_top cannot be fewer than attempts_zone (you reach zone before top)
+          - If no zone was reached, attempts_zone mirrors attempts_top
+            (there's no separate "attempts to zone" count to track)
+        """
+        attempts_top = fields["attempts_top"]
+        attempts_zone = fields["attempts_zone"]
+        top_reached = fields["top_reached"]
+        zone_reached = fields["zone_reached"]
+
+        if attempts_top < 0 or attempts_zone < 0:
+            raise ValueError("Attempts cannot be negative")
+
+        if top_reached and attempts_top < 1:
+            raise ValueError("A top requires at least one attempt")
+
+        if zone_reached and attempts_zone < 1:
+            raise ValueError("Reaching a zone requires at least one zone attempt")
+
+        if top_reached and not zone_reached:
+            zone_reached = True
+
+        if top_reached and attempts_zone < 1:
+            attempts_zone = 1
+
+        if attempts_zone > attempts_top:
+            attempts_top = attempts_zone
+
+        if not zone_reached:
+            attempts_zone = attempts_top
+
+        return {
+            "attempts_top": attempts_top,
+            "attempts_zone": attempts_zone,
+            "top_reached": top_reached,
+            "zone_reached": zone_reached,
+        }
+
+    def aggregate_round(self, rows: Iterable[Sequence]) -> dict[int, dict[str, Any]]:
+        # climber_id -> [score, tops, zones, attempts_tops, attempts_zones]
+        totals: dict[int, list] = {}
+        for climber_id, top_reached, zone_reached, attempts_top, attempts_zone in rows:
+            acc = totals.get(climber_id)
+            if acc is None:
+                acc = totals[climber_id] = [0, 0, 0, 0, 0]
+            if top_reached:
+                acc[0] += TOP_TENTHS - (attempts_top - 1)
+                acc[1] += 1
+                acc[3] += attempts_top
+            elif zone_reached:
+                acc[0] += ZONE_TENTHS - (attempts_zone - 1)
+            if zone_reached:
+                acc[2] += 1
+                acc[4] += attempts_zone
+
+        return {
+            climber_id: {
+                "total_score_tenths": score,
+                "tops": tops,
+                "zones": zones,
+                "attempts_tops": attempts_tops,
+                "attempts_zones": attempts_zones,
+            }
+            for climber_id, (
+                score,
+                tops,
+                zones,
+                attempts_tops,
+                attempts_zones,
+            ) in totals.items()
+        }
+
+    def empty_aggregate(self) -> dict[str, Any]:
+        return {
+            "total_score_tenths": 0,
+            "tops": 0,
+            "zones": 0,
+            "attempts_tops": 0,
+            "attempts_zones": 0,
+        }
+
+    def rank_key(self, score, prev_rank_map: dict[int, int]) -> tuple:
+        return (
+            -score.total_score_tenths,
+            prev_rank_map.get(score.climber_id, NO_PREVIOUS_RANK),
+            score.attempts_tops,
+            score.attempts_zones,
+        )
+
+    def key_columns(
+        self, climber_ids: Sequence[int], columns: dict, prev_rank_map: dict[int, int]
+    ) -> list:
+        return [
+            [-total for total in columns["total_score_tenths"]],
+            [
+                prev_rank_map.get(climber_id, NO_PREVIOUS_RANK)
+                for climber_id in climber_ids
+            ],
+            columns["attempts_tops"],
+            columns["attempts_zones"],
+        ]
+
+
+class LeadEngine(ScoringEngine):
+    """
+    Lead scoring: a route scores the last hold controlled, plus half a hold
+    for a "+" (a valid move towards the next hold), so 12+ beats 12 and loses
+    to 13. A round's total score is the sum over its routes.
+    Ranking (IFSC lead):
+      1. total score descending
+      2. countback to previous round rank
+      3. time on the best route ascending (no time sorts last)
+    """
+
+    discipline = "lead"
+    climb_fields = ("hold_reached", "plus_modifier", "time_seconds")
+    score_fields = ("total_score_tenths", "best_hold_reached", "best_time_seconds")
+    rank_fields = ("total_score_tenths", "best_time_seconds")
+    climb_defaults = {"hold_reached": 0, "plus_modifier": False, "time_seconds": None}
+
+    def normalize(self, **fields: Any) -> dict[str, Any]:
+        hold_reached = fields["hold_reached"]
+        plus_modifier = fields["plus_modifier"]
+        time_seconds = fields["time_seconds"]
+
+        if hold_reached is None or hold_reached < 0:
+            raise ValueError("Hold reached must be zero or more")
+
+        if time_seconds is not None and time_seconds < 0:
+            raise ValueError("Time cannot be negative")
+
+        return {
+            "hold_reached": hold_reached,
+            "plus_modifier": bool(plus_modifier),
+            "time_seconds": time_seconds,
+        }
+
+    def aggregate_round(self, rows: Iterable[Sequence]) -> dict[int, dict[str, Any]]:
+        # climber_id -> [total, best_height, best_hold, best_time]
+        totals: dict[int, list] = {}
+        for climber_id, hold_reached, plus_modifier, time_seconds in rows:
+            height = (hold_reached or 0) * SCORE_SCALE + (PLUS_TENTHS if plus_modifier else 0)
+            acc = totals.get(climber_id)
+            if acc is None:
+                totals[climber_id] = [height, height, hold_reached, time_seconds]
+                continue
+            acc[0] += height
+            if height > acc[1] or (height == acc[1] and _faster(time_seconds, acc[3])):
+                acc[1], acc[2], acc[3] = height, hold_reached, time_seconds
+
+        return {
+            climber_id: {
+                "total_score_tenths": total,
+                "best_hold_reached": best_hold,
+                "best_time_seconds": best_time,
+            }
+            for climber_id, (total, _height, best_hold, best_time) in totals.items()
+        }
+
+    def empty_aggregate(self) -> dict[str, Any]:
+        return {
+            "total_score_tenths": 0,
+            "best_hold_reached": None,
+            "best_time_seconds": None,
+        }
+
+    def rank_key(self, score, prev_rank_map: dict[int, int]) -> tuple:
+        time_seconds = score.best_time_seconds
+        return (
+            -score.total_score_tenths,
+            prev_rank_map.get(score.climber_id, NO_PREVIOUS_RANK),
+            time_seconds is None,
+            time_seconds or 0,
+        )
+
+    def key_columns(
+        self, climber_ids: Sequence[int], columns: dict, prev_rank_map: dict[int, int]
+    ) -> list:
+        times = columns["best_time_seconds"]
+        return [
+            [-total for total in columns["total_score_tenths"]],
+            [
+                prev_rank_map.get(climber_id, NO_PREVIOUS_RANK)
+                for climber_id in climber_ids
+            ],
+            [time_seconds is None for time_seconds in times],
+            [time_seconds or 0 for time_seconds in times],
+        ]
+
+
+def assign_ranks(items, key):
+    """Sort items by key and give equal keys a shared (competition) rank.
+
+    Returns a list of (item, rank) in rank order.
+    """
+    keyed = sorted(((key(item), item) for item in items), key=lambda pair: pair[0])
+
+    ranked = []
+    previous_key = None
+    previous_rank = 0
+    for position, (item_key, item) in enumerate(keyed, start=1):
+        if previous_key is not None and item_key == previous_key:
+            assigned_rank = previous_rank
+        else:
+            assigned_rank = position
+            previous_rank = position
+            previous_key = item_key
+        ranked.append((item, assigned_rank))
+
+    return ranked
+
+
+def _faster(time_seconds: Optional[int], best: Optional[int]) -> bool:
+    return time_seconds is not None and (best is None or time_seconds < best)
+
+
+ENGINES: dict[str, ScoringEngine] = {
+    engine.discipline: engine for engine in (BoulderEngine(), LeadEngine())
+}
+
+
+def get_engine(discipline: Optional[str]) -> ScoringEngine:
+    try:
+        return ENGINES[discipline or "boulder"]
+    except KeyError:
+        raise ValueError(f"No scoring engine for discipline '{discipline}'")
+
+
+def engine_for_round(round_obj) -> ScoringEngine:
+    return get_engine(round_obj.competition_category.competition.discipline)
@@ -0,0 +1,84 @@
+from typing import Any, Optional
+
+from django.db import models
+
+from .models import Climb, ClimbEvent
+
+CLIMB_STATE_FIELDS = (
+    "attempts_top",
+    "attempts_zone",
+    "top_reached",
+    "zone_reached",
+    "hold_reached",
+    "plus_modifier",
+    "time_seconds",
+)
+
+
+def climb_state(climb: Climb) -> dict[str, Any]:
+    return {field: getattr(climb, field) for field in CLIMB_STATE_FIELDS}
+
+
+def record_climb_event(
+    action: str,
+    climb: Climb,
+    before: Optional[dict[str, Any]],
+    judge,
+) -> ClimbEvent:
+    """Append a climb event; call inside the transaction that wrote the climb.
+
+    `climb.route` must have `round__competition_category` loaded.
+    """
+    round_obj = climb.route.round
+
+    return ClimbEvent.objects.create(
+        climb_id=climb.pk,
+        climber_id=climb.climber_id,  # pyright: ignore[reportAttributeAccessIssue]
+        route_id=climb.route.pk,
+        round_id=round_obj.pk,
+        competition_id=round_obj.competition_category.competition_id,
+        action=action,
+        before=before,
+        after=None if action == ClimbEvent.DELETE else climb_state(climb),
+        judge=judge,
+    )
+
+
+def record_cascade_events(climbs: models.QuerySet, deleted: bool, judge) -> None:
+    """Append a delete event for every climb in `climbs` a cascade
+    soft-deletes, or a create event for every one it restores.
+
+    Reads the climbs once and inserts their events in one batch.
+    """
+    action = ClimbEvent.DELETE if deleted else ClimbEvent.CREATE
+    events = []
+    for (
+        climb_id,
+        climber_id,
+        route_id,
+        round_id,
+        competition_id,
+        *values,
+    ) in climbs.order_by().values_list(
+        "id",
+        "climber_id",
+        "route_id",
+        "route__round_id",
+        "route__round__competition_category__competition_id",
+        *CLIMB_STATE_FIELDS,
+    ):
+        state = dict(zip(CLIMB_STATE_FIELDS, values))
+        events.append(
+            ClimbEvent(
+                climb_id=climb_id,
+                climber_id=climber_id,
+                route_id=route_id,
+                round_id=round_id,
+                competition_id=competition_id,
+                action=action,
+                before=state if deleted else None,
+                after=None if deleted else state,
+                judge=judge,
+            )
+        )
+    ClimbEvent.objects.bulk_create(events)
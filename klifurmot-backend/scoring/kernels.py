@@ -0,0 +1,59 @@
+"""Optional NumPy ranking kernel.
+
+NumPy is not a hard dependency; without it, or for rounds smaller than
+SCORING_NUMPY_MIN_CLIMBERS, engines rank with the plain Python path.
+"""
+
+from collections.abc import Sequence
+from typing import Optional
+
+from django.conf import settings
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+
+def numpy_available() -> bool:
+    return np is not None
+
+
+def use_kernel(size: int) -> bool:
+    return np is not None and size >= settings.SCORING_NUMPY_MIN_CLIMBERS
+
+
+def lexsort_ranks(keys: Sequence) -> Optional[tuple[list[int], list[int]]]:
+    """Sort rows by `keys` (most significant first) and assign shared ranks.
+
+    Returns (order, ranks) as lists: `order` holds row indices in rank order
+    and `ranks[i]` is the rank of row `order[i]`. Equal keys keep their input
+    order and share the rank of the first of them, matching `assign_ranks`.
+    Returns None when a key holds values the kernel cannot compare exactly,
+    so callers fall back to Python.
+    """
+    assert np is not None
+
+    if not len(keys[0]):
+        return [], []
+
+    # Keys are integers (scores are stored in tenths), so comparisons are
+    # exact; anything else, such as a None, is left to Python.
+    columns = np.array(keys)
+    if columns.dtype.kind not in "biu":
+        return None
+
+    size = columns.shape[1]
+
+    # np.lexsort treats the last key as primary and is stable.
+    order = np.lexsort(columns[::-1])
+    ordered = columns[:, order]
+
+    starts = np.empty(size, dtype=bool)
+    starts[0] = True
+    starts[1:] = (ordered[:, 1:] != ordered[:, :-1]).any(axis=0)
+
+    positions = np.arange(1, size + 1)
+    ranks = np.maximum.accumulate(np.where(starts, positions, 0))
+
+    return order.tolist(), ranks.tolist()
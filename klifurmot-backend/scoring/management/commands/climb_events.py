@@ -0,0 +1,67 @@
+import json
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_datetime
+
+from competitions.models import Competition
+from scoring import replay
+from scoring.utils import BroadcastScoreUpdate
+
+
+class Command(BaseCommand):
+    help = "Backfill, replay or snapshot the climb event log of a competition"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "action", choices=["backfill", "replay", "snapshot", "as-of"]
+        )
+        parser.add_argument("competition", type=int)
+        parser.add_argument(
+            "--at",
+            help="ISO timestamp for as-of, e.g. 2025-05-01T14:30:00+00:00",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=replay.DEFAULT_BATCH_SIZE,
+            help="Rows per streamed read and bulk write",
+        )
+
+    def handle(self, *args, **options):
+        competition_id = options["competition"]
+        if not Competition.objects.filter(id=competition_id).exists():
+            raise CommandError(f"Competition with id {competition_id} not found")
+
+        action = options["action"]
+        batch_size = options["batch_size"]
+        started = time.monotonic()
+
+        if action == "backfill":
+            count = replay.backfill_events(competition_id, batch_size=batch_size)
+            self.stdout.write(self.style.SUCCESS(f"Recorded {count} create events"))
+        elif action == "replay":
+            stats = replay.replay_competition(competition_id, batch_size=batch_size)
+            BroadcastScoreUpdate(competition_id)
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Replayed {stats['climbs']} climbs in "
+                    f"{time.monotonic() - started:.2f}s: "
+                    f"{stats['scores_created']} scores created, "
+                    f"{stats['scores_updated']} updated, "
+                    f"{stats['ranks_changed']} ranks changed"
+                )
+            )
+        elif action == "snapshot":
+            snapshot = replay.take_snapshot(competition_id, batch_size=batch_size)
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Snapshot {snapshot.pk} up to event {snapshot.last_event_id}"
+                )
+            )
+        else:
+            at = parse_datetime(options["at"] or "")
+            if at is None:
+                raise CommandError("as-of requires --at with an ISO timestamp")
+            results = replay.results_as_of(competition_id, at)
+            self.stdout.write(json.dumps(results, indent=2, default=str))
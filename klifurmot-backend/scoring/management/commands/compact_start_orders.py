@@ -0,0 +1,36 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from scoring import ordering
+
+
+class Command(BaseCommand):
+    help = (
+        "Write moved start list entries back as integer start orders; "
+        "safe to run on a schedule"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--round",
+            type=int,
+            help="Compact only this round instead of every round with moves",
+        )
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        round_ids = (
+            [options["round"]] if options["round"] else ordering.rounds_to_compact()
+        )
+
+        rewritten = 0
+        for round_id in round_ids:
+            rewritten += ordering.compact(round_id)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Compacted {len(round_ids)} rounds, rewrote {rewritten} entries "
+                f"in {time.monotonic() - started:.2f}s"
+            )
+        )
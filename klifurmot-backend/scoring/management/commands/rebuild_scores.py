@@ -0,0 +1,178 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import django
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+
+from competitions.models import CompetitionRound
+from scoring import rebuild
+from scoring.utils import BroadcastScoreUpdate
+
+
+def _init_worker():
+    if not apps.ready:
+        django.setup()
+    # Never reuse a connection inherited from the parent process.
+    connections.close_all()
+
+
+class _InlineFuture:
+    def __init__(self, fn, args):
+        self._fn = fn
+        self._args = args
+
+    def result(self):
+        return self._fn(*self._args)
+
+
+class _InlineExecutor:
+    """Runs partitions in-process; used for one worker and for SQLite."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def submit(self, fn, *args):
+        return _InlineFuture(fn, args)
+
+
+class Command(BaseCommand):
+    help = "Recompute ClimberRoundScore and RoundResult ranks from climbs"
+
+    def add_arguments(self, parser):
+        target = parser.add_mutually_exclusive_group(required=True)
+        target.add_argument(
+            "--competition",
+            type=int,
+            action="append",
+            help="Competition id; repeat for several competitions",
+        )
+        target.add_argument(
+            "--season", type=int, help="Every competition starting in this year"
+        )
+        target.add_argument(
+            "--all", action="store_true", help="Every active competition"
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Worker processes (default: CPU count)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Print the changes instead of writing them",
+        )
+
+    def handle(self, *args, **options):
+        chains = rebuild.select_rounds(
+            competition_ids=options["competition"], season=options["season"]
+        )
+        round_ids = [round_id for chain in chains.values() for round_id in chain]
+        if not round_ids:
+            raise CommandError("No rounds match the selection")
+
+        dry_run = options["dry_run"]
+        workers = max(1, options["workers"])
+        if connection.vendor == "sqlite":
+            workers = 1
+
+        started = time.monotonic()
+        self.stdout.write(
+            f"Rebuilding {len(round_ids)} rounds in {len(chains)} categories "
+            f"with {workers} worker{'s' if workers != 1 else ''}"
+            + (" (dry run)" if dry_run else "")
+        )
+
+        if workers == 1:
+            executor = _InlineExecutor()
+        else:
+            # Forked workers must not share the parent's socket.
+            connections.close_all()
+            executor = ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker
+            )
+
+        with executor:
+            scores = self._run_phase(
+                executor,
+                "scores",
+                [
+                    executor.submit(rebuild.rebuild_round_scores, round_id, dry_run)
+                    for round_id in round_ids
+                ],
+                len(round_ids),
+                started,
+            )
+            scores_by_round = {result.round_id: result.scores for result in scores}
+
+            ranks = self._run_phase(
+                executor,
+                "ranks",
+                [
+                    executor.submit(
+                        rebuild.rebuild_category_ranks,
+                        chain,
+                        {round_id: scores_by_round[round_id] for round_id in chain},
+                        dry_run,
+                    )
+                    for chain in chains.values()
+                ],
+                len(round_ids),
+                started,
+            )
+
+        if dry_run:
+            for result in [*scores, *ranks]:
+                for line in result.diff:
+                    self.stdout.write(line)
+
+        elapsed = time.monotonic() - started
+        climbs = sum(result.climbs for result in scores)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{'Would change' if dry_run else 'Changed'} "
+                f"{sum(r.created for r in scores)} new and "
+                f"{sum(r.updated for r in scores)} updated scores, "
+                f"{sum(r.rank_changes for r in ranks)} ranks; "
+                f"{climbs} climbs in {elapsed:.2f}s "
+                f"({climbs / elapsed if elapsed else 0:.0f} climbs/s)"
+            )
+        )
+
+        if not dry_run:
+            competition_ids = set(
+                CompetitionRound.objects.filter(id__in=round_ids).values_list(
+                    "competition_category__competition_id", flat=True
+                )
+            )
+            for competition_id in competition_ids:
+                BroadcastScoreUpdate(competition_id)
+
+    def _run_phase(self, executor, name, futures, total_rounds, started):
+        results = []
+        report_every = max(1, total_rounds // 20)
+        next_report = report_every
+
+        if not isinstance(executor, _InlineExecutor):
+            futures = as_completed(futures)
+
+        for future in futures:
+            result = future.result()
+            results.extend(result if isinstance(result, list) else [result])
+            done_rounds = len(results)
+            if done_rounds >= next_report or done_rounds == total_rounds:
+                elapsed = time.monotonic() - started
+                self.stdout.write(
+                    f"  {name}: {done_rounds}/{total_rounds} rounds "
+                    f"({done_rounds / elapsed if elapsed else 0:.1f} rounds/s)"
+                )
+                next_report = done_rounds + report_every
+
+        return results
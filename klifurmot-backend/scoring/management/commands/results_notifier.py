@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from scoring.notifier import ResultsNotifier
+from scoring.utils import send_results
+
+
+class Command(BaseCommand):
+    help = "Push result updates to websocket clients from PostgreSQL notifications"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--debounce",
+            type=float,
+            default=0.5,
+            help="Seconds a competition must be quiet before pushing",
+        )
+        parser.add_argument(
+            "--max-delay",
+            type=float,
+            default=2.0,
+            help="Longest a busy competition waits for a push",
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            raise CommandError("The results notifier requires PostgreSQL")
+
+        notifier = ResultsNotifier(
+            send=send_results,
+            debounce=options["debounce"],
+            max_delay=options["max_delay"],
+        )
+
+        self.stdout.write("Listening for result changes")
+        try:
+            notifier.run_forever()
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,138 @@
+import time
+import tracemalloc
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from competitions.models import Competition, CompetitionRound
+from competitions.services import get_competition_results, get_competition_startlist
+from scoring.models import Climb, RoundResult
+from scoring.services import (
+    _update_round_results,
+    list_climbs,
+    list_scores,
+    list_startlist,
+)
+from scoring.utils import UpdateRoundScoreForRoute
+
+
+class Rollback(Exception):
+    pass
+
+
+class QueryTimer:
+    """Execute wrapper counting statements and the time spent in them."""
+
+    def __init__(self):
+        self.queries = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.seconds += time.perf_counter() - started
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure queries, SQL time and Python allocations of the scoring read "
+        "and write paths against an existing competition; KiB/1k climbers "
+        "scales peak allocations by the climbers on its start lists"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--competition", type=int, required=True)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument(
+            "--climbs",
+            type=int,
+            default=50,
+            help="Climbs rescored per run of the per-climb aggregate",
+        )
+
+    def handle(self, *args, **options):
+        competition_id = options["competition"]
+        if not Competition.objects.filter(id=competition_id).exists():
+            raise CommandError(f"Competition {competition_id} not found")
+
+        rounds = list(
+            CompetitionRound.objects.filter(
+                competition_category__competition_id=competition_id
+            ).order_by("competition_category_id", "round_order")
+        )
+        if not rounds:
+            raise CommandError(f"Competition {competition_id} has no rounds")
+        climbs = list(
+            Climb.objects.filter(route__round__in=rounds)
+            .select_related("climber", "route__round")
+            .order_by("id")[: options["climbs"]]
+        )
+
+        climbers = (
+            RoundResult.objects.filter(round__in=rounds)
+            .values("climber_id")
+            .distinct()
+            .count()
+        )
+
+        paths = [
+            ("competition results", lambda: get_competition_results(competition_id)),
+            (
+                "competition startlist",
+                lambda: get_competition_startlist(competition_id),
+            ),
+            ("list_scores", lambda: [list_scores(r.pk) for r in rounds]),
+            ("list_climbs", lambda: [list_climbs(r.pk) for r in rounds]),
+            ("list_startlist", lambda: [list_startlist(r.pk) for r in rounds]),
+            ("rerank rounds", lambda: [_update_round_results(r) for r in rounds]),
+            (
+                f"rescore {len(climbs)} climbs",
+                lambda: [UpdateRoundScoreForRoute(climb) for climb in climbs],
+            ),
+        ]
+
+        self.stdout.write(
+            f"{'path':<22} {'queries':>8} {'sql ms':>8} {'wall ms':>8} "
+            f"{'peak KiB':>9} {'KiB/1k climbers':>16}"
+        )
+        for name, fn in paths:
+            queries, sql_ms, wall_ms, peak = self._measure(fn, options["repeat"])
+            self.stdout.write(
+                f"{name:<22} {queries:>8} {sql_ms:>8.1f} {wall_ms:>8.1f} "
+                f"{peak / 1024:>9.0f} {peak / 1024 * 1000 / max(climbers, 1):>16.0f}"
+            )
+
+    def _measure(self, fn, repeat):
+        """Queries, SQL and wall time of the fastest of `repeat` runs, plus
+        the peak traced allocation of one more run. Writes are rolled back
+        after every run.
+        """
+        best = None
+        for _ in range(repeat):
+            timer = QueryTimer()
+            with connection.execute_wrapper(timer):
+                started = time.perf_counter()
+                self._rolled_back(fn)
+                wall_ms = (time.perf_counter() - started) * 1000
+            if best is None or wall_ms < best[2]:
+                best = (timer.queries, timer.seconds * 1000, wall_ms)
+        if best is None:
+            raise CommandError("--repeat must be at least 1")
+
+        tracemalloc.start()
+        self._rolled_back(fn)
+        _current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        return (*best, peak)
+
+    def _rolled_back(self, fn):
+        try:
+            with transaction.atomic():
+                fn()
+                raise Rollback
+        except Rollback:
+            pass
@@ -0,0 +1,157 @@
+import random
+import timeit
+from collections import defaultdict
+from types import SimpleNamespace
+
+from django.core.management.base import BaseCommand
+
+from scoring.engines import ENGINES, assign_ranks
+from scoring.kernels import lexsort_ranks, numpy_available
+
+
+def synthetic_round(engine, climbers, routes, seed=0):
+    """Rows of (climber_id, *engine.climb_fields) for a random round."""
+    rng = random.Random(seed)
+    rows = []
+    for climber_id in range(1, climbers + 1):
+        for _route in range(routes):
+            if engine.discipline == "lead":
+                rows.append(
+                    (
+                        climber_id,
+                        rng.randint(0, 40),
+                        rng.random() < 0.3,
+                        rng.choice([None, rng.randint(60, 360)]),
+                    )
+                )
+            else:
+                top = rng.random() < 0.4
+                zone = top or rng.random() < 0.5
+                attempts_zone = rng.randint(1, 4) if zone else 0
+                attempts_top = max(attempts_zone, rng.randint(1, 6)) if top else 0
+                rows.append((climber_id, top, zone, attempts_top, attempts_zone))
+    return rows
+
+
+def per_climber(engine, rows, prev_rank_map):
+    """The old path: one aggregate per climber from climb objects."""
+    climbs = defaultdict(list)
+    for climber_id, *values in rows:
+        climbs[climber_id].append(
+            SimpleNamespace(**dict(zip(engine.climb_fields, values)))
+        )
+    scores = [
+        SimpleNamespace(climber_id=climber_id, **engine.aggregate(climber_climbs))
+        for climber_id, climber_climbs in climbs.items()
+    ]
+    return engine.rank(scores, prev_rank_map)
+
+
+def batched(engine, rows, prev_rank_map):
+    return engine.rank(batched_scores(engine, rows), prev_rank_map)
+
+
+def synthetic_scores(engine, climbers, seed=0):
+    """(climber_ids, columns) of a round's scores, as `values_list` returns them."""
+    scores = batched_scores(engine, synthetic_round(engine, climbers, 5, seed))
+    climber_ids = [score.climber_id for score in scores]
+    columns = {
+        name: [getattr(score, name) for score in scores] for name in engine.rank_fields
+    }
+    return scores, climber_ids, columns
+
+
+def batched_scores(engine, rows):
+    return [
+        SimpleNamespace(climber_id=climber_id, **values)
+        for climber_id, values in engine.aggregate_round(rows).items()
+    ]
+
+
+def python_rank(engine, scores, prev_rank_map):
+    return assign_ranks(scores, key=lambda score: engine.rank_key(score, prev_rank_map))
+
+
+def kernel_rank(engine, climber_ids, columns, prev_rank_map):
+    return lexsort_ranks(engine.key_columns(climber_ids, columns, prev_rank_map))
+
+
+class Command(BaseCommand):
+    help = "Time round aggregation and ranking for each scoring engine"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--climbers",
+            default="50,200,1000",
+            help="Comma separated climbers per round",
+        )
+        parser.add_argument("--routes", type=int, default=5)
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args, **options):
+        sizes = [int(size) for size in options["climbers"].split(",") if size]
+        repeat = options["repeat"]
+
+        self._aggregation(sizes, options["routes"], repeat)
+        self.stdout.write("")
+        self._ranking(sizes, repeat)
+
+    def _time(self, fn, repeat):
+        return min(timeit.repeat(fn, number=1, repeat=repeat)) * 1000
+
+    def _aggregation(self, sizes, routes, repeat):
+        self.stdout.write("Aggregate and rank a round")
+        self.stdout.write(
+            f"{'engine':<8} {'climbers':>8} {'per-climber ms':>15} "
+            f"{'batched ms':>11} {'speedup':>8}"
+        )
+        for engine in ENGINES.values():
+            for climbers in sizes:
+                rows = synthetic_round(engine, climbers, routes)
+                prev_rank_map = {
+                    climber_id: climber_id for climber_id in range(1, climbers + 1)
+                }
+
+                timings = {
+                    name: self._time(lambda: fn(engine, rows, prev_rank_map), repeat)
+                    for name, fn in (("per_climber", per_climber), ("batched", batched))
+                }
+
+                self.stdout.write(
+                    f"{engine.discipline:<8} {climbers:>8} "
+                    f"{timings['per_climber']:>15.2f} {timings['batched']:>11.2f} "
+                    f"{timings['per_climber'] / timings['batched']:>7.1f}x"
+                )
+
+    def _ranking(self, sizes, repeat):
+        self.stdout.write("Rank a scored round")
+        if not numpy_available():
+            self.stdout.write("NumPy is not installed; only the Python path is timed")
+        self.stdout.write(
+            f"{'engine':<8} {'climbers':>8} {'python ms':>10} "
+            f"{'numpy ms':>9} {'speedup':>8}"
+        )
+        for engine in ENGINES.values():
+            for climbers in sizes:
+                scores, climber_ids, columns = synthetic_scores(engine, climbers)
+                prev_rank_map = {
+                    climber_id: climber_id % 50 for climber_id in climber_ids[::2]
+                }
+
+                python_ms = self._time(
+                    lambda: python_rank(engine, scores, prev_rank_map), repeat
+                )
+                if numpy_available():
+                    numpy_ms = self._time(
+                        lambda: kernel_rank(
+                            engine, climber_ids, columns, prev_rank_map
+                        ),
+                        repeat,
+                    )
+                    kernel = f"{numpy_ms:>9.3f} {python_ms / numpy_ms:>7.1f}x"
+                else:
+                    kernel = f"{'-':>9} {'-':>8}"
+
+                self.stdout.write(
+                    f"{engine.discipline:<8} {climbers:>8} {python_ms:>10.3f} {kernel}"
+                )
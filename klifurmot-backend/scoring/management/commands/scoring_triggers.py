@@ -0,0 +1,58 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from scoring import triggers
+
+
+class Command(BaseCommand):
+    help = "Inspect, toggle or rebuild the PostgreSQL ClimberRoundScore trigger"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "action", choices=["status", "enable", "disable", "rebuild"]
+        )
+        parser.add_argument(
+            "--competition",
+            type=int,
+            help="Limit rebuild to a single competition",
+        )
+
+    def handle(self, *args, **options):
+        if not triggers.triggers_supported():
+            raise CommandError("Score triggers are only available on PostgreSQL")
+
+        state = triggers.trigger_enabled()
+        if state is None:
+            raise CommandError(
+                "Score trigger is not installed; run `manage.py migrate scoring`"
+            )
+
+        action = options["action"]
+        setting = bool(getattr(settings, "SCORING_DB_TRIGGERS", False))
+
+        if action == "status":
+            self.stdout.write(
+                f"Trigger {'enabled' if state else 'disabled'}, "
+                f"SCORING_DB_TRIGGERS={setting}"
+            )
+        elif action in ("enable", "disable"):
+            enabled = action == "enable"
+            with transaction.atomic():
+                triggers.set_trigger_enabled(enabled)
+                if enabled:
+                    # Bring existing aggregates in line before the trigger
+                    # becomes the only writer.
+                    triggers.rebuild_scores()
+            self.stdout.write(self.style.SUCCESS(f"Trigger {action}d"))
+            if enabled != setting:
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"Set SCORING_DB_TRIGGERS={enabled} so the services "
+                        "match the trigger state"
+                    )
+                )
+        else:
+            with transaction.atomic():
+                count = triggers.rebuild_scores(options["competition"])
+            self.stdout.write(self.style.SUCCESS(f"Rebuilt {count} round scores"))
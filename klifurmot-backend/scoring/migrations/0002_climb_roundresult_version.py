@@ -0,0 +1,23 @@
+# Generated by Django 5.2.1 on 2026-10-19 02:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scoring', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='climb',
+            name='version',
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name='roundresult',
+            name='version',
+            field=models.PositiveIntegerField(default=1),
+        ),
+    ]
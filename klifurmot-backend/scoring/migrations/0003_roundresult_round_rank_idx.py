@@ -0,0 +1,21 @@
+# Generated by Django 5.2.1 on 2026-10-19 02:18
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('athletes', '0001_initial'),
+        ('competitions', '0002_competition_discipline'),
+        ('scoring', '0002_climb_roundresult_version'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='roundresult',
+            index=models.Index(fields=['round', 'deleted', 'rank'], name='roundresult_round_rank_idx'),
+        ),
+    ]
@@ -0,0 +1,131 @@
+from django.db import migrations
+
+# Keeps scoring_climberroundscore in step with scoring_climb inside the same
+# statement. Installed disabled; `manage.py scoring_triggers enable` turns it
+# on together with the SCORING_DB_TRIGGERS setting. PostgreSQL only.
+
+CREATE_SQL = """
+CREATE OR REPLACE FUNCTION scoring_recompute_climber_round_score(
+    p_climber_id bigint, p_round_id bigint
+) RETURNS void AS $$
+DECLARE
+    v_total numeric(5, 2);
+    v_tops integer;
+    v_zones integer;
+    v_attempts_tops integer;
+    v_attempts_zones integer;
+BEGIN
+    IF p_climber_id IS NULL OR p_round_id IS NULL THEN
+        RETURN;
+    END IF;
+
+    SELECT
+        ROUND(COALESCE(SUM(
+            CASE
+                WHEN c.top_reached THEN 25 - 0.1 * (c.attempts_top - 1)
+                WHEN c.zone_reached THEN 10 - 0.1 * (c.attempts_zone - 1)
+                ELSE 0
+            END
+        ), 0), 1),
+        COUNT(*) FILTER (WHERE c.top_reached),
+        COUNT(*) FILTER (WHERE c.zone_reached),
+        COALESCE(SUM(c.attempts_top) FILTER (WHERE c.top_reached), 0),
+        COALESCE(SUM(c.attempts_zone) FILTER (WHERE c.zone_reached), 0)
+    INTO v_total, v_tops, v_zones, v_attempts_tops, v_attempts_zones
+    FROM scoring_climb c
+    JOIN competitions_route r ON r.id = c.route_id
+    WHERE c.climber_id = p_climber_id
+      AND r.round_id = p_round_id
+      AND NOT c.deleted;
+
+    LOOP
+        UPDATE scoring_climberroundscore
+        SET total_score = v_total,
+            tops = v_tops,
+            zones = v_zones,
+            attempts_tops = v_attempts_tops,
+            attempts_zones = v_attempts_zones,
+            last_modified_at = now()
+        WHERE climber_id = p_climber_id
+          AND round_id = p_round_id
+          AND NOT deleted;
+
+        IF FOUND THEN
+            RETURN;
+        END IF;
+
+        BEGIN
+            INSERT INTO scoring_climberroundscore (
+                round_id, climber_id, total_score, tops, zones,
+                attempts_tops, attempts_zones, created_at, last_modified_at,
+                deleted
+            ) VALUES (
+                p_round_id, p_climber_id, v_total, v_tops, v_zones,
+                v_attempts_tops, v_attempts_zones, now(), now(), false
+            );
+            RETURN;
+        EXCEPTION WHEN unique_violation THEN
+            -- A concurrent writer inserted the row first; update it instead.
+        END;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION scoring_climb_refresh_score() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM scoring_recompute_climber_round_score(
+            OLD.climber_id,
+            (SELECT round_id FROM competitions_route WHERE id = OLD.route_id)
+        );
+    END IF;
+
+    IF TG_OP = 'INSERT' OR (
+        TG_OP = 'UPDATE'
+        AND (NEW.climber_id, NEW.route_id) IS DISTINCT FROM (OLD.climber_id, OLD.route_id)
+    ) THEN
+        PERFORM scoring_recompute_climber_round_score(
+            NEW.climber_id,
+            (SELECT round_id FROM competitions_route WHERE id = NEW.route_id)
+        );
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS scoring_climb_score_trg ON scoring_climb;
+CREATE TRIGGER scoring_climb_score_trg
+    AFTER INSERT OR UPDATE OR DELETE ON scoring_climb
+    FOR EACH ROW EXECUTE FUNCTION scoring_climb_refresh_score();
+ALTER TABLE scoring_climb DISABLE TRIGGER scoring_climb_score_trg;
+"""
+
+DROP_SQL = """
+DROP TRIGGER IF EXISTS scoring_climb_score_trg ON scoring_climb;
+DROP FUNCTION IF EXISTS scoring_climb_refresh_score();
+DROP FUNCTION IF EXISTS scoring_recompute_climber_round_score(bigint, bigint);
+"""
+
+
+def create_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(CREATE_SQL)
+
+
+def drop_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(DROP_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scoring', '0003_roundresult_round_rank_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigger, drop_trigger),
+    ]
@@ -0,0 +1,91 @@
+from django.db import migrations
+
+# Row triggers that announce result changes on the `klifurmot_results`
+# channel so `manage.py results_notifier` can push them to spectators no
+# matter which code path wrote the row. PostgreSQL only.
+
+CREATE_SQL = """
+CREATE OR REPLACE FUNCTION scoring_notify_results() RETURNS trigger AS $$
+DECLARE
+    v_row record;
+    v_round_id bigint;
+    v_competition_id bigint;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        v_row := OLD;
+    ELSE
+        v_row := NEW;
+    END IF;
+
+    IF TG_TABLE_NAME = 'scoring_climb' THEN
+        SELECT round_id INTO v_round_id
+        FROM competitions_route WHERE id = v_row.route_id;
+    ELSE
+        v_round_id := v_row.round_id;
+    END IF;
+
+    SELECT cc.competition_id INTO v_competition_id
+    FROM competitions_competitionround cr
+    JOIN competitions_competitioncategory cc ON cc.id = cr.competition_category_id
+    WHERE cr.id = v_round_id;
+
+    IF v_competition_id IS NOT NULL THEN
+        -- Identical payloads within one transaction are delivered once.
+        PERFORM pg_notify(
+            'klifurmot_results',
+            json_build_object(
+                'round_id', v_round_id,
+                'competition_id', v_competition_id
+            )::text
+        );
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS scoring_climb_notify_trg ON scoring_climb;
+CREATE TRIGGER scoring_climb_notify_trg
+    AFTER INSERT OR UPDATE OR DELETE ON scoring_climb
+    FOR EACH ROW EXECUTE FUNCTION scoring_notify_results();
+
+DROP TRIGGER IF EXISTS scoring_roundresult_notify_trg ON scoring_roundresult;
+CREATE TRIGGER scoring_roundresult_notify_trg
+    AFTER INSERT OR UPDATE OR DELETE ON scoring_roundresult
+    FOR EACH ROW EXECUTE FUNCTION scoring_notify_results();
+
+DROP TRIGGER IF EXISTS scoring_climberroundscore_notify_trg ON scoring_climberroundscore;
+CREATE TRIGGER scoring_climberroundscore_notify_trg
+    AFTER INSERT OR UPDATE OR DELETE ON scoring_climberroundscore
+    FOR EACH ROW EXECUTE FUNCTION scoring_notify_results();
+"""
+
+DROP_SQL = """
+DROP TRIGGER IF EXISTS scoring_climb_notify_trg ON scoring_climb;
+DROP TRIGGER IF EXISTS scoring_roundresult_notify_trg ON scoring_roundresult;
+DROP TRIGGER IF EXISTS scoring_climberroundscore_notify_trg ON scoring_climberroundscore;
+DROP FUNCTION IF EXISTS scoring_notify_results();
+"""
+
+
+def create_triggers(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(CREATE_SQL)
+
+
+def drop_triggers(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(DROP_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scoring', '0004_climberroundscore_trigger'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_triggers, drop_triggers),
+    ]
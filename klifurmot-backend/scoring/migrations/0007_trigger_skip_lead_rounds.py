@@ -0,0 +1,108 @@
+from django.db import migrations
+
+# The trigger only knows the boulder formula; lead rounds are scored by
+# scoring.engines.LeadEngine in Python, so the recompute must leave them alone.
+
+RECOMPUTE_SQL = """
+CREATE OR REPLACE FUNCTION scoring_recompute_climber_round_score(
+    p_climber_id bigint, p_round_id bigint
+) RETURNS void AS $$
+DECLARE
+    v_total numeric(5, 2);
+    v_tops integer;
+    v_zones integer;
+    v_attempts_tops integer;
+    v_attempts_zones integer;
+BEGIN
+    IF p_climber_id IS NULL OR p_round_id IS NULL THEN
+        RETURN;
+    END IF;
+{guard}
+    SELECT
+        ROUND(COALESCE(SUM(
+            CASE
+                WHEN c.top_reached THEN 25 - 0.1 * (c.attempts_top - 1)
+                WHEN c.zone_reached THEN 10 - 0.1 * (c.attempts_zone - 1)
+                ELSE 0
+            END
+        ), 0), 1),
+        COUNT(*) FILTER (WHERE c.top_reached),
+        COUNT(*) FILTER (WHERE c.zone_reached),
+        COALESCE(SUM(c.attempts_top) FILTER (WHERE c.top_reached), 0),
+        COALESCE(SUM(c.attempts_zone) FILTER (WHERE c.zone_reached), 0)
+    INTO v_total, v_tops, v_zones, v_attempts_tops, v_attempts_zones
+    FROM scoring_climb c
+    JOIN competitions_route r ON r.id = c.route_id
+    WHERE c.climber_id = p_climber_id
+      AND r.round_id = p_round_id
+      AND NOT c.deleted;
+
+    LOOP
+        UPDATE scoring_climberroundscore
+        SET total_score = v_total,
+            tops = v_tops,
+            zones = v_zones,
+            attempts_tops = v_attempts_tops,
+            attempts_zones = v_attempts_zones,
+            last_modified_at = now()
+        WHERE climber_id = p_climber_id
+          AND round_id = p_round_id
+          AND NOT deleted;
+
+        IF FOUND THEN
+            RETURN;
+        END IF;
+
+        BEGIN
+            INSERT INTO scoring_climberroundscore (
+                round_id, climber_id, total_score, tops, zones,
+                attempts_tops, attempts_zones, created_at, last_modified_at,
+                deleted
+            ) VALUES (
+                p_round_id, p_climber_id, v_total, v_tops, v_zones,
+                v_attempts_tops, v_attempts_zones, now(), now(), false
+            );
+            RETURN;
+        EXCEPTION WHEN unique_violation THEN
+            -- A concurrent writer inserted the row first; update it instead.
+        END;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+LEAD_GUARD = """
+    IF (
+        SELECT comp.discipline
+        FROM competitions_competitionround cr
+        JOIN competitions_competitioncategory cc
+            ON cc.id = cr.competition_category_id
+        JOIN competitions_competition comp ON comp.id = cc.competition_id
+        WHERE cr.id = p_round_id
+    ) IS DISTINCT FROM 'boulder' THEN
+        RETURN;
+    END IF;
+"""
+
+
+def skip_lead_rounds(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(RECOMPUTE_SQL.replace("{guard}", LEAD_GUARD))
+
+
+def score_all_rounds(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(RECOMPUTE_SQL.replace("{guard}", ""))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scoring', '0006_climbevent'),
+    ]
+
+    operations = [
+        migrations.RunPython(skip_lead_rounds, score_all_rounds),
+    ]
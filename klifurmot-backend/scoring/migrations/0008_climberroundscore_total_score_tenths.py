@@ -0,0 +1,136 @@
+from importlib import import_module
+
+from django.db import migrations, models
+from django.db.models import F, IntegerField
+from django.db.models.functions import Cast, Round
+
+# Scores move from DecimalField points to integer tenths. Existing rows are
+# copied here and the score trigger function (PostgreSQL) switches to integer
+# arithmetic; 0009 drops the old column in its own transaction.
+
+RECOMPUTE_SQL = """
+CREATE OR REPLACE FUNCTION scoring_recompute_climber_round_score(
+    p_climber_id bigint, p_round_id bigint
+) RETURNS void AS $$
+DECLARE
+    v_total integer;
+    v_tops integer;
+    v_zones integer;
+    v_attempts_tops integer;
+    v_attempts_zones integer;
+BEGIN
+    IF p_climber_id IS NULL OR p_round_id IS NULL THEN
+        RETURN;
+    END IF;
+
+    IF (
+        SELECT comp.discipline
+        FROM competitions_competitionround cr
+        JOIN competitions_competitioncategory cc
+            ON cc.id = cr.competition_category_id
+        JOIN competitions_competition comp ON comp.id = cc.competition_id
+        WHERE cr.id = p_round_id
+    ) IS DISTINCT FROM 'boulder' THEN
+        RETURN;
+    END IF;
+
+    SELECT
+        COALESCE(SUM(
+            CASE
+                WHEN c.top_reached THEN 250 - (c.attempts_top - 1)
+                WHEN c.zone_reached THEN 100 - (c.attempts_zone - 1)
+                ELSE 0
+            END
+        ), 0),
+        COUNT(*) FILTER (WHERE c.top_reached),
+        COUNT(*) FILTER (WHERE c.zone_reached),
+        COALESCE(SUM(c.attempts_top) FILTER (WHERE c.top_reached), 0),
+        COALESCE(SUM(c.attempts_zone) FILTER (WHERE c.zone_reached), 0)
+    INTO v_total, v_tops, v_zones, v_attempts_tops, v_attempts_zones
+    FROM scoring_climb c
+    JOIN competitions_route r ON r.id = c.route_id
+    WHERE c.climber_id = p_climber_id
+      AND r.round_id = p_round_id
+      AND NOT c.deleted;
+
+    LOOP
+        UPDATE scoring_climberroundscore
+        SET total_score_tenths = v_total,
+            tops = v_tops,
+            zones = v_zones,
+            attempts_tops = v_attempts_tops,
+            attempts_zones = v_attempts_zones,
+            last_modified_at = now()
+        WHERE climber_id = p_climber_id
+          AND round_id = p_round_id
+          AND NOT deleted;
+
+        IF FOUND THEN
+            RETURN;
+        END IF;
+
+        BEGIN
+            INSERT INTO scoring_climberroundscore (
+                round_id, climber_id, total_score_tenths, tops, zones,
+                attempts_tops, attempts_zones, created_at, last_modified_at,
+                deleted
+            ) VALUES (
+                p_round_id, p_climber_id, v_total, v_tops, v_zones,
+                v_attempts_tops, v_attempts_zones, now(), now(), false
+            );
+            RETURN;
+        EXCEPTION WHEN unique_violation THEN
+            -- A concurrent writer inserted the row first; update it instead.
+        END;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+
+def copy_to_tenths(apps, schema_editor):
+    ClimberRoundScore = apps.get_model("scoring", "ClimberRoundScore")
+    ClimberRoundScore.objects.update(
+        total_score_tenths=Cast(Round(F("total_score") * 10), IntegerField())
+    )
+
+
+def copy_from_tenths(apps, schema_editor):
+    ClimberRoundScore = apps.get_model("scoring", "ClimberRoundScore")
+    ClimberRoundScore.objects.update(
+        total_score=Cast(
+            F("total_score_tenths") / 10.0,
+            models.DecimalField(max_digits=5, decimal_places=2),
+        )
+    )
+
+
+def use_tenths_in_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(RECOMPUTE_SQL)
+
+
+def use_points_in_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    previous = import_module("scoring.migrations.0007_trigger_skip_lead_rounds")
+    previous.skip_lead_rounds(apps, schema_editor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scoring', '0007_trigger_skip_lead_rounds'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='climberroundscore',
+            name='total_score_tenths',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(copy_to_tenths, copy_from_tenths),
+        migrations.RunPython(use_tenths_in_trigger, use_points_in_trigger),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 5.2.1 on 2026-10-19 02:39
+
+from importlib import import_module
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def restore_total_score(apps, schema_editor):
+    previous = import_module(
+        "scoring.migrations.0008_climberroundscore_total_score_tenths"
+    )
+    previous.copy_from_tenths(apps, schema_editor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('athletes', '0001_initial'),
+        ('competitions', '0002_competition_discipline'),
+        ('scoring', '0008_climberroundscore_total_score_tenths'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='climberroundscore',
+            options={'ordering': ['-total_score_tenths']},
+        ),
+        # Nullable first so the column can be re-added and refilled when
+        # migrating backwards.
+        migrations.AlterField(
+            model_name='climberroundscore',
+            name='total_score',
+            field=models.DecimalField(decimal_places=2, max_digits=5, null=True),
+        ),
+        migrations.RunPython(migrations.RunPython.noop, restore_total_score),
+        migrations.RemoveField(
+            model_name='climberroundscore',
+            name='total_score',
+        ),
+        migrations.AddIndex(
+            model_name='climberroundscore',
+            index=models.Index(fields=['round', 'deleted', '-total_score_tenths'], name='roundscore_round_score_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.1 on 2026-10-19 02:48
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scoring', '0009_remove_climberroundscore_total_score'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='climb',
+            options={},
+        ),
+    ]
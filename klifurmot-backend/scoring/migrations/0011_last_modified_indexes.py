@@ -0,0 +1,29 @@
+# Generated by Django 5.2.1 on 2026-10-19 03:26
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('athletes', '0002_last_modified_indexes'),
+        ('competitions', '0002_competition_discipline'),
+        ('scoring', '0010_climb_remove_ordering'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='climb',
+            index=models.Index(fields=['route', 'last_modified_at'], name='climb_route_modified_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='climberroundscore',
+            index=models.Index(fields=['round', 'last_modified_at'], name='roundscore_round_modified_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='roundresult',
+            index=models.Index(fields=['round', 'last_modified_at'], name='roundresult_round_modified_idx'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.1 on 2026-10-19 03:36
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('athletes', '0002_last_modified_indexes'),
+        ('competitions', '0002_competition_discipline'),
+        ('scoring', '0011_last_modified_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='climberroundscore',
+            name='roundscore_round_score_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='roundresult',
+            name='roundresult_round_rank_idx',
+        ),
+        migrations.AddIndex(
+            model_name='climb',
+            index=models.Index(condition=models.Q(('deleted', False)), fields=['route', 'climber'], name='climb_active_route_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='climberroundscore',
+            index=models.Index(condition=models.Q(('deleted', False)), fields=['round', '-total_score_tenths'], name='roundscore_active_score_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='roundresult',
+            index=models.Index(condition=models.Q(('deleted', False)), fields=['round', 'start_order'], name='roundresult_active_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='roundresult',
+            index=models.Index(condition=models.Q(('deleted', False)), fields=['round', 'rank'], name='roundresult_active_rank_idx'),
+        ),
+    ]
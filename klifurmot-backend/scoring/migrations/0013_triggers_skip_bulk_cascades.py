@@ -0,0 +1,70 @@
+from django.db import migrations
+
+# Recreate the climb score trigger and the results notify triggers with a
+# WHEN clause that skips them while `core.cascade` soft-deletes or restores
+# a subtree. The cascade updates every affected row in a handful of
+# statements and announces the change once, so per-row work there is
+# wasted. The score trigger keeps its enabled or disabled state.
+# PostgreSQL only.
+
+GUARD = "current_setting('klifurmot.bulk_cascade', true) IS DISTINCT FROM 'on'"
+
+TRIGGERS = [
+    ("scoring_climb_score_trg", "scoring_climb", "scoring_climb_refresh_score"),
+    ("scoring_climb_notify_trg", "scoring_climb", "scoring_notify_results"),
+    (
+        "scoring_roundresult_notify_trg",
+        "scoring_roundresult",
+        "scoring_notify_results",
+    ),
+    (
+        "scoring_climberroundscore_notify_trg",
+        "scoring_climberroundscore",
+        "scoring_notify_results",
+    ),
+]
+
+TRIGGER_SQL = """
+DROP TRIGGER IF EXISTS {name} ON {table};
+CREATE TRIGGER {name}
+    AFTER INSERT OR UPDATE OR DELETE ON {table}
+    FOR EACH ROW {when}EXECUTE FUNCTION {function}();
+"""
+
+
+def _recreate_triggers(schema_editor, when):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT tgname, tgenabled FROM pg_trigger WHERE tgname = ANY(%s)",
+            [[name for name, _, _ in TRIGGERS]],
+        )
+        disabled = {name for name, enabled in cursor.fetchall() if enabled == "D"}
+
+    for name, table, function in TRIGGERS:
+        schema_editor.execute(
+            TRIGGER_SQL.format(name=name, table=table, function=function, when=when)
+        )
+        if name in disabled:
+            schema_editor.execute(f"ALTER TABLE {table} DISABLE TRIGGER {name}")
+
+
+def add_guard(apps, schema_editor):
+    _recreate_triggers(schema_editor, f"WHEN ({GUARD}) ")
+
+
+def remove_guard(apps, schema_editor):
+    _recreate_triggers(schema_editor, "")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scoring', '0012_active_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_guard, remove_guard),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.1 on 2026-10-19 04:21
+
+import django.db.models.functions.comparison
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('athletes', '0002_last_modified_indexes'),
+        ('competitions', '0002_competition_discipline'),
+        ('scoring', '0013_triggers_skip_bulk_cascades'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='roundresult',
+            name='start_key',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='roundresult',
+            index=models.Index(models.F('round'), django.db.models.functions.comparison.Coalesce('start_key', 'start_order', output_field=models.FloatField()), condition=models.Q(('deleted', False)), name='roundresult_active_pos_idx'),
+        ),
+    ]
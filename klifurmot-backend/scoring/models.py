@@ -1,17 +1,29 @@
 from django.conf import settings
 from django.db import models
+from django.db.models.functions import Coalesce
+from django.utils import timezone
 
 from athletes.models import Climber
 from competitions.models import Route, CompetitionRound
 from core.models import AuditedSoftDeleteModel
 
+# Where a start list entry sits: its `start_key` while a move waits for
+# compaction, else its `start_order`; see `scoring.ordering`.
+START_POSITION = Coalesce("start_key", "start_order", output_field=models.FloatField())
+
 
 class RoundResult(AuditedSoftDeleteModel):
     round = models.ForeignKey(CompetitionRound, on_delete=models.CASCADE)
     climber = models.ForeignKey(Climber, on_delete=models.CASCADE)
     rank = models.IntegerField(null=True, blank=True)
     start_order = models.IntegerField(null=True, blank=True)
+    start_key = models.FloatField(null=True, blank=True)
     start_time = models.DateTimeField(null=True, blank=True)
+    version = models.PositiveIntegerField(default=1)
+
+    # Deleting or restoring these rows changes the round's ranking; see
+    # `core.cascade`.
+    cascade_round = "round_id"
 
     class Meta:
         constraints = [
@@ -21,6 +33,28 @@ class RoundResult(AuditedSoftDeleteModel):
                 name="unique_active_round_result",
             ),
         ]
+        indexes = [
+            models.Index(
+                fields=["round", "start_order"],
+                condition=models.Q(deleted=False),
+                name="roundresult_active_order_idx",
+            ),
+            models.Index(
+                models.F("round"),
+                START_POSITION,
+                condition=models.Q(deleted=False),
+                name="roundresult_active_pos_idx",
+            ),
+            models.Index(
+                fields=["round", "rank"],
+                condition=models.Q(deleted=False),
+                name="roundresult_active_rank_idx",
+            ),
+            models.Index(
+                fields=["round", "last_modified_at"],
+                name="roundresult_round_modified_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"Result: {self.climber} - {self.round}"
@@ -43,9 +77,9 @@ class Climb(AuditedSoftDeleteModel):
     plus_modifier = models.BooleanField(null=True, blank=True)
     time_seconds = models.IntegerField(null=True, blank=True)
     fall_position = models.IntegerField(null=True, blank=True)
+    version = models.PositiveIntegerField(default=1)
 
     class Meta:
-        ordering = ["route__round", "climber"]
         constraints = [
             models.UniqueConstraint(
                 fields=["climber", "route"],
@@ -53,15 +87,35 @@ class Climb(AuditedSoftDeleteModel):
                 name="unique_active_climb",
             ),
         ]
+        indexes = [
+            models.Index(
+                fields=["route", "climber"],
+                condition=models.Q(deleted=False),
+                name="climb_active_route_idx",
+            ),
+            models.Index(
+                fields=["route", "last_modified_at"],
+                name="climb_route_modified_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.climber} on {self.route}"
 
+    @classmethod
+    def before_cascade(cls, scope: models.QuerySet, deleted: bool, user) -> None:
+        # Replay folds the event log, so climbs taken along by a cascade,
+        # such as those of a removed route, need their events too.
+        from .events import record_cascade_events
+
+        record_cascade_events(scope, deleted, judge=user)
+
 
 class ClimberRoundScore(AuditedSoftDeleteModel):
     round = models.ForeignKey(CompetitionRound, on_delete=models.CASCADE)
     climber = models.ForeignKey(Climber, on_delete=models.CASCADE)
-    total_score = models.DecimalField(max_digits=5, decimal_places=2)
+    # Points in tenths (24.9 is stored as 249) so ranking compares integers.
+    total_score_tenths = models.IntegerField(default=0)
     # Boulder fields
     tops = models.IntegerField(null=True, blank=True)
     zones = models.IntegerField(null=True, blank=True)
@@ -71,8 +125,12 @@ class ClimberRoundScore(AuditedSoftDeleteModel):
     best_hold_reached = models.IntegerField(null=True, blank=True)
     best_time_seconds = models.IntegerField(null=True, blank=True)
 
+    # Deleting or restoring these rows changes the round's ranking; see
+    # `core.cascade`.
+    cascade_round = "round_id"
+
     class Meta:
-        ordering = ["-total_score"]
+        ordering = ["-total_score_tenths"]
         constraints = [
             models.UniqueConstraint(
                 fields=["round", "climber"],
@@ -80,6 +138,98 @@ class ClimberRoundScore(AuditedSoftDeleteModel):
                 name="unique_active_round_score",
             ),
         ]
+        indexes = [
+            models.Index(
+                fields=["round", "-total_score_tenths"],
+                condition=models.Q(deleted=False),
+                name="roundscore_active_score_idx",
+            ),
+            models.Index(
+                fields=["round", "last_modified_at"],
+                name="roundscore_round_modified_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.climber} - {self.total_score_tenths / 10} pts in {self.round}"
+
+
+class ClimbEvent(models.Model):
+    """Append-only history of climb writes, used to replay scores.
+
+    Rows are never updated or deleted, and the foreign keys carry no
+    database constraint so purging a climb cannot rewrite its history.
+    """
+
+    CREATE = "create"
+    UPDATE = "update"
+    DELETE = "delete"
+    ACTION_CHOICES = [(CREATE, "Create"), (UPDATE, "Update"), (DELETE, "Delete")]
+
+    climb = models.ForeignKey(
+        Climb, on_delete=models.DO_NOTHING, db_constraint=False, related_name="+"
+    )
+    climber = models.ForeignKey(
+        Climber, on_delete=models.DO_NOTHING, db_constraint=False, related_name="+"
+    )
+    route = models.ForeignKey(
+        Route, on_delete=models.DO_NOTHING, db_constraint=False, related_name="+"
+    )
+    round = models.ForeignKey(
+        CompetitionRound,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="+",
+    )
+    competition = models.ForeignKey(
+        "competitions.Competition",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="+",
+    )
+    action = models.CharField(max_length=10, choices=ACTION_CHOICES)
+    before = models.JSONField(null=True, blank=True)
+    after = models.JSONField(null=True, blank=True)
+    judge = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["competition", "id"], name="climbevent_competition_idx"
+            ),
+        ]
+
+    def __str__(self):
+        climb_id = self.climb_id  # pyright: ignore[reportAttributeAccessIssue]
+        return f"{self.action} climb {climb_id} at {self.created_at}"
+
+
+class ClimbEventSnapshot(models.Model):
+    """Folded climb state of a competition up to `last_event_id`."""
+
+    competition = models.ForeignKey(
+        "competitions.Competition", on_delete=models.CASCADE, related_name="+"
+    )
+    last_event_id = models.BigIntegerField()
+    taken_at = models.DateTimeField(default=timezone.now)
+    state = models.JSONField()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["competition", "taken_at"], name="climbsnapshot_taken_idx"
+            ),
+        ]
 
     def __str__(self):
-        return f"{self.climber} - {self.total_score} pts in {self.round}"
+        competition_id = (
+            self.competition_id
+        )  # pyright: ignore[reportAttributeAccessIssue]
+        return f"Snapshot of competition {competition_id} at {self.taken_at}"
@@ -0,0 +1,127 @@
+"""Database-driven result push.
+
+Row triggers on climbs, round results and round scores NOTIFY the
+`klifurmot_results` channel with the affected round and competition. A
+single notifier process (`manage.py results_notifier`) LISTENs there,
+debounces bursts per competition, rebuilds the results once and sends them
+to the competition's websocket group. Every writer is covered, including
+Django admin edits, bulk fixes and management commands, and web workers
+no longer broadcast inline when `RESULTS_PUSH_VIA_NOTIFY` is set.
+"""
+
+import json
+import logging
+import select
+import time
+from typing import Callable, Optional
+
+import psycopg2
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "klifurmot_results"
+
+
+def notify_results(competition_id: int) -> None:
+    """Queue one results notification for the competition; PostgreSQL
+    delivers it when the transaction commits.
+    """
+    payload = json.dumps({"round_id": None, "competition_id": competition_id})
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_notify(%s, %s)", [CHANNEL, payload])
+
+
+class ResultsNotifier:
+    def __init__(
+        self,
+        send: Callable[[int], None],
+        debounce: float = 0.5,
+        max_delay: float = 2.0,
+    ):
+        self.send = send
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.pending: dict[int, tuple[float, float]] = {}
+        self.conn = None
+
+    def listen(self) -> None:
+        params = connection.get_connection_params()
+        self.conn = psycopg2.connect(**params)
+        self.conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+        with self.conn.cursor() as cursor:
+            cursor.execute(f"LISTEN {CHANNEL}")
+
+    def close(self) -> None:
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    def poll(self, timeout: float) -> None:
+        """Wait up to `timeout` seconds and queue any notifications."""
+        assert self.conn is not None, "call listen() first"
+
+        if select.select([self.conn], [], [], timeout) == ([], [], []):
+            return
+
+        self.conn.poll()
+        now = time.monotonic()
+        while self.conn.notifies:
+            notify = self.conn.notifies.pop(0)
+            competition_id = self._competition_id(notify.payload)
+            if competition_id is None:
+                continue
+            first_seen, _ = self.pending.get(competition_id, (now, now))
+            self.pending[competition_id] = (first_seen, now)
+
+    def flush(self, force: bool = False) -> list[int]:
+        """Send results for competitions that have gone quiet (or waited long)."""
+        now = time.monotonic()
+        due = [
+            competition_id
+            for competition_id, (first_seen, last_seen) in self.pending.items()
+            if force
+            or now - last_seen >= self.debounce
+            or now - first_seen >= self.max_delay
+        ]
+
+        for competition_id in due:
+            del self.pending[competition_id]
+            try:
+                self.send(competition_id)
+            except Exception:
+                logger.exception(
+                    f"Failed to push results for competition {competition_id}"
+                )
+
+        return due
+
+    def next_timeout(self, idle: float) -> float:
+        if not self.pending:
+            return idle
+
+        now = time.monotonic()
+        return max(
+            0.0,
+            min(
+                min(last + self.debounce, first + self.max_delay) - now
+                for first, last in self.pending.values()
+            ),
+        )
+
+    def run_forever(self, idle: float = 5.0) -> None:
+        self.listen()
+        try:
+            while True:
+                self.poll(self.next_timeout(idle))
+                self.flush()
+        finally:
+            self.close()
+
+    @staticmethod
+    def _competition_id(payload: str) -> Optional[int]:
+        try:
+            return int(json.loads(payload)["competition_id"])
+        except (ValueError, KeyError, TypeError):
+            logger.warning(f"Ignoring malformed results notification: {payload}")
+            return None
@@ -0,0 +1,111 @@
+"""Start list order with constant-time moves.
+
+An entry's place in its round is `START_POSITION`: its `start_order`, or
+a fractional `start_key` once it has been moved. A move writes only the
+moved row, giving it a key halfway between its new neighbours, so
+organizers can reorder a large round over and over without rewriting it.
+
+API consumers still see integer start orders. Reads hand the round's
+stored start orders out in position order (`start_order_view`), so a
+move swaps numbers around instead of inventing new ones and gaps such as
+a pinned start order 7 survive. `compact` writes that view back and
+clears the keys. It runs when a gap between two keys runs out of float
+precision, and otherwise lazily through `compact_start_orders`.
+
+A key can be a whole number, such as 8.0 for a move past start order 7,
+so writers that append after the last entry start above `highest_place`
+of every entry rather than above the largest stored start order.
+"""
+
+import math
+from typing import Optional, Sequence
+
+from django.db import transaction
+
+from .models import START_POSITION, RoundResult
+
+
+def start_order_view(start_orders: Sequence[Optional[int]]) -> list[Optional[int]]:
+    """Integer start orders for entries listed in position order.
+
+    Entries without a start order keep none. With no pending moves this
+    is the stored start orders unchanged.
+    """
+    numbers = iter(sorted(order for order in start_orders if order is not None))
+    return [None if order is None else next(numbers) for order in start_orders]
+
+
+def highest_place(start_order: Optional[int], start_key: Optional[float]) -> int:
+    """The highest whole start order an entry holds or sits at.
+
+    Entries appended with start orders above every entry's highest place
+    go after all of them, moved or not, and reuse no stored start order.
+    """
+    key_place = math.floor(start_key) if start_key is not None else 0
+    return max(start_order or 0, key_place)
+
+
+def position_after(
+    entry: RoundResult, round_id: int, after_id: Optional[int]
+) -> Optional[float]:
+    """Key that puts `entry` right after entry `after_id` of round
+    `round_id`, or first with None.
+
+    Returns None when there is no room left between the neighbours'
+    keys; compact the round and ask again. Raises ValueError if
+    `after_id` is not a placed entry of the same round.
+    """
+    others = (
+        RoundResult.objects.filter(round_id=round_id)
+        .exclude(pk=entry.pk)
+        .annotate(position=START_POSITION)
+        .filter(position__isnull=False)
+    )
+
+    lower: Optional[float] = None
+    if after_id is not None:
+        lower = others.filter(pk=after_id).values_list("position", flat=True).first()
+        if lower is None:
+            raise ValueError(
+                f"Start list entry {after_id} not found in this round's start list"
+            )
+        others = others.filter(position__gt=lower)
+    upper: Optional[float] = (
+        others.order_by("position").values_list("position", flat=True).first()
+    )
+
+    if upper is None:
+        return float(entry.start_order or 1) if lower is None else lower + 1
+    if lower is None:
+        return upper - 1
+    middle = (lower + upper) / 2
+    return middle if lower < middle < upper else None
+
+
+def compact(round_id: int) -> int:
+    """Store the round's integer view as its start orders and drop the
+    move keys. Returns the number of entries rewritten."""
+    with transaction.atomic():
+        entries = list(
+            RoundResult.objects.select_for_update()
+            .filter(round_id=round_id)
+            .order_by(START_POSITION, "id")
+            .values_list("id", "start_order", "start_key")
+        )
+        numbers = start_order_view([start_order for _, start_order, _ in entries])
+        changed = [
+            RoundResult(id=entry_id, start_order=number, start_key=None)
+            for (entry_id, start_order, start_key), number in zip(entries, numbers)
+            if start_key is not None or number != start_order
+        ]
+        RoundResult.objects.bulk_update(changed, ["start_order", "start_key"])
+    return len(changed)
+
+
+def rounds_to_compact() -> list[int]:
+    return list(
+        RoundResult.objects.filter(start_key__isnull=False)
+        .order_by("round_id")
+        .values_list("round_id", flat=True)
+        .distinct()
+    )
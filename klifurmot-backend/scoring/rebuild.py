@@ -0,0 +1,257 @@
+"""Recompute ClimberRoundScore and RoundResult ranks for whole competitions.
+
+Work is split into two phases so it can run on a process pool:
+
+1. Scores: every CompetitionRound is independent, so rounds are recomputed
+   in parallel from their climbs.
+2. Ranks: countback reads the previous round's ranks, so each category's
+   rounds are ranked in `round_order`; categories run in parallel.
+
+Workers only exchange plain dicts with the parent, and each opens its own
+database connection.
+
+`write_scores` is the score write of both this rebuild and the event log
+replay in `scoring.replay`.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any, Optional
+
+from django.db import transaction
+from django.utils import timezone
+
+from competitions.models import CompetitionRound
+from core.upsert import CONFLICT, upsert
+
+from .engines import ScoringEngine, get_engine
+from .models import Climb, ClimberRoundScore, RoundResult
+
+
+@dataclass
+class RoundRebuild:
+    round_id: int
+    climbs: int = 0
+    created: int = 0
+    updated: int = 0
+    rank_changes: int = 0
+    scores: dict[int, dict[str, Any]] = field(default_factory=dict)
+    diff: list[str] = field(default_factory=list)
+
+
+@dataclass
+class ScoreWrite:
+    created: int = 0
+    updated: int = 0
+    # Live score values after the write, keyed by (round_id, climber_id).
+    scores: dict[tuple[int, int], dict[str, Any]] = field(default_factory=dict)
+    diff: list[str] = field(default_factory=list)
+
+
+def write_scores(
+    engine: ScoringEngine,
+    round_ids: set[int],
+    aggregates: dict[tuple[int, int], dict[str, Any]],
+    dry_run: bool = False,
+    batch_size: Optional[int] = None,
+) -> ScoreWrite:
+    """Bring the ClimberRoundScore rows of `round_ids` in line with
+    `aggregates`, keyed by (round_id, climber_id).
+
+    Rows whose values differ are updated in bulk. Missing rows are
+    inserted through `core.upsert`, whose ON CONFLICT against the partial
+    unique constraint skips a row a live scorer wrote in the meantime.
+    Scores soft-deleted with their climber or round stay deleted; a
+    restore brings them back. The diff lists every change, also on a
+    dry run.
+    """
+    result = ScoreWrite()
+    existing = {}
+    deleted = set()
+    for score in ClimberRoundScore.all_objects.filter(round_id__in=round_ids):
+        pair = (score.round_id, score.climber_id)  # pyright: ignore[reportAttributeAccessIssue]
+        if score.deleted:
+            deleted.add(pair)
+        else:
+            existing[pair] = score
+            result.scores[pair] = {
+                name: getattr(score, name) for name in engine.score_fields
+            }
+    deleted.difference_update(existing)
+
+    now = timezone.now()
+    to_create = []
+    to_update = []
+    for (round_id, climber_id), values in aggregates.items():
+        pair = (round_id, climber_id)
+        if round_id not in round_ids or pair in deleted:
+            continue
+        result.scores[pair] = values
+
+        score = existing.get(pair)
+        if score is None:
+            to_create.append(
+                ClimberRoundScore(round_id=round_id, climber_id=climber_id, **values)
+            )
+            result.diff.append(f"round {round_id} climber {climber_id}: new {values}")
+            continue
+
+        changed = {
+            name: (getattr(score, name), value)
+            for name, value in values.items()
+            if getattr(score, name) != value
+        }
+        if not changed:
+            continue
+        for name, (_old, value) in changed.items():
+            setattr(score, name, value)
+        score.last_modified_at = now
+        to_update.append(score)
+        result.diff.append(
+            f"round {round_id} climber {climber_id}: "
+            + ", ".join(
+                f"{name} {old} -> {new}" for name, (old, new) in changed.items()
+            )
+        )
+
+    result.updated = len(to_update)
+    result.created = len(to_create)
+    if dry_run:
+        return result
+
+    with transaction.atomic():
+        ClimberRoundScore.objects.bulk_update(
+            to_update,
+            [*engine.score_fields, "last_modified_at"],
+            batch_size=batch_size,
+        )
+        written = upsert(
+            to_create, "unique_active_round_score", revive_fields=engine.score_fields
+        )
+    result.created = sum(row.outcome != CONFLICT for row in written)
+    return result
+
+
+def _round_engine(round_id: int) -> ScoringEngine:
+    return get_engine(
+        CompetitionRound.objects.values_list(
+            "competition_category__competition__discipline", flat=True
+        ).get(id=round_id)
+    )
+
+
+def select_rounds(
+    competition_ids: Optional[list[int]] = None, season: Optional[int] = None
+) -> dict[int, list[int]]:
+    """Active round ids per competition category, in `round_order`."""
+    rounds = CompetitionRound.objects.filter(
+        competition_category__deleted=False,
+        competition_category__competition__deleted=False,
+    )
+    if competition_ids:
+        rounds = rounds.filter(competition_category__competition_id__in=competition_ids)
+    if season:
+        rounds = rounds.filter(competition_category__competition__start_date__year=season)
+
+    chains = defaultdict(list)
+    for round_id, category_id in rounds.order_by(
+        "competition_category_id", "round_order", "id"
+    ).values_list("id", "competition_category_id"):
+        chains[category_id].append(round_id)
+
+    return dict(chains)
+
+
+def rebuild_round_scores(round_id: int, dry_run: bool = False) -> RoundRebuild:
+    """Phase 1: recompute the aggregates of one round from its climbs."""
+    result = RoundRebuild(round_id=round_id)
+    engine = _round_engine(round_id)
+
+    rows = []
+    climber_ids = set()
+    for climber_id, deleted, *values in (
+        Climb.all_objects.filter(route__round_id=round_id)
+        .order_by()
+        .values_list("climber_id", "deleted", *engine.climb_fields)
+        .iterator()
+    ):
+        climber_ids.add(climber_id)
+        if not deleted:
+            rows.append((climber_id, *values))
+    result.climbs = len(rows)
+    aggregates = engine.aggregate_round(rows)
+
+    written = write_scores(
+        engine,
+        {round_id},
+        {
+            (round_id, climber_id): aggregates.get(climber_id)
+            or engine.empty_aggregate()
+            for climber_id in climber_ids
+        },
+        dry_run=dry_run,
+    )
+    result.created = written.created
+    result.updated = written.updated
+    result.diff = written.diff
+    result.scores = {
+        climber_id: values for (_round_id, climber_id), values in written.scores.items()
+    }
+    return result
+
+
+def rebuild_category_ranks(
+    round_ids: list[int],
+    scores_by_round: dict[int, dict[int, dict[str, Any]]],
+    dry_run: bool = False,
+) -> list[RoundRebuild]:
+    """Phase 2: rank a category's rounds in order using the phase 1 scores.
+
+    Mirrors `_update_round_results`: only climbers on the start list get a
+    rank, and the previous round's ranks (including rank changes made
+    earlier in this chain) drive countback.
+    """
+    results = []
+    prev_rank_map = {}
+    engine = _round_engine(round_ids[0])
+
+    for round_id in round_ids:
+        result = RoundRebuild(round_id=round_id)
+        entries = {
+            entry.climber_id: entry  # pyright: ignore[reportAttributeAccessIssue]
+            for entry in RoundResult.objects.filter(round_id=round_id)
+        }
+
+        scores = [
+            SimpleNamespace(climber_id=climber_id, **values)
+            for climber_id, values in scores_by_round.get(round_id, {}).items()
+        ]
+        ranked = engine.rank(scores, prev_rank_map)
+
+        now = timezone.now()
+        to_update = []
+        for score, rank in ranked:
+            entry = entries.get(score.climber_id)
+            if entry is None or entry.rank == rank:
+                continue
+            result.diff.append(
+                f"round {round_id} climber {score.climber_id}: "
+                f"rank {entry.rank} -> {rank}"
+            )
+            entry.rank = rank
+            entry.last_modified_at = now
+            to_update.append(entry)
+
+        result.rank_changes = len(to_update)
+        if not dry_run:
+            RoundResult.objects.bulk_update(to_update, ["rank", "last_modified_at"])
+
+        prev_rank_map = {
+            climber_id: entry.rank
+            for climber_id, entry in entries.items()
+            if entry.rank is not None
+        }
+        results.append(result)
+
+    return results
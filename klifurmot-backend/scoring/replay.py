@@ -0,0 +1,249 @@
+from collections import defaultdict
+from types import SimpleNamespace
+from typing import Any, Iterable, Optional
+
+from django.db import transaction
+
+from competitions.models import Competition, CompetitionRound
+
+from .engines import ScoringEngine, get_engine, points
+from .events import climb_state
+from .models import Climb, ClimbEvent, ClimbEventSnapshot
+from .rebuild import write_scores
+
+DEFAULT_BATCH_SIZE = 2000
+
+
+def fold_events(events: Iterable[ClimbEvent], state: Optional[dict] = None) -> dict:
+    """Fold events into `{climb_id: {...}}` in the order given.
+
+    Deleted climbs stay in the state with `deleted=True` so their
+    (round, climber) pair still folds to a zero aggregate, matching what
+    `UpdateRoundScoreForRoute` leaves behind.
+    """
+    state = {} if state is None else state
+
+    for event in events:
+        entry = state.setdefault(
+            event.climb_id,  # pyright: ignore[reportAttributeAccessIssue]
+            {
+                "round_id": event.round_id,  # pyright: ignore[reportAttributeAccessIssue]
+                "climber_id": event.climber_id,  # pyright: ignore[reportAttributeAccessIssue]
+            },
+        )
+        if event.action == ClimbEvent.DELETE:
+            entry["deleted"] = True
+        else:
+            entry.update(event.after or {})
+            entry["deleted"] = False
+
+    return state
+
+
+def aggregate_state(
+    state: dict, engine: ScoringEngine
+) -> dict[tuple[int, int], dict[str, Any]]:
+    """Engine aggregates keyed by (round_id, climber_id)."""
+    rows_by_round = defaultdict(list)
+    pairs = set()
+    for entry in state.values():
+        pairs.add((entry["round_id"], entry["climber_id"]))
+        if not entry.get("deleted"):
+            rows_by_round[entry["round_id"]].append(
+                (entry["climber_id"], *(entry.get(f) for f in engine.climb_fields))
+            )
+
+    by_round = {
+        round_id: engine.aggregate_round(rows)
+        for round_id, rows in rows_by_round.items()
+    }
+    return {
+        (round_id, climber_id): by_round.get(round_id, {}).get(climber_id)
+        or engine.empty_aggregate()
+        for round_id, climber_id in pairs
+    }
+
+
+def _competition_engine(competition_id: int) -> ScoringEngine:
+    return get_engine(
+        Competition.all_objects.values_list("discipline", flat=True).get(
+            id=competition_id
+        )
+    )
+
+
+def _competition_events(competition_id: int):
+    return ClimbEvent.objects.filter(competition_id=competition_id).order_by("id")
+
+
+def backfill_events(competition_id: int, batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+    """Record a create event for active climbs that predate the event log."""
+    logged = ClimbEvent.objects.filter(competition_id=competition_id).values("climb_id")
+    climbs = (
+        Climb.objects.filter(
+            route__round__competition_category__competition_id=competition_id,
+        )
+        .exclude(id__in=logged)
+        .select_related("route__round__competition_category")
+        .order_by("id")
+    )
+
+    created = 0
+    batch = []
+    for climb in climbs.iterator(chunk_size=batch_size):
+        round_obj = climb.route.round
+        batch.append(
+            ClimbEvent(
+                climb_id=climb.pk,
+                climber_id=climb.climber_id,  # pyright: ignore[reportAttributeAccessIssue]
+                route_id=climb.route.pk,
+                round_id=round_obj.pk,
+                competition_id=competition_id,
+                action=ClimbEvent.CREATE,
+                after=climb_state(climb),
+                judge_id=climb.judge_id,  # pyright: ignore[reportAttributeAccessIssue]
+                created_at=climb.created_at,
+            )
+        )
+        if len(batch) >= batch_size:
+            ClimbEvent.objects.bulk_create(batch)
+            created += len(batch)
+            batch = []
+
+    if batch:
+        ClimbEvent.objects.bulk_create(batch)
+        created += len(batch)
+
+    return created
+
+
+def replay_competition(
+    competition_id: int, batch_size: int = DEFAULT_BATCH_SIZE
+) -> dict[str, int]:
+    """Rebuild ClimberRoundScore and RoundResult ranks from the event log.
+
+    Events are streamed in id order, scores are written with
+    `rebuild.write_scores`, and rounds are reranked in round order so
+    countback sees the rebuilt ranks of the previous round.
+    """
+    from .services import _update_round_results
+
+    engine = _competition_engine(competition_id)
+    state = fold_events(
+        _competition_events(competition_id).iterator(chunk_size=batch_size)
+    )
+    aggregates = aggregate_state(state, engine)
+
+    rounds = list(
+        CompetitionRound.objects.filter(
+            competition_category__competition_id=competition_id,
+        ).order_by("competition_category_id", "round_order")
+    )
+    round_ids = {round_obj.pk for round_obj in rounds}
+
+    with transaction.atomic():
+        written = write_scores(engine, round_ids, aggregates, batch_size=batch_size)
+
+        reranked = 0
+        for round_obj in rounds:
+            reranked += len(_update_round_results(round_obj))
+
+    return {
+        "climbs": len(state),
+        "scores_created": written.created,
+        "scores_updated": written.updated,
+        "ranks_changed": reranked,
+    }
+
+
+def take_snapshot(competition_id: int, batch_size: int = DEFAULT_BATCH_SIZE):
+    """Persist the folded state so `results_as_of` only replays the tail."""
+    previous = (
+        ClimbEventSnapshot.objects.filter(competition_id=competition_id)
+        .order_by("-last_event_id")
+        .first()
+    )
+    state = _load_state(previous)
+    last_event_id = previous.last_event_id if previous else 0
+
+    tail = _competition_events(competition_id).filter(id__gt=last_event_id)
+    for event in tail.iterator(chunk_size=batch_size):
+        fold_events([event], state)
+        last_event_id = event.pk
+
+    return ClimbEventSnapshot.objects.create(
+        competition_id=competition_id,
+        last_event_id=last_event_id,
+        state={str(climb_id): entry for climb_id, entry in state.items()},
+    )
+
+
+def _load_state(snapshot: Optional[ClimbEventSnapshot]) -> dict:
+    if snapshot is None:
+        return {}
+    return {int(climb_id): dict(entry) for climb_id, entry in snapshot.state.items()}
+
+
+def results_as_of(competition_id: int, at) -> list[dict[str, Any]]:
+    """Round rankings as they stood at `at`.
+
+    Starts from the newest snapshot taken no later than `at` and folds the
+    events after it, so only the tail since the snapshot is read. Ranks use
+    the same ordering as live scoring, with countback against the previous
+    round's replayed ranks.
+    """
+    snapshot = (
+        ClimbEventSnapshot.objects.filter(competition_id=competition_id, taken_at__lte=at)
+        .order_by("-last_event_id")
+        .first()
+    )
+    state = _load_state(snapshot)
+    tail = _competition_events(competition_id).filter(
+        id__gt=snapshot.last_event_id if snapshot else 0,
+        created_at__lte=at,
+    )
+    fold_events(tail.iterator(), state)
+
+    engine = _competition_engine(competition_id)
+    aggregates = aggregate_state(state, engine)
+    scores_by_round = defaultdict(list)
+    for (round_id, climber_id), values in aggregates.items():
+        scores_by_round[round_id].append(SimpleNamespace(climber_id=climber_id, **values))
+
+    rounds = CompetitionRound.objects.filter(
+        competition_category__competition_id=competition_id,
+    ).order_by("competition_category_id", "round_order")
+
+    results = []
+    prev_rank_map = {}
+    previous_category = None
+    for round_obj in rounds:
+        if round_obj.competition_category_id != previous_category:  # pyright: ignore[reportAttributeAccessIssue]
+            prev_rank_map = {}
+            previous_category = round_obj.competition_category_id  # pyright: ignore[reportAttributeAccessIssue]
+
+        ranked = engine.rank(scores_by_round.get(round_obj.pk, []), prev_rank_map)
+        results.append(
+            {
+                "round_id": round_obj.pk,
+                "competition_category_id": previous_category,
+                "round_order": round_obj.round_order,
+                "results": [
+                    {
+                        "climber_id": score.climber_id,
+                        "rank": rank,
+                        "total_score": points(score.total_score_tenths),
+                        **{
+                            name: getattr(score, name)
+                            for name in engine.score_fields
+                            if name != "total_score_tenths"
+                        },
+                    }
+                    for score, rank in ranked
+                ],
+            }
+        )
+        prev_rank_map = {score.climber_id: rank for score, rank in ranked}
+
+    return results
+
@@ -1,6 +1,11 @@
+from django.conf import settings
 from django.urls import re_path
-from .consumers import ResultsConsumer
+from .consumers import RerankConsumer, ResultsConsumer
 
 websocket_urlpatterns = [
     re_path(r"ws/results/(?P<competition_id>\d+)/?$", ResultsConsumer.as_asgi()),
 ]
+
+channel_routes = {}
+if settings.SCORING_RERANK_CHANNEL:
+    channel_routes[settings.SCORING_RERANK_CHANNEL] = RerankConsumer.as_asgi()
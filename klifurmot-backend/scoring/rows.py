@@ -0,0 +1,415 @@
+"""Column projections and row types used by the scoring read paths.
+
+Results and scoring lists read many rows per request, so they fetch only the
+columns they use with `values_list` instead of hydrating model instances
+with their audit fields and related objects. The assemblers collect those
+columns into the slotted rows below and turn them into response dicts in a
+single pass once the whole payload is built.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Optional
+
+from .engines import points
+
+CLIMBER_NAME_FIELDS = (
+    "climber__is_simple_athlete",
+    "climber__simple_name",
+    "climber__user_account__full_name",
+)
+
+
+def climber_name(
+    is_simple_athlete: bool, simple_name: Optional[str], full_name: Optional[str]
+) -> Optional[str]:
+    """Display name from the `CLIMBER_NAME_FIELDS` columns."""
+    return simple_name if is_simple_athlete else full_name
+
+
+@dataclass(slots=True)
+class ScoreRow:
+    """A ClimberRoundScore row as the engines rank it.
+
+    Holds `climber_id`, every engine's score fields and the climber's display
+    name, so ranking and the results payload need no further queries.
+    """
+
+    climber_id: int
+    total_score_tenths: int
+    tops: Optional[int]
+    zones: Optional[int]
+    attempts_tops: Optional[int]
+    attempts_zones: Optional[int]
+    best_hold_reached: Optional[int]
+    best_time_seconds: Optional[int]
+    name: Optional[str]
+
+    columns = (
+        "climber_id",
+        "total_score_tenths",
+        "tops",
+        "zones",
+        "attempts_tops",
+        "attempts_zones",
+        "best_hold_reached",
+        "best_time_seconds",
+        *CLIMBER_NAME_FIELDS,
+    )
+
+    @classmethod
+    def from_row(cls, row: tuple) -> "ScoreRow":
+        (
+            climber_id,
+            total_score_tenths,
+            tops,
+            zones,
+            attempts_tops,
+            attempts_zones,
+            best_hold_reached,
+            best_time_seconds,
+            is_simple_athlete,
+            simple_name,
+            full_name,
+        ) = row
+        return cls(
+            climber_id,
+            total_score_tenths,
+            tops,
+            zones,
+            attempts_tops,
+            attempts_zones,
+            best_hold_reached,
+            best_time_seconds,
+            climber_name(is_simple_athlete, simple_name, full_name),
+        )
+
+
+CLIMB_RESULT_FIELDS = (
+    "top_reached",
+    "zone_reached",
+    "attempts_top",
+    "attempts_zone",
+    "hold_reached",
+    "plus_modifier",
+    "time_seconds",
+)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class RouteResult:
+    """One climber's result on one route of the competition results.
+
+    Frozen so equal results, such as every unattempted route with the same
+    number, can share one instance and one serialized dict. Instances are
+    interned by the assembler and compared by identity.
+    """
+
+    route_number: int
+    attempted: bool = False
+    top_reached: bool = False
+    zone_reached: bool = False
+    attempts_top: int = 0
+    attempts_zone: int = 0
+    hold_reached: int = 0
+    plus_modifier: bool = False
+    time_seconds: Optional[int] = None
+
+    @classmethod
+    def from_climb(
+        cls,
+        route_number: int,
+        top_reached: Optional[bool],
+        zone_reached: Optional[bool],
+        attempts_top: Optional[int],
+        attempts_zone: Optional[int],
+        hold_reached: Optional[int],
+        plus_modifier: Optional[bool],
+        time_seconds: Optional[int],
+    ) -> "RouteResult":
+        """From the `CLIMB_RESULT_FIELDS` columns of an attempted route."""
+        return cls(
+            route_number,
+            True,
+            top_reached or False,
+            zone_reached or False,
+            attempts_top or 0,
+            attempts_zone or 0,
+            hold_reached or 0,
+            plus_modifier or False,
+            time_seconds,
+        )
+
+    def as_dict(self, is_lead: bool) -> dict[str, Any]:
+        data = {
+            "route_number": self.route_number,
+            "attempted": self.attempted,
+            "top_reached": self.top_reached,
+            "zone_reached": self.zone_reached,
+            "attempts_top": self.attempts_top,
+            "attempts_zone": self.attempts_zone,
+        }
+        if is_lead:
+            data["hold_reached"] = self.hold_reached
+            data["plus_modifier"] = self.plus_modifier
+            data["time_seconds"] = self.time_seconds
+        return data
+
+
+@lru_cache(maxsize=None)
+def not_attempted(route_number: int) -> RouteResult:
+    """The shared entry for a route the climber has no climb on."""
+    return RouteResult(route_number)
+
+
+@dataclass(slots=True)
+class ClimbRow:
+    """A climb as `list_climbs` and `get_climb` return it."""
+
+    id: int
+    climber_id: int
+    climber_name: Optional[str]
+    route_id: int
+    route_number: int
+    attempts_top: int
+    attempts_zone: int
+    top_reached: bool
+    zone_reached: bool
+    hold_reached: Optional[int]
+    plus_modifier: Optional[bool]
+    time_seconds: Optional[int]
+    version: int
+
+    columns = (
+        "id",
+        "climber_id",
+        *CLIMBER_NAME_FIELDS,
+        "route_id",
+        "route__route_number",
+        "attempts_top",
+        "attempts_zone",
+        "top_reached",
+        "zone_reached",
+        "hold_reached",
+        "plus_modifier",
+        "time_seconds",
+        "version",
+    )
+
+    @classmethod
+    def from_row(cls, row: tuple) -> "ClimbRow":
+        climb_id, climber_id, is_simple_athlete, simple_name, full_name, *rest = row
+        return cls(
+            climb_id,
+            climber_id,
+            climber_name(is_simple_athlete, simple_name, full_name),
+            *rest,
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "climber_id": self.climber_id,
+            "climber_name": self.climber_name,
+            "route_id": self.route_id,
+            "route_number": self.route_number,
+            "attempts_top": self.attempts_top,
+            "attempts_zone": self.attempts_zone,
+            "top_reached": self.top_reached,
+            "zone_reached": self.zone_reached,
+            "hold_reached": self.hold_reached,
+            "plus_modifier": self.plus_modifier,
+            "time_seconds": self.time_seconds,
+            "version": self.version,
+        }
+
+
+@dataclass(slots=True)
+class StartlistRow:
+    """A round's start list entry as `list_startlist` returns it."""
+
+    id: int
+    climber_id: int
+    climber_name: Optional[str]
+    start_order: Optional[int]
+    gender: Optional[str]
+    rank: Optional[int]
+    version: int
+
+    columns = (
+        "id",
+        "climber_id",
+        *CLIMBER_NAME_FIELDS,
+        "climber__simple_gender",
+        "climber__user_account__gender",
+        "start_order",
+        "rank",
+        "version",
+    )
+
+    @classmethod
+    def from_row(cls, row: tuple) -> "StartlistRow":
+        (
+            result_id,
+            climber_id,
+            is_simple_athlete,
+            simple_name,
+            full_name,
+            simple_gender,
+            account_gender,
+            start_order,
+            rank,
+            version,
+        ) = row
+        return cls(
+            result_id,
+            climber_id,
+            climber_name(is_simple_athlete, simple_name, full_name),
+            start_order,
+            simple_gender if is_simple_athlete else account_gender,
+            rank,
+            version,
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "climber_id": self.climber_id,
+            "climber_name": self.climber_name,
+            "start_order": self.start_order,
+            "gender": self.gender,
+            "rank": self.rank,
+            "version": self.version,
+        }
+
+
+@dataclass(slots=True)
+class ResultRow:
+    rank: int
+    score: ScoreRow
+    routes: list[RouteResult]
+
+
+@dataclass(slots=True)
+class StartlistEntry:
+    start_order: Optional[int]
+    full_name: Optional[str]
+    category_name: Optional[str]
+
+
+@dataclass(slots=True)
+class ResultChange:
+    """A changed result row of a `?since=` results read."""
+
+    round_id: int
+    category: str
+    round_name: str
+    row: ResultRow
+
+
+@dataclass(slots=True)
+class RoundRows:
+    name: str
+    rows: list
+
+
+@dataclass(slots=True)
+class CategoryRows:
+    label: str
+    rounds: list[RoundRows]
+
+
+def serialize_results(
+    categories: list[CategoryRows], is_lead: bool
+) -> list[dict[str, Any]]:
+    """Competition results payload for `get_competition_results`.
+
+    Each shared route result is serialized once and its dict is shared
+    between climbers, so the payload must be treated as read-only.
+    """
+    result_dict = _result_serializer(is_lead)
+    return [
+        {
+            "category": category.label,
+            "rounds": [
+                {
+                    "round_name": round_rows.name,
+                    "results": [result_dict(row) for row in round_rows.rows],
+                }
+                for round_rows in category.rounds
+            ],
+        }
+        for category in categories
+    ]
+
+
+def serialize_result_changes(
+    changes: list[ResultChange], is_lead: bool
+) -> list[dict[str, Any]]:
+    """Changed rows for `get_competition_results_since`: the result entries
+    of `serialize_results`, each with the round and category it belongs to.
+    """
+    result_dict = _result_serializer(is_lead)
+    return [
+        {
+            "round_id": change.round_id,
+            "climber_id": change.row.score.climber_id,
+            "category": change.category,
+            "round_name": change.round_name,
+            **result_dict(change.row),
+        }
+        for change in changes
+    ]
+
+
+def _result_serializer(is_lead: bool):
+    route_dicts: dict[RouteResult, dict[str, Any]] = {}
+
+    def route_dict(route: RouteResult) -> dict[str, Any]:
+        data = route_dicts.get(route)
+        if data is None:
+            data = route_dicts[route] = route.as_dict(is_lead)
+        return data
+
+    def result_dict(row: ResultRow) -> dict[str, Any]:
+        score = row.score
+        data = {
+            "rank": row.rank,
+            "full_name": score.name or "Name unknown",
+            "tops": score.tops,
+            "attempts_top": score.attempts_tops,
+            "zones": score.zones,
+            "attempts_zone": score.attempts_zones,
+            "total_score": points(score.total_score_tenths),
+            "routes": [route_dict(route) for route in row.routes],
+        }
+        if is_lead:
+            data["best_hold_reached"] = score.best_hold_reached
+            data["best_time_seconds"] = score.best_time_seconds
+        return data
+
+    return result_dict
+
+
+def serialize_startlist(categories: list[CategoryRows]) -> list[dict[str, Any]]:
+    """Competition start list payload for `get_competition_startlist`."""
+    return [
+        {
+            "category": category.label,
+            "rounds": [
+                {
+                    "round_name": round_rows.name,
+                    "athletes": [
+                        {
+                            "start_order": entry.start_order,
+                            "full_name": entry.full_name,
+                            "category_name": entry.category_name,
+                        }
+                        for entry in round_rows.rows
+                    ],
+                }
+                for round_rows in category.rounds
+            ],
+        }
+        for category in categories
+    ]
@@ -8,6 +8,11 @@ class CreateClimbSerializer(serializers.Serializer):
     attempts_zone = serializers.IntegerField(min_value=0, default=0)
     top_reached = serializers.BooleanField(default=False)
     zone_reached = serializers.BooleanField(default=False)
+    hold_reached = serializers.IntegerField(min_value=0, required=False)
+    plus_modifier = serializers.BooleanField(required=False)
+    time_seconds = serializers.IntegerField(
+        min_value=0, required=False, allow_null=True
+    )
 
 
 class UpdateClimbSerializer(serializers.Serializer):
@@ -15,6 +20,12 @@ class UpdateClimbSerializer(serializers.Serializer):
     attempts_zone = serializers.IntegerField(min_value=0, required=False)
     top_reached = serializers.BooleanField(required=False)
     zone_reached = serializers.BooleanField(required=False)
+    hold_reached = serializers.IntegerField(min_value=0, required=False)
+    plus_modifier = serializers.BooleanField(required=False)
+    time_seconds = serializers.IntegerField(
+        min_value=0, required=False, allow_null=True
+    )
+    version = serializers.IntegerField(min_value=1, required=False)
 
 
 class CreateStartlistSerializer(serializers.Serializer):
@@ -25,6 +36,13 @@ class CreateStartlistSerializer(serializers.Serializer):
 
 class UpdateStartlistSerializer(serializers.Serializer):
     start_order = serializers.IntegerField(min_value=1, required=False)
+    version = serializers.IntegerField(min_value=1, required=False)
+
+
+class MoveStartlistSerializer(serializers.Serializer):
+    # Entry to move right after; null moves to the front.
+    after = serializers.IntegerField(allow_null=True)
+    version = serializers.IntegerField(min_value=1, required=False)
 
 
 class BulkUpdateStartlistOrderEntrySerializer(serializers.Serializer):
@@ -35,3 +53,8 @@ class BulkUpdateStartlistOrderEntrySerializer(serializers.Serializer):
 class BulkUpdateStartlistOrderSerializer(serializers.Serializer):
     round_id = serializers.IntegerField()
     entries = BulkUpdateStartlistOrderEntrySerializer(many=True, allow_empty=False)
+
+
+class AdvanceRoundOrderSerializer(serializers.Serializer):
+    competition = serializers.IntegerField()
+    round_order = serializers.IntegerField(min_value=1)
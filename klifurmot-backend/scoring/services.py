@@ -1,61 +1,82 @@
 from typing import Any, Optional
 
 from django.db import transaction
-from django.utils import timezone
-from .models import Climb, ClimberRoundScore, RoundResult
+from django.db.models import F, FilteredRelation, Q
+from core.changes import changed_after, current_version
+from core.exceptions import ConflictError
+from core.upsert import CONFLICT, upsert, upsert_one_or_raise
+from .models import START_POSITION, Climb, ClimbEvent, ClimberRoundScore, RoundResult
+from . import ordering
+from .coordinator import schedule_rerank
+from .events import climb_state, record_climb_event
+from .engines import engine_for_round, get_engine, points
+from .rows import ClimbRow, ScoreRow, StartlistRow
 from .utils import UpdateRoundScoreForRoute, BroadcastScoreUpdate
 from competitions.models import Route, CompetitionRound
+from competitions.versions import bump_competition_version
 from athletes.models import Climber
-from accounts.authorization import require_competition_judge, require_competition_admin
+from accounts.authorization import (
+    is_competition_admin,
+    require_competition_judge,
+    require_competition_admin,
+)
+
+ADVANCE_DENIED = "You do not have permission to advance climbers in this competition"
 
 
 def list_climbs(
     round_id: int, climber_id: Optional[int] = None
 ) -> list[dict[str, Any]]:
-    queryset = Climb.objects.select_related(
-        "climber__user_account",
-        "route",
-    ).filter(
+    queryset = Climb.objects.filter(
         route__round_id=round_id,
-        deleted=False,
     )
 
     if climber_id:
         queryset = queryset.filter(climber_id=climber_id)
 
-    result = []
+    return _climb_payloads(queryset.order_by("climber_id", "route__route_number"))
 
-    for climb in queryset:
-        climber = climb.climber
 
-        if climber.is_simple_athlete:
-            climber_name = climber.simple_name
-        else:
-            climber_name = (
-                climber.user_account.full_name if climber.user_account else None
-            )
+def list_climbs_since(
+    round_id: int, since: int, climber_id: Optional[int] = None
+) -> dict[str, Any]:
+    """Climbs of the round changed after the `since` version, with the ids
+    of climbs deleted since then (none from version 0) and the version to
+    ask from next.
+    """
+    version = current_version()
+    queryset = Climb.all_objects.filter(
+        route__round_id=round_id,
+        last_modified_at__gt=changed_after(since),
+    )
+
+    if climber_id:
+        queryset = queryset.filter(climber_id=climber_id)
+
+    return {
+        "version": version,
+        "changes": _climb_payloads(
+            queryset.filter(deleted=False).order_by("climber_id", "route__route_number")
+        ),
+        "deleted": (
+            list(queryset.filter(deleted=True).values_list("id", flat=True))
+            if since
+            else []
+        ),
+    }
 
-        result.append(
-            {
-                "id": climb.pk,
-                "climber_id": climber.pk,
-                "climber_name": climber_name,
-                "route_id": climb.route.pk,
-                "route_number": climb.route.route_number,
-                "attempts_top": climb.attempts_top,
-                "attempts_zone": climb.attempts_zone,
-                "top_reached": climb.top_reached,
-                "zone_reached": climb.zone_reached,
-            }
-        )
 
-    return result
+def _climb_payloads(queryset) -> list[dict[str, Any]]:
+    return [
+        ClimbRow.from_row(row).as_dict()
+        for row in queryset.values_list(*ClimbRow.columns)
+    ]
 
 
 def add_to_startlist(user, **data: Any) -> dict[str, Any]:
     try:
         round_obj = CompetitionRound.objects.select_related("competition_category").get(
-            id=data["round"], deleted=False
+            id=data["round"]
         )
     except CompetitionRound.DoesNotExist:
         raise ValueError(f"Round with id {data['round']} not found")
@@ -63,54 +84,40 @@ def add_to_startlist(user, **data: Any) -> dict[str, Any]:
     require_competition_admin(user, round_obj.competition_category.competition_id)
 
     try:
-        climber = Climber.objects.get(id=data["climber"], deleted=False)
+        climber = Climber.objects.get(id=data["climber"])
     except Climber.DoesNotExist:
         raise ValueError(f"Climber with id {data['climber']} not found")
 
-    existing = RoundResult.objects.filter(
-        round=round_obj,
-        climber=climber,
-    ).first()
-
-    if existing:
-        if not existing.deleted:
-            raise ValueError("Climber is already in the start list for this round")
-
-        duplicate_order = RoundResult.objects.filter(
-            round=round_obj,
-            start_order=data["start_order"],
-            deleted=False,
-        ).exists()
+    with transaction.atomic():
+        # A revived entry starts unranked instead of keeping its old rank.
+        result = upsert_one_or_raise(
+            RoundResult(
+                round=round_obj,
+                climber=climber,
+                start_order=data["start_order"],
+                created_by=user,
+                last_modified_by=user,
+            ),
+            "unique_active_round_result",
+            ["start_order", "start_key", "rank", "last_modified_by"],
+            conflict="Climber is already in the start list for this round",
+        )
 
-        if duplicate_order:
-            raise ValueError(
-                f"Start order {data['start_order']} is already taken in this round"
+        duplicate_order = (
+            RoundResult.objects.filter(
+                round=round_obj,
+                start_order=data["start_order"],
             )
-
-        existing.deleted = False
-        existing.start_order = data["start_order"]
-        existing.last_modified_by = user
-        existing.save()
-        result = existing
-    else:
-        duplicate_order = RoundResult.objects.filter(
-            round=round_obj,
-            start_order=data["start_order"],
-            deleted=False,
-        ).exists()
+            .exclude(pk=result.pk)
+            .exists()
+        )
 
         if duplicate_order:
             raise ValueError(
                 f"Start order {data['start_order']} is already taken in this round"
             )
 
-        result = RoundResult.objects.create(
-            round=round_obj,
-            climber=climber,
-            start_order=data["start_order"],
-            created_by=user,
-            last_modified_by=user,
-        )
+    bump_competition_version(round_obj.competition_category.competition_id)
 
     if climber.is_simple_athlete:
         climber_name = climber.simple_name
@@ -126,64 +133,20 @@ def add_to_startlist(user, **data: Any) -> dict[str, Any]:
         "start_order": result.start_order,
         "gender": gender,
         "rank": result.rank,
-    }
-
-
-def _normalize_climb_data(
-    attempts_top: int,
-    attempts_zone: int,
-    top_reached: bool,
-    zone_reached: bool,
-) -> dict[str, Any]:
-    """
-    Apply consistency rules to climb data. Returns the (possibly adjusted)
-    values as a dict ready to splat into Climb fields.
-
-    Rules (matching World Climbing boulder scoring):
-      - A top implies a zone was reached on the way (so attempts_zone >= 1)
-      - attempts_top cannot be fewer than attempts_zone (you reach zone before top)
-      - If no zone was reached, attempts_zone mirrors attempts_top
-        (there's no separate "attempts to zone" count to track)
-    """
-    if attempts_top < 0 or attempts_zone < 0:
-        raise ValueError("Attempts cannot be negative")
-
-    if top_reached and attempts_top < 1:
-        raise ValueError("A top requires at least one attempt")
-
-    if zone_reached and attempts_zone < 1:
-        raise ValueError("Reaching a zone requires at least one zone attempt")
-
-    if top_reached and not zone_reached:
-        zone_reached = True
-
-    if top_reached and attempts_zone < 1:
-        attempts_zone = 1
-
-    if attempts_zone > attempts_top:
-        attempts_top = attempts_zone
-
-    if not zone_reached:
-        attempts_zone = attempts_top
-
-    return {
-        "attempts_top": attempts_top,
-        "attempts_zone": attempts_zone,
-        "top_reached": top_reached,
-        "zone_reached": zone_reached,
+        "version": result.version,
     }
 
 
 def create_climb(user, **data: Any) -> dict[str, Any]:
     try:
-        climber = Climber.objects.get(id=data["climber"], deleted=False)
+        climber = Climber.objects.get(id=data["climber"])
     except Climber.DoesNotExist:
         raise ValueError(f"Climber with id {data['climber']} not found")
 
     try:
         route = Route.objects.select_related(
             "round__competition_category__competition"
-        ).get(id=data["route"], deleted=False)
+        ).get(id=data["route"])
     except Route.DoesNotExist:
         raise ValueError(f"Route with id {data['route']} not found")
 
@@ -192,51 +155,40 @@ def create_climb(user, **data: Any) -> dict[str, Any]:
     in_startlist = RoundResult.objects.filter(
         round=route.round,
         climber=climber,
-        deleted=False,
     ).exists()
 
     if not in_startlist:
         raise ValueError("Climber is not in the start list for this round")
 
-    normalized = _normalize_climb_data(
-        attempts_top=data.get("attempts_top", 0),
-        attempts_zone=data.get("attempts_zone", 0),
-        top_reached=data.get("top_reached", False),
-        zone_reached=data.get("zone_reached", False),
+    engine = engine_for_round(route.round)
+    normalized = engine.normalize(
+        **{
+            field: data.get(field, default)
+            for field, default in engine.climb_defaults.items()
+        }
     )
 
     with transaction.atomic():
-        existing = Climb.objects.filter(
-            climber=climber,
-            route=route,
-        ).first()
-
-        if existing and not existing.deleted:
-            raise ValueError("A climb already exists for this climber and route.")
-
-        if existing:
-            existing.deleted = False
-            existing.attempts_top = normalized["attempts_top"]
-            existing.attempts_zone = normalized["attempts_zone"]
-            existing.top_reached = normalized["top_reached"]
-            existing.zone_reached = normalized["zone_reached"]
-            existing.judge = user
-            existing.last_modified_by = user
-            existing.save()
-            climb = existing
-        else:
-            climb = Climb.objects.create(
+        climb = upsert_one_or_raise(
+            Climb(
                 climber=climber,
                 route=route,
                 **normalized,
                 judge=user,
                 created_by=user,
                 last_modified_by=user,
-            )
+            ),
+            "unique_active_climb",
+            [*normalized, "judge", "last_modified_by"],
+            conflict="A climb already exists for this climber and route.",
+        )
+        climb.route = route
+        climb.climber = climber
 
+        record_climb_event(ClimbEvent.CREATE, climb, before=None, judge=user)
         UpdateRoundScoreForRoute(climb)
-        _update_round_results(route.round)
-        BroadcastScoreUpdate(route.round.competition_category.competition_id)
+        bump_competition_version(route.round.competition_category.competition_id)
+        schedule_rerank(route.round.pk)
 
     if climber.is_simple_athlete:
         climber_name = climber.simple_name
@@ -253,45 +205,58 @@ def create_climb(user, **data: Any) -> dict[str, Any]:
         "attempts_zone": climb.attempts_zone,
         "top_reached": climb.top_reached,
         "zone_reached": climb.zone_reached,
+        "hold_reached": climb.hold_reached,
+        "plus_modifier": climb.plus_modifier,
+        "time_seconds": climb.time_seconds,
+        "version": climb.version,
     }
 
 
-def _update_round_results(round_obj):
-    ranked = _rank_climbers_in_round(round_obj)
+def _update_round_results(round_obj) -> set[int]:
+    """Persist ranks for the round and return the climber ids whose rank moved."""
+    engine = engine_for_round(round_obj)
+    rows = list(
+        ClimberRoundScore.objects.filter(round=round_obj)
+        .order_by()
+        .values_list("climber_id", *engine.rank_fields)
+    )
+    climber_ids = [row[0] for row in rows]
+    columns = {
+        name: [row[position] for row in rows]
+        for position, name in enumerate(engine.rank_fields, start=1)
+    }
+    ranked = [
+        (climber_ids[index], rank)
+        for index, rank in engine.rank_columns(
+            climber_ids, columns, _previous_round_ranks(round_obj)
+        )
+    ]
+
     with transaction.atomic():
-        for climber_id, _score, rank in ranked:
-            RoundResult.objects.filter(
-                round=round_obj, climber_id=climber_id, deleted=False
-            ).update(rank=rank, last_modified_at=timezone.now())
+        stored_ranks = dict(
+            RoundResult.objects.filter(round=round_obj).values_list(
+                "climber_id", "rank"
+            )
+        )
 
+        changed = set()
+        for climber_id, rank in ranked:
+            if climber_id not in stored_ranks or stored_ranks[climber_id] == rank:
+                continue
+            RoundResult.objects.filter(round=round_obj, climber_id=climber_id).update(
+                rank=rank
+            )
+            changed.add(climber_id)
 
-def get_climb(climb_id: int) -> dict[str, Any]:
-    try:
-        climb = Climb.objects.select_related(
-            "climber__user_account",
-            "route",
-        ).get(id=climb_id, deleted=False)
-    except Climb.DoesNotExist:
-        raise ValueError(f"Climb with id {climb_id} not found")
+    return changed
 
-    climber = climb.climber
 
-    if climber.is_simple_athlete:
-        climber_name = climber.simple_name
-    else:
-        climber_name = climber.user_account.full_name if climber.user_account else None
+def get_climb(climb_id: int) -> dict[str, Any]:
+    climbs = _climb_payloads(Climb.objects.filter(id=climb_id))
+    if not climbs:
+        raise ValueError(f"Climb with id {climb_id} not found")
 
-    return {
-        "id": climb.pk,
-        "climber_id": climber.pk,
-        "climber_name": climber_name,
-        "route_id": climb.route.pk,
-        "route_number": climb.route.route_number,
-        "attempts_top": climb.attempts_top,
-        "attempts_zone": climb.attempts_zone,
-        "top_reached": climb.top_reached,
-        "zone_reached": climb.zone_reached,
-    }
+    return climbs[0]
 
 
 def update_climb(climb_id: int, user, **update_data: Any) -> dict[str, Any]:
@@ -299,7 +264,7 @@ def update_climb(climb_id: int, user, **update_data: Any) -> dict[str, Any]:
         climb = Climb.objects.select_related(
             "climber__user_account",
             "route__round__competition_category__competition",
-        ).get(id=climb_id, deleted=False)
+        ).get(id=climb_id)
     except Climb.DoesNotExist:
         raise ValueError(f"Climb with id {climb_id} not found")
 
@@ -307,23 +272,54 @@ def update_climb(climb_id: int, user, **update_data: Any) -> dict[str, Any]:
         user, climb.route.round.competition_category.competition_id
     )
 
+    expected_version = update_data.get("version", climb.version)
+    if expected_version != climb.version:
+        raise ConflictError(
+            "Climb was modified by another judge",
+            current=get_climb(climb_id),
+        )
+
+    before = climb_state(climb)
+
     with transaction.atomic():
-        normalized = _normalize_climb_data(
-            attempts_top=update_data.get("attempts_top", climb.attempts_top),
-            attempts_zone=update_data.get("attempts_zone", climb.attempts_zone),
-            top_reached=update_data.get("top_reached", climb.top_reached),
-            zone_reached=update_data.get("zone_reached", climb.zone_reached),
+        engine = engine_for_round(climb.route.round)
+        normalized = engine.normalize(
+            **{
+                field: update_data.get(field, getattr(climb, field))
+                for field in engine.climb_fields
+            }
+        )
+
+        # Conditional write: only applies if nobody else bumped the version
+        # since we read the row, so concurrent corrections cannot silently
+        # overwrite each other and no row lock is held while judging.
+        updated = Climb.objects.filter(
+            id=climb.pk,
+            version=expected_version,
+        ).update(
+            **normalized,
+            last_modified_by=user,
+            version=F("version") + 1,
         )
 
+        if not updated:
+            raise ConflictError(
+                "Climb was modified by another judge",
+                current=get_climb(climb_id),
+            )
+
         for field, value in normalized.items():
             setattr(climb, field, value)
 
         climb.last_modified_by = user
-        climb.save()
+        climb.version = expected_version + 1
 
+        record_climb_event(ClimbEvent.UPDATE, climb, before=before, judge=user)
         UpdateRoundScoreForRoute(climb)
-        _update_round_results(climb.route.round)
-        BroadcastScoreUpdate(climb.route.round.competition_category.competition_id)
+        bump_competition_version(
+            climb.route.round.competition_category.competition_id
+        )
+        schedule_rerank(climb.route.round.pk)
 
     climber = climb.climber
 
@@ -342,6 +338,10 @@ def update_climb(climb_id: int, user, **update_data: Any) -> dict[str, Any]:
         "attempts_zone": climb.attempts_zone,
         "top_reached": climb.top_reached,
         "zone_reached": climb.zone_reached,
+        "hold_reached": climb.hold_reached,
+        "plus_modifier": climb.plus_modifier,
+        "time_seconds": climb.time_seconds,
+        "version": climb.version,
     }
 
 
@@ -349,7 +349,7 @@ def delete_climb(climb_id: int, user) -> None:
     try:
         climb = Climb.objects.select_related(
             "route__round__competition_category__competition"
-        ).get(id=climb_id, deleted=False)
+        ).get(id=climb_id)
     except Climb.DoesNotExist:
         raise ValueError(f"Climb with id {climb_id} not found")
 
@@ -360,55 +360,75 @@ def delete_climb(climb_id: int, user) -> None:
     )
 
     round_obj = climb.route.round
-    competition_id = round_obj.competition_category.competition_id
 
     with transaction.atomic():
         climb.deleted = True
+        climb.version += 1
         climb.save()
 
+        record_climb_event(
+            ClimbEvent.DELETE, climb, before=climb_state(climb), judge=user
+        )
         UpdateRoundScoreForRoute(climb)
-        _update_round_results(round_obj)
-        BroadcastScoreUpdate(competition_id)
+        bump_competition_version(round_obj.competition_category.competition_id)
+        schedule_rerank(round_obj.pk)
 
 
 def list_startlist(round_id: int) -> list[dict[str, Any]]:
-    results = (
-        RoundResult.objects.select_related(
-            "climber__user_account",
-        )
-        .filter(
-            round_id=round_id,
-            deleted=False,
-        )
-        .order_by("start_order")
-    )
-
-    data = []
-
-    for result in results:
-        climber = result.climber
+    return [row.as_dict() for row in _startlist_rows(round_id)]
 
-        if climber.is_simple_athlete:
-            climber_name = climber.simple_name
-            gender = climber.simple_gender
-        else:
-            climber_name = (
-                climber.user_account.full_name if climber.user_account else None
-            )
-            gender = climber.user_account.gender if climber.user_account else None
 
-        data.append(
-            {
-                "id": result.pk,
-                "climber_id": climber.pk,
-                "climber_name": climber_name,
-                "start_order": result.start_order,
-                "gender": gender,
-                "rank": result.rank,
-            }
+def _startlist_rows(round_id: int) -> list[StartlistRow]:
+    """The round's start list in position order, numbered with the
+    integer view of `ordering.start_order_view`."""
+    rows = [
+        StartlistRow.from_row(row)
+        for row in RoundResult.objects.filter(
+            round_id=round_id,
         )
+        .order_by(START_POSITION, "id")
+        .values_list(*StartlistRow.columns)
+    ]
+    numbers = ordering.start_order_view([row.start_order for row in rows])
+    for row, number in zip(rows, numbers):
+        row.start_order = number
+    return rows
+
+
+def list_startlist_since(round_id: int, since: int) -> dict[str, Any]:
+    """Start list entries of the round changed after the `since` version,
+    with the ids of entries removed since then (none from version 0) and the
+    version to ask from next.
+    """
+    version = current_version()
+    queryset = RoundResult.all_objects.filter(
+        round_id=round_id,
+        last_modified_at__gt=changed_after(since),
+    )
+    # While moves wait for compaction, any change can renumber entries that
+    # were not written, so send the whole list.
+    if (
+        RoundResult.objects.filter(round_id=round_id, start_key__isnull=False).exists()
+        and queryset.exists()
+    ):
+        rows = _startlist_rows(round_id)
+    else:
+        rows = [
+            StartlistRow.from_row(row)
+            for row in queryset.filter(deleted=False)
+            .order_by("start_order")
+            .values_list(*StartlistRow.columns)
+        ]
 
-    return data
+    return {
+        "version": version,
+        "changes": [row.as_dict() for row in rows],
+        "deleted": (
+            list(queryset.filter(deleted=True).values_list("id", flat=True))
+            if since
+            else []
+        ),
+    }
 
 
 def update_startlist(result_id: int, user, **update_data: Any):
@@ -416,35 +436,66 @@ def update_startlist(result_id: int, user, **update_data: Any):
         result = RoundResult.objects.select_related(
             "round__competition_category",
             "climber__user_account",
-        ).get(id=result_id, deleted=False)
+        ).get(id=result_id)
     except RoundResult.DoesNotExist:
         raise ValueError(f"Start list entry with id {result_id} not found")
 
     require_competition_admin(user, result.round.competition_category.competition_id)
 
-    if "start_order" in update_data:
-        new_start_order = update_data["start_order"]
+    expected_version = update_data.get("version", result.version)
 
-        duplicate = (
-            RoundResult.objects.filter(
-                round=result.round,
-                start_order=new_start_order,
-                deleted=False,
+    with transaction.atomic():
+        # Store the numbers the start list shows, so the taken check and
+        # the returned entry match what organizers see after moves.
+        ordering.compact(result.round.pk)
+
+        values: dict[str, Any] = {}
+        if "start_order" in update_data:
+            new_start_order = update_data["start_order"]
+
+            duplicate = (
+                RoundResult.objects.filter(
+                    round=result.round,
+                    start_order=new_start_order,
+                )
+                .exclude(id=result.pk)
+                .exists()
             )
-            .exclude(id=result.pk)
-            .exists()
+
+            if duplicate:
+                raise ValueError(
+                    f"Start order {new_start_order} is already taken in this round"
+                )
+
+            values = {"start_order": new_start_order, "start_key": None}
+
+        updated = RoundResult.objects.filter(
+            id=result.pk,
+            version=expected_version,
+        ).update(
+            **values,
+            last_modified_by=user,
+            version=F("version") + 1,
         )
 
-        if duplicate:
-            raise ValueError(
-                f"Start order {new_start_order} is already taken in this round"
+        if not updated:
+            current = RoundResult.objects.select_related("climber__user_account").get(
+                id=result.pk
+            )
+            raise ConflictError(
+                "Start list entry was modified by another user",
+                current=_startlist_entry_data(current),
             )
 
-        result.start_order = new_start_order
+        result.refresh_from_db(fields=["start_order", "start_key", "version"])
 
     result.last_modified_by = user
-    result.save()
+    bump_competition_version(result.round.competition_category.competition_id)
+
+    return _startlist_entry_data(result)
 
+
+def _startlist_entry_data(result: RoundResult) -> dict[str, Any]:
     climber = result.climber
 
     if climber.is_simple_athlete:
@@ -461,9 +512,64 @@ def update_startlist(result_id: int, user, **update_data: Any):
         "start_order": result.start_order,
         "gender": gender,
         "rank": result.rank,
+        "version": result.version,
     }
 
 
+def move_startlist_entry(
+    result_id: int, user, after: Optional[int], version: Optional[int] = None
+) -> dict[str, Any]:
+    """Move an entry to right after entry `after`, or to the front with
+    None, writing only the moved row; see `scoring.ordering`.
+
+    Raises ConflictError if `version` is given and stale.
+    """
+    try:
+        result = RoundResult.objects.select_related(
+            "round__competition_category",
+            "climber__user_account",
+        ).get(id=result_id)
+    except RoundResult.DoesNotExist:
+        raise ValueError(f"Start list entry with id {result_id} not found")
+
+    require_competition_admin(user, result.round.competition_category.competition_id)
+
+    if after == result.pk:
+        raise ValueError("A start list entry cannot be moved after itself")
+
+    expected_version = result.version if version is None else version
+
+    with transaction.atomic():
+        round_id = result.round.pk
+        position = ordering.position_after(result, round_id, after)
+        if position is None:
+            ordering.compact(round_id)
+            position = ordering.position_after(result, round_id, after)
+
+        updated = RoundResult.objects.filter(
+            id=result.pk,
+            version=expected_version,
+        ).update(
+            start_key=position,
+            last_modified_by=user,
+            version=F("version") + 1,
+        )
+
+        if not updated:
+            current = RoundResult.objects.select_related("climber__user_account").get(
+                id=result.pk
+            )
+            raise ConflictError(
+                "Start list entry was modified by another user",
+                current=_startlist_entry_data(current),
+            )
+
+    bump_competition_version(result.round.competition_category.competition_id)
+
+    data = next(row for row in _startlist_rows(round_id) if row.id == result.pk)
+    return data.as_dict()
+
+
 def bulk_update_startlist_order(
     round_id: int,
     entries: list[dict[str, Any]],
@@ -476,7 +582,7 @@ def bulk_update_startlist_order(
     one PATCH at a time.
     """
     try:
-        round_obj = CompetitionRound.objects.get(id=round_id, deleted=False)
+        round_obj = CompetitionRound.objects.get(id=round_id)
     except CompetitionRound.DoesNotExist:
         raise ValueError(f"Round with id {round_id} not found")
 
@@ -493,7 +599,7 @@ def bulk_update_startlist_order(
     existing = list(
         RoundResult.objects.select_related(
             "climber__user_account",
-        ).filter(round=round_obj, deleted=False)
+        ).filter(round=round_obj)
     )
     existing_by_id = {r.pk: r for r in existing}
 
@@ -511,9 +617,14 @@ def bulk_update_startlist_order(
         for entry in entries:
             row = existing_by_id[entry["id"]]
             row.start_order = entry["start_order"]
+            row.start_key = None
             row.last_modified_by = user
+            row.version += 1
 
-        RoundResult.objects.bulk_update(existing, ["start_order", "last_modified_by"])
+        RoundResult.objects.bulk_update(
+            existing, ["start_order", "start_key", "last_modified_by", "version"]
+        )
+        bump_competition_version(round_obj.competition_category.competition_id)
 
     existing.sort(key=lambda r: r.start_order or 0)
 
@@ -537,6 +648,7 @@ def bulk_update_startlist_order(
                 "start_order": result.start_order,
                 "gender": gender,
                 "rank": result.rank,
+                "version": result.version,
             }
         )
 
@@ -546,7 +658,7 @@ def bulk_update_startlist_order(
 def remove_from_startlist(result_id: int, user) -> None:
     try:
         result = RoundResult.objects.select_related("round__competition_category").get(
-            id=result_id, deleted=False
+            id=result_id
         )
     except RoundResult.DoesNotExist:
         raise ValueError(f"Start list entry with id {result_id} not found")
@@ -554,208 +666,333 @@ def remove_from_startlist(result_id: int, user) -> None:
     require_competition_admin(user, result.round.competition_category.competition_id)
 
     result.deleted = True
+    result.version += 1
     result.save()
+    bump_competition_version(result.round.competition_category.competition_id)
 
 
 def list_scores(round_id: int) -> list[dict[str, Any]]:
-    try:
-        round_obj = CompetitionRound.objects.get(id=round_id, deleted=False)
-    except CompetitionRound.DoesNotExist:
-        return []
-
-    ranked = _rank_climbers_in_round(round_obj)
+    """Ranked scores for a round, read from the ranks persisted on write.
 
-    result = []
-    for climber_id, score, rank in ranked:
-        climber = score.climber
-        climber_name = (
-            climber.simple_name
-            if climber.is_simple_athlete
-            else (climber.user_account.full_name if climber.user_account else None)
+    Ranks are maintained by the rerank coordinator after every climb write,
+    so reads join them in instead of ranking the round again. Each entry
+    carries the score fields of the competition's discipline engine.
+    """
+    rows = list(
+        ClimberRoundScore.objects.filter(
+            round_id=round_id,
+            round__deleted=False,
         )
-        result.append(
-            {
-                "rank": rank,
-                "climber_id": climber_id,
-                "climber_name": climber_name,
-                "tops": score.tops,
-                "zones": score.zones,
-                "attempts_tops": score.attempts_tops,
-                "attempts_zones": score.attempts_zones,
-                "total_score": float(score.total_score),
-            }
+        .annotate(
+            result=FilteredRelation(
+                "climber__roundresult",
+                condition=Q(
+                    climber__roundresult__round_id=round_id,
+                    climber__roundresult__deleted=False,
+                ),
+            )
         )
+        .filter(result__rank__isnull=False)
+        .order_by("result__rank", "climber_id")
+        .values_list(
+            "result__rank",
+            "round__competition_category__competition__discipline",
+            *ScoreRow.columns,
+        )
+    )
+    if not rows:
+        return []
 
-    return result
+    score_fields = [
+        name
+        for name in get_engine(rows[0][1]).score_fields
+        if name != "total_score_tenths"
+    ]
+    scores = [(row[0], ScoreRow.from_row(row[2:])) for row in rows]
+
+    return [
+        {
+            "rank": rank,
+            "climber_id": score.climber_id,
+            "climber_name": score.name,
+            **{name: getattr(score, name) for name in score_fields},
+            "total_score": points(score.total_score_tenths),
+        }
+        for rank, score in scores
+    ]
 
 
 def advance_climbers(round_id: int, user) -> dict[str, Any]:
     try:
         current_round = CompetitionRound.objects.select_related(
             "competition_category"
-        ).get(id=round_id, deleted=False)
+        ).get(id=round_id)
     except CompetitionRound.DoesNotExist:
         raise ValueError(f"Round with id {round_id} not found")
 
     require_competition_admin(
         user,
         current_round.competition_category.competition_id,
-        message="You do not have permission to advance climbers in this competition",
+        message=ADVANCE_DENIED,
     )
 
     if not current_round.completed:
         raise ValueError("Round must be marked as completed before advancing climbers")
 
-    all_rounds = list(
-        CompetitionRound.objects.filter(
-            competition_category=current_round.competition_category,
-            deleted=False,
-        ).order_by("round_order")
-    )
-
-    try:
-        current_index = all_rounds.index(current_round)
-        next_round = (
-            all_rounds[current_index + 1]
-            if current_index + 1 < len(all_rounds)
-            else None
-        )
-    except (ValueError, IndexError):
-        next_round = None
-
+    next_round = _next_rounds([current_round]).get(current_round.pk)
     if not next_round:
         raise ValueError("No next round found")
 
-    all_results = RoundResult.objects.filter(
-        round=current_round,
-        deleted=False,
-        rank__isnull=False,
-    ).order_by("rank")
-
-    if not all_results.exists():
+    plan = _plan_advancement([(current_round, next_round)])
+    if current_round.pk not in plan:
         raise ValueError("No ranked results found for this round")
 
-    num_to_advance = next_round.climbers_advance
-    existing_climber_ids = set(
-        RoundResult.objects.filter(
-            round=next_round,
-            deleted=False,
-        ).values_list("climber_id", flat=True)
-    )
-
-    selected = []
-    cutoff_rank = None
-    for result in all_results:
-        if result.climber.pk in existing_climber_ids:
-            continue
-        if len(selected) < num_to_advance:
-            selected.append(result)
-            cutoff_rank = result.rank
-        elif result.rank == cutoff_rank:
-            selected.append(result)
-        else:
-            break
-
-    selected.reverse()
-
-    existing_orders = RoundResult.objects.filter(
-        round=next_round,
-        deleted=False,
-    ).values_list("start_order", flat=True)
-
-    max_order = max(existing_orders, default=0) or 0
-
-    added = 0
-    for index, result in enumerate(selected, start=1):
-        existing = RoundResult.objects.filter(
-            round=next_round,
-            climber=result.climber,
-        ).first()
-
-        if existing:
-            if existing.deleted:
-                existing.deleted = False
-                existing.start_order = max_order + index
-                existing.save()
-                added += 1
-        else:
-            RoundResult.objects.create(
-                round=next_round,
-                climber=result.climber,
-                start_order=max_order + index,
-                created_by=result.created_by,
-            )
-            added += 1
+    added = _write_advancement(plan)
 
     BroadcastScoreUpdate(current_round.competition_category.competition_id)
 
     return {
-        "advanced": added,
+        "advanced": added[current_round.pk],
         "next_round_id": next_round.pk,
         "next_round_name": next_round.round_group.name,
     }
 
 
-def _rank_climbers_in_round(round_obj):
+def advance_round_order(competition_id: int, round_order: int, user) -> dict[str, Any]:
+    """Advance climbers from the round at `round_order` of every category
+    of the competition at once; see `advance_rounds`.
+    """
+    require_competition_admin(user, competition_id, message=ADVANCE_DENIED)
+
+    round_ids = list(
+        CompetitionRound.objects.filter(
+            competition_category__competition_id=competition_id,
+            round_order=round_order,
+        ).values_list("id", flat=True)
+    )
+    if not round_ids:
+        raise ValueError(f"No rounds with round order {round_order} found")
+
+    rounds = advance_rounds(round_ids, user)
+    return {
+        "competition_id": competition_id,
+        "round_order": round_order,
+        "advanced": sum(entry["advanced"] for entry in rounds),
+        "rounds": rounds,
+    }
+
+
+def advance_rounds(round_ids, user) -> list[dict[str, Any]]:
+    """Advance climbers from each of the rounds with one read of the ranks,
+    one of the next rounds' start lists and one write for all of them.
+
+    A round that cannot advance gets an `error` in its entry instead of
+    failing the others. Each competition is broadcast once at the end.
     """
-    IFSC boulder ranking (Annex C §7.1):
-      1. total_score descending
-      2. countback to previous round rank (no group-split for klifurmot)
-      3. attempts_tops ascending
-      4. attempts_zones ascending
-
-    Returns list of (climber_id, score, rank) sorted by rank ascending.
-    Climbers with no ClimberRoundScore (didn't attempt any boulder) are excluded.
+    rounds = list(
+        CompetitionRound.objects.filter(id__in=round_ids)
+        .select_related("competition_category__category_group")
+        .order_by("competition_category_id", "round_order")
+    )
+    allowed = {
+        competition_id: is_competition_admin(user, competition_id)
+        for competition_id in {
+            round_obj.competition_category.competition_id for round_obj in rounds
+        }
+    }
+    following = _next_rounds(rounds)
+
+    report: dict[int, dict[str, Any]] = {}
+    pairs = []
+    for round_obj in rounds:
+        category = round_obj.competition_category
+        next_round = following.get(round_obj.pk)
+        entry = report[round_obj.pk] = {
+            "round_id": round_obj.pk,
+            "category_id": category.pk,
+            "category_name": f"{category.category_group.name} {category.gender}",
+            "advanced": 0,
+            "next_round_id": next_round.pk if next_round else None,
+            "next_round_name": next_round.round_group.name if next_round else None,
+            "error": None,
+        }
+        if not allowed[category.competition_id]:
+            entry["error"] = ADVANCE_DENIED
+        elif not round_obj.completed:
+            entry["error"] = (
+                "Round must be marked as completed before advancing climbers"
+            )
+        elif not next_round:
+            entry["error"] = "No next round found"
+        else:
+            pairs.append((round_obj, next_round))
+
+    plan = _plan_advancement(pairs)
+    for round_obj, _next_round in pairs:
+        if round_obj.pk not in plan:
+            report[round_obj.pk]["error"] = "No ranked results found for this round"
+    for round_id, added in _write_advancement(plan).items():
+        report[round_id]["advanced"] = added
+
+    for competition_id in {
+        round_obj.competition_category.competition_id
+        for round_obj, _next_round in pairs
+        if round_obj.pk in plan
+    }:
+        BroadcastScoreUpdate(competition_id)
+
+    return list(report.values())
+
+
+def _next_rounds(rounds) -> dict[int, CompetitionRound]:
+    """The round after each of `rounds` in its category, by round id."""
+    by_category: dict[int, list[CompetitionRound]] = {}
+    for round_obj in (
+        CompetitionRound.objects.filter(
+            competition_category_id__in={
+                round_obj.competition_category_id for round_obj in rounds
+            }
+        )
+        .select_related("round_group")
+        .order_by("competition_category_id", "round_order", "id")
+    ):
+        by_category.setdefault(round_obj.competition_category_id, []).append(round_obj)
+
+    return {
+        current.pk: following
+        for category_rounds in by_category.values()
+        for current, following in zip(category_rounds, category_rounds[1:])
+    }
+
+
+def _plan_advancement(pairs) -> dict[int, list[RoundResult]]:
+    """New next-round entries for each (round, next round) pair, keyed by
+    the round's id; rounds without ranked results are left out.
+
+    The top `climbers_advance` climbers not already in the next round go
+    through, with everyone tied at the cutoff rank. They are appended to
+    the next round's start list in reverse rank order, so the leader
+    climbs last.
     """
-    scores = list(
-        ClimberRoundScore.objects.filter(round=round_obj, deleted=False).select_related(
-            "climber"
+    next_of = {current.pk: following for current, following in pairs}
+
+    ranked: dict[int, list[tuple[int, int, Optional[int]]]] = {}
+    for round_id, climber_id, rank, created_by_id in (
+        RoundResult.objects.filter(round_id__in=next_of, rank__isnull=False)
+        .order_by("round_id", "rank", "id")
+        .values_list("round_id", "climber_id", "rank", "created_by_id")
+    ):
+        ranked.setdefault(round_id, []).append((climber_id, rank, created_by_id))
+
+    entered: dict[int, set[int]] = {
+        following.pk: set() for following in next_of.values()
+    }
+    last_order = dict.fromkeys(entered, 0)
+    for round_id, climber_id, start_order, start_key in RoundResult.objects.filter(
+        round_id__in=entered
+    ).values_list("round_id", "climber_id", "start_order", "start_key"):
+        entered[round_id].add(climber_id)
+        last_order[round_id] = max(
+            last_order[round_id], ordering.highest_place(start_order, start_key)
         )
+
+    plan = {}
+    for round_id, results in ranked.items():
+        next_round = next_of[round_id]
+        selected = []
+        cutoff_rank = None
+        for climber_id, rank, created_by_id in results:
+            if climber_id in entered[next_round.pk]:
+                continue
+            if len(selected) < (next_round.climbers_advance or 0):
+                selected.append((climber_id, created_by_id))
+                cutoff_rank = rank
+            elif rank == cutoff_rank:
+                selected.append((climber_id, created_by_id))
+            else:
+                break
+
+        selected.reverse()
+        plan[round_id] = [
+            RoundResult(
+                round=next_round,
+                climber_id=climber_id,
+                start_order=last_order[next_round.pk] + index,
+                created_by_id=created_by_id,
+            )
+            for index, (climber_id, created_by_id) in enumerate(selected, start=1)
+        ]
+        entered[next_round.pk].update(climber_id for climber_id, _ in selected)
+        last_order[next_round.pk] += len(selected)
+    return plan
+
+
+def _write_advancement(plan: dict[int, list[RoundResult]]) -> dict[int, int]:
+    """Write the planned entries in one upsert, reviving removed ones, and
+    count the entries written per source round."""
+    entries = [
+        (round_id, entry) for round_id, entries in plan.items() for entry in entries
+    ]
+    upserted = upsert(
+        [entry for _round_id, entry in entries],
+        "unique_active_round_result",
+        revive_fields=["start_order", "start_key", "rank"],
     )
+    added = dict.fromkeys(plan, 0)
+    for (round_id, _entry), row in zip(entries, upserted):
+        if row.outcome != CONFLICT:
+            added[round_id] += 1
+    return added
+
+
+def _rank_climbers_in_round(round_obj):
+    """
+    Rank the round with the engine for the competition's discipline; see
+    `BoulderEngine` and `LeadEngine` for the ordering rules.
+
+    Returns list of (climber_id, score, rank) sorted by rank ascending, where
+    `score` is a `ScoreRow` carrying the climber's display name.
+    Climbers with no ClimberRoundScore (didn't attempt any route) are excluded.
+    """
+    scores = [
+        ScoreRow.from_row(row)
+        for row in ClimberRoundScore.objects.filter(round=round_obj)
+        .order_by()
+        .values_list(*ScoreRow.columns)
+    ]
     if not scores:
         return []
 
-    all_rounds = list(
+    prev_rank_map = _previous_round_ranks(round_obj)
+
+    ranked = [
+        (score.climber_id, score, rank)
+        for score, rank in engine_for_round(round_obj).rank(scores, prev_rank_map)
+    ]
+
+    return ranked
+
+
+def _previous_round_ranks(round_obj) -> dict[int, int]:
+    """Ranks of the category's previous round, used for countback."""
+    round_ids = list(
         CompetitionRound.objects.filter(
-            competition_category=round_obj.competition_category,
-            deleted=False,
-        ).order_by("round_order")
+            competition_category_id=round_obj.competition_category_id,
+        )
+        .order_by("round_order")
+        .values_list("id", flat=True)
     )
     try:
-        idx = all_rounds.index(round_obj)
-        previous_round = all_rounds[idx - 1] if idx > 0 else None
+        idx = round_ids.index(round_obj.pk)
+        previous_round_id = round_ids[idx - 1] if idx > 0 else None
     except ValueError:
-        previous_round = None
-
-    prev_rank_map = {}
-    if previous_round:
-        prev_rank_map = {
-            r.climber.pk: r.rank
-            for r in RoundResult.objects.filter(round=previous_round, deleted=False)
-            if r.rank is not None
-        }
-
-    def rank_key(s):
-        return (
-            -float(s.total_score),
-            prev_rank_map.get(s.climber_id, 9999),
-            s.attempts_tops,
-            s.attempts_zones,
-        )
-
-    scores.sort(key=rank_key)
+        previous_round_id = None
 
-    ranked = []
-    previous_key = None
-    previous_rank = 0
-    for position, score in enumerate(scores, start=1):
-        key = rank_key(score)
-        if previous_key is not None and key == previous_key:
-            assigned_rank = previous_rank
-        else:
-            assigned_rank = position
-            previous_rank = position
-            previous_key = key
-        ranked.append((score.climber.pk, score, assigned_rank))
+    if not previous_round_id:
+        return {}
 
-    return ranked
+    return dict(
+        RoundResult.objects.filter(
+            round_id=previous_round_id, rank__isnull=False
+        ).values_list("climber_id", "rank")
+    )
@@ -0,0 +1,99 @@
+from datetime import timedelta
+from typing import TYPE_CHECKING, Callable, ContextManager
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, TransactionTestCase
+from django.utils import timezone
+
+from accounts.models import UserAccount
+from athletes.models import Climber
+from competitions.models import (
+    CategoryGroup,
+    Competition,
+    CompetitionCategory,
+    CompetitionRound,
+    RoundGroup,
+    Route,
+)
+from scoring import services
+from scoring.models import RoundResult
+
+
+class ScoringFixtureMixin(TestCase if TYPE_CHECKING else object):
+    if TYPE_CHECKING:
+        # Missing from the Django stubs bundled with pyright.
+        @classmethod
+        def captureOnCommitCallbacks(
+            cls, *, using: str = "default", execute: bool = False
+        ) -> ContextManager[list[Callable[[], None]]]: ...
+
+    def setUp(self):
+        cache.clear()
+
+        self.user = User.objects.create_user(
+            username="judge", email="judge@klifurmot.is", password="secret123"
+        )
+        UserAccount.objects.create(user=self.user, full_name="Judge", is_admin=True)
+
+        now = timezone.now()
+        self.competition = Competition.objects.create(
+            title="Bikarmót",
+            start_date=now - timedelta(hours=1),
+            end_date=now + timedelta(hours=5),
+            location="Klifurhúsið",
+        )
+        self.category = CompetitionCategory.objects.create(
+            competition=self.competition,
+            category_group=CategoryGroup.objects.create(name="Opinn flokkur"),
+            gender="KK",
+        )
+        self.round_group = RoundGroup.objects.create(name="Undankeppni")
+        self.round = self.create_round(round_order=1, route_count=4)
+        self.routes = list(Route.objects.filter(round=self.round))
+
+    def create_round(self, round_order, route_count=4, climbers_advance=0):
+        competition_round = CompetitionRound.objects.create(
+            competition_category=self.category,
+            round_group=self.round_group,
+            round_order=round_order,
+            route_count=route_count,
+            climbers_advance=climbers_advance,
+        )
+        Route.objects.bulk_create(
+            Route(round=competition_round, route_number=i)
+            for i in range(1, route_count + 1)
+        )
+        return competition_round
+
+    def create_climber(self, name, round_obj=None, start_order=None):
+        climber = Climber.objects.create(
+            simple_name=name, simple_age=25, simple_gender="KK", is_simple_athlete=True
+        )
+        round_obj = round_obj or self.round
+        RoundResult.objects.create(
+            round=round_obj,
+            climber=climber,
+            start_order=start_order
+            or RoundResult.objects.filter(round=round_obj).count() + 1,
+        )
+        return climber
+
+    def score(self, climber, route, attempts_top=0, attempts_zone=0, top=False, zone=False):
+        return services.create_climb(
+            user=self.user,
+            climber=climber.pk,
+            route=route.pk,
+            attempts_top=attempts_top,
+            attempts_zone=attempts_zone,
+            top_reached=top,
+            zone_reached=zone,
+        )
+
+
+class ScoringTestCase(ScoringFixtureMixin, TestCase):
+    pass
+
+
+class ScoringTransactionTestCase(ScoringFixtureMixin, TransactionTestCase):
+    pass
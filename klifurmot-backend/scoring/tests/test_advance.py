@@ -0,0 +1,94 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from competitions.models import CategoryGroup, CompetitionCategory, CompetitionRound
+from scoring import services
+from scoring.models import RoundResult
+
+from .base import ScoringTestCase
+
+
+class AdvanceClimbersTest(ScoringTestCase):
+    def setUp(self):
+        super().setUp()
+        self.final = self.create_round(round_order=2, climbers_advance=2)
+        CompetitionRound.objects.filter(pk=self.round.pk).update(completed=True)
+
+    def rank(self, round_obj, *ranks):
+        climbers = []
+        for index, rank in enumerate(ranks):
+            climber = self.create_climber(f"{round_obj.pk}-{index}", round_obj)
+            RoundResult.objects.filter(round=round_obj, climber=climber).update(
+                rank=rank
+            )
+            climbers.append(climber)
+        return climbers
+
+    def start_list(self, round_obj):
+        return list(
+            RoundResult.objects.filter(round=round_obj)
+            .order_by("start_order")
+            .values_list("climber_id", "start_order")
+        )
+
+    def test_takes_ties_at_the_cutoff_and_skips_entered_climbers(self):
+        first, second, third, tied, _ = self.rank(self.round, 1, 2, 3, 3, 5)
+        RoundResult.objects.create(round=self.final, climber=first, start_order=5)
+
+        result = services.advance_climbers(self.round.pk, self.user)
+
+        self.assertEqual(result["advanced"], 3)
+        self.assertEqual(result["next_round_id"], self.final.pk)
+        self.assertEqual(
+            self.start_list(self.final),
+            [(first.pk, 5), (tied.pk, 6), (third.pk, 7), (second.pk, 8)],
+        )
+
+    def test_query_count_does_not_grow_with_climbers(self):
+        def run(count):
+            RoundResult.objects.all().delete()
+            self.final.climbers_advance = count
+            self.final.save()
+            self.rank(self.round, *range(1, count + 1))
+            with CaptureQueriesContext(connection) as queries:
+                services.advance_climbers(self.round.pk, self.user)
+            return len(queries)
+
+        self.assertEqual(run(20), run(2))
+
+    def test_advances_every_category_for_a_round_order(self):
+        other = CompetitionCategory.objects.create(
+            competition=self.competition,
+            category_group=CategoryGroup.objects.create(name="U16"),
+            gender="KVK",
+        )
+        other_first, other_final = (
+            CompetitionRound.objects.create(
+                competition_category=other,
+                round_group=self.round_group,
+                round_order=order,
+                climbers_advance=1,
+            )
+            for order in (1, 2)
+        )
+        self.rank(self.round, 1, 2, 3)
+        winner, _ = self.rank(other_first, 1, 2)
+        client = APIClient()
+        client.force_authenticate(self.user)
+
+        response = client.post(
+            "/api/scoring/rounds/advance/",
+            {"competition": self.competition.pk, "round_order": 1},
+            format="json",
+        )
+        CompetitionRound.objects.filter(pk=other_first.pk).update(completed=True)
+        retried = services.advance_rounds([other_first.pk], self.user)
+
+        report = response.json()["data"]["rounds"]
+        self.assertEqual(response.json()["data"]["advanced"], 2)
+        self.assertEqual([entry["advanced"] for entry in report], [2, 0])
+        self.assertIn("completed", report[1]["error"])
+        self.assertEqual(retried[0]["advanced"], 1)
+        self.assertEqual(self.start_list(other_final), [(winner.pk, 1)])
+        self.assertEqual(len(self.start_list(self.final)), 2)
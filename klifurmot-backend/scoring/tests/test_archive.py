@@ -0,0 +1,104 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.utils import timezone
+
+from competitions.models import Route
+from competitions.services import delete_competition, restore_competition
+from core import archive
+from core.models import ArchivedRow
+from scoring import services
+from scoring.models import Climb, ClimberRoundScore, RoundResult
+
+from .base import ScoringTestCase
+
+
+class ArchiveDeletedTest(ScoringTestCase):
+    def setUp(self):
+        super().setUp()
+        self.anna = self.create_climber("Anna")
+        self.bjorn = self.create_climber("Björn")
+        for climber in (self.anna, self.bjorn):
+            self.score(climber, self.routes[0], attempts_top=1, top=True)
+        self.cutoff = timezone.now() + timedelta(seconds=1)
+
+    def age(self, model, days=100):
+        model.all_objects.filter(deleted=True).update(
+            last_modified_at=timezone.now() - timedelta(days=days)
+        )
+
+    def test_archives_old_deleted_rows_only(self):
+        old = Climb.objects.get(climber=self.anna)
+        services.delete_climb(old.pk, self.user)
+        self.age(Climb)
+        recent = Climb.objects.get(climber=self.bjorn)
+        services.delete_climb(recent.pk, self.user)
+
+        progress = archive.archive_deleted(timezone.now() - timedelta(days=90))
+
+        self.assertEqual(progress["scoring.Climb"].rows, 1)
+        self.assertFalse(Climb.all_objects.filter(pk=old.pk).exists())
+        self.assertTrue(Climb.all_objects.filter(pk=recent.pk).exists())
+        entry = ArchivedRow.objects.get(model="scoring.Climb", object_id=old.pk)
+        self.assertEqual(entry.competition, self.competition)
+        self.assertEqual(entry.data["route_id"], self.routes[0].pk)
+
+    def test_keeps_parents_that_live_rows_still_reference(self):
+        Route.objects.filter(pk=self.routes[0].pk).update(deleted=True)
+
+        archive.archive_deleted(self.cutoff)
+
+        self.assertTrue(Route.all_objects.filter(pk=self.routes[0].pk).exists())
+        self.assertEqual(Climb.objects.count(), 2)
+
+    def test_stops_at_max_rows_and_resumes(self):
+        delete_competition(self.competition.pk)
+
+        first = archive.archive_deleted(self.cutoff, batch_size=1, max_rows=3)
+        self.assertEqual(sum(stats.rows for stats in first.values()), 3)
+
+        archive.archive_deleted(self.cutoff, batch_size=1)
+
+        for model in (Climb, ClimberRoundScore, RoundResult, Route):
+            self.assertEqual(model.all_objects.count(), 0)
+        self.assertEqual(ArchivedRow.objects.count(), 2 + 2 + 2 + 4)
+
+    def test_restore_archived_then_restore_competition(self):
+        delete_competition(self.competition.pk)
+        climb = Climb.all_objects.get(climber=self.anna)
+        archive.archive_deleted(self.cutoff)
+
+        report = archive.restore_archived(competition_id=self.competition.pk)
+
+        self.assertEqual(report["competitions.Route"], {"restored": 4, "skipped": 0})
+        self.assertEqual(report["scoring.Climb"], {"restored": 2, "skipped": 0})
+        self.assertFalse(ArchivedRow.objects.exists())
+        restored = Climb.all_objects.get(pk=climb.pk)
+        self.assertTrue(restored.deleted)
+        self.assertEqual(restored.last_modified_at, climb.last_modified_at)
+
+        restore_competition(self.competition.pk, self.user)
+
+        self.assertEqual(Climb.objects.count(), 2)
+        self.assertEqual(RoundResult.objects.count(), 2)
+
+    def test_restore_skips_rows_whose_parent_is_archived(self):
+        Route.objects.filter(pk=self.routes[0].pk).update(deleted=True)
+        Climb.objects.update(deleted=True)
+        archive.archive_deleted(self.cutoff)
+
+        report = archive.restore_archived(labels=["scoring.Climb"])
+
+        self.assertEqual(report["scoring.Climb"], {"restored": 0, "skipped": 2})
+        self.assertEqual(ArchivedRow.objects.count(), 3)
+
+    def test_command_reports_throughput(self):
+        Climb.objects.update(deleted=True)
+        self.age(Climb)
+        out = StringIO()
+
+        call_command("archive_deleted", "--pause=0", stdout=out)
+
+        self.assertIn("Archived 2 rows", out.getvalue())
+        self.assertIn("rows/s", out.getvalue())
@@ -0,0 +1,180 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from athletes.models import Climber, CompetitionRegistration
+from athletes.services import (
+    delete_climber,
+    delete_registration,
+    restore_climber,
+    restore_registration,
+)
+from competitions.models import (
+    Competition,
+    CompetitionCategory,
+    CompetitionRound,
+    Route,
+)
+from competitions.services import (
+    delete_category,
+    delete_competition,
+    delete_round,
+    restore_competition,
+)
+from core.exceptions import ConflictError
+from scoring import services
+from scoring.models import Climb, ClimberRoundScore, RoundResult
+
+from .base import ScoringTestCase
+
+
+class SoftDeleteCascadeTest(ScoringTestCase):
+    def setUp(self):
+        super().setUp()
+        # Rounds can only be deleted before the competition starts.
+        Competition.objects.filter(pk=self.competition.pk).update(
+            start_date=self.competition.start_date.replace(year=2999),
+            end_date=self.competition.end_date.replace(year=2999),
+        )
+        self.anna = self.create_climber("Anna")
+        self.bjorn = self.create_climber("Björn")
+        for climber in (self.anna, self.bjorn):
+            CompetitionRegistration.objects.create(
+                competition=self.competition,
+                competition_category=self.category,
+                climber=climber,
+            )
+            self.score(climber, self.routes[0], attempts_top=1, top=True)
+
+    def live(self, model):
+        return model.objects.count()
+
+    def test_delete_competition_reports_rows_per_model(self):
+        counts = delete_competition(self.competition.pk)
+
+        self.assertEqual(
+            counts,
+            {
+                "competitions.Competition": 1,
+                "competitions.CompetitionCategory": 1,
+                "competitions.CompetitionRound": 1,
+                "competitions.Route": 4,
+                "scoring.RoundResult": 2,
+                "scoring.ClimberRoundScore": 2,
+                "scoring.Climb": 2,
+                "athletes.CompetitionRegistration": 2,
+            },
+        )
+        for model in (Route, RoundResult, ClimberRoundScore, Climb):
+            self.assertEqual(self.live(model), 0)
+        self.assertEqual(self.live(Climber), 2)
+
+    def test_statement_count_does_not_grow_with_rows(self):
+        with CaptureQueriesContext(connection) as small:
+            delete_round(self.round.pk, self.user)
+
+        other = self.create_round(round_order=2)
+        for index in range(8):
+            climber = self.create_climber(f"Klifrari {index}", round_obj=other)
+            for route in Route.objects.filter(round=other):
+                self.score(climber, route, attempts_top=1, top=True)
+
+        with CaptureQueriesContext(connection) as large:
+            delete_round(other.pk, self.user)
+
+        self.assertEqual(len(large), len(small))
+
+    def test_restore_brings_back_only_what_the_delete_took(self):
+        climb = Climb.objects.get(climber=self.anna)
+        services.delete_climb(climb.pk, self.user)
+
+        delete_competition(self.competition.pk)
+        counts = restore_competition(self.competition.pk, self.user)
+
+        self.assertEqual(counts["scoring.Climb"], 1)
+        self.assertEqual(self.live(Route), 4)
+        self.assertEqual(self.live(RoundResult), 2)
+        self.assertFalse(Climb.objects.filter(pk=climb.pk).exists())
+        self.assertTrue(Climb.objects.filter(climber=self.bjorn).exists())
+
+    def test_delete_registration_keeps_other_categories(self):
+        other_category = CompetitionCategory.objects.create(
+            competition=self.competition,
+            category_group=self.category.category_group,
+            gender="KVK",
+        )
+        other_round = CompetitionRound.objects.create(
+            competition_category=other_category,
+            round_group=self.round_group,
+            round_order=1,
+        )
+        RoundResult.objects.create(round=other_round, climber=self.anna, start_order=1)
+        registration = CompetitionRegistration.objects.get(climber=self.anna)
+
+        counts = delete_registration(registration.pk, self.user)
+
+        self.assertEqual(counts["scoring.RoundResult"], 1)
+        self.assertEqual(counts["scoring.Climb"], 1)
+        self.assertTrue(
+            RoundResult.objects.filter(round=other_round, climber=self.anna).exists()
+        )
+        self.assertTrue(RoundResult.objects.filter(climber=self.bjorn).exists())
+
+    def test_restore_conflicts_with_rows_created_again(self):
+        registration = CompetitionRegistration.objects.get(climber=self.anna)
+        delete_registration(registration.pk, self.user)
+        RoundResult.objects.create(round=self.round, climber=self.anna, start_order=9)
+
+        with self.assertRaises(ConflictError):
+            restore_registration(registration.pk, self.user)
+
+        self.assertTrue(
+            CompetitionRegistration.all_objects.get(pk=registration.pk).deleted
+        )
+
+    def test_delete_and_restore_climber(self):
+        counts = delete_climber(self.anna.pk)
+
+        self.assertEqual(counts["athletes.Climber"], 1)
+        self.assertEqual(counts["athletes.CompetitionRegistration"], 1)
+        self.assertFalse(Climb.objects.filter(climber=self.anna).exists())
+
+        restore_climber(self.anna.pk)
+
+        self.assertTrue(Climb.objects.filter(climber=self.anna).exists())
+        self.assertTrue(
+            CompetitionRegistration.objects.filter(climber=self.anna).exists()
+        )
+
+    def test_category_delete_stamps_last_modified_by(self):
+        delete_category(self.category.pk, self.user)
+
+        self.assertEqual(
+            set(RoundResult.all_objects.values_list("last_modified_by", flat=True)),
+            {self.user.pk},
+        )
+
+    def test_delete_and_restore_rerank_the_round(self):
+        katla = self.create_climber("Katla")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.score(self.anna, self.routes[1], attempts_top=1, top=True)
+            self.score(katla, self.routes[0], attempts_zone=1, zone=True)
+
+        def ranks():
+            return [
+                (row["climber_id"], row["rank"])
+                for row in services.list_scores(self.round.pk)
+            ]
+
+        self.assertEqual(
+            ranks(), [(self.anna.pk, 1), (self.bjorn.pk, 2), (katla.pk, 3)]
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            delete_climber(self.anna.pk)
+        self.assertEqual(ranks(), [(self.bjorn.pk, 1), (katla.pk, 2)])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            restore_climber(self.anna.pk)
+        self.assertEqual(
+            ranks(), [(self.anna.pk, 1), (self.bjorn.pk, 2), (katla.pk, 3)]
+        )
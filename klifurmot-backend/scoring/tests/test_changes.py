@@ -0,0 +1,126 @@
+from django.test import override_settings
+from rest_framework.test import APIClient
+
+from competitions.services import (
+    get_competition_results,
+    get_competition_results_since,
+)
+from scoring import services
+
+from .base import ScoringTestCase
+
+
+@override_settings(CHANGES_SINCE_OVERLAP_SECONDS=0)
+class ChangesSinceTest(ScoringTestCase):
+    def setUp(self):
+        super().setUp()
+        self.anna = self.create_climber("Anna")
+        self.bjorn = self.create_climber("Björn")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.anna_climb = self.score(
+                self.anna, self.routes[0], attempts_top=1, top=True
+            )
+            self.score(self.bjorn, self.routes[0], attempts_zone=1, zone=True)
+
+    def test_climbs_since_returns_only_changed_rows(self):
+        everything = services.list_climbs_since(self.round.pk, since=0)
+        self.assertEqual(len(everything["changes"]), 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            services.update_climb(self.anna_climb["id"], self.user, attempts_top=3)
+
+        delta = services.list_climbs_since(self.round.pk, since=everything["version"])
+        self.assertEqual([c["id"] for c in delta["changes"]], [self.anna_climb["id"]])
+        self.assertEqual(delta["changes"][0]["attempts_top"], 3)
+        self.assertEqual(delta["deleted"], [])
+        self.assertGreater(delta["version"], everything["version"])
+
+    def test_deleted_climbs_come_back_as_tombstones(self):
+        version = services.list_climbs_since(self.round.pk, since=0)["version"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            services.delete_climb(self.anna_climb["id"], self.user)
+
+        delta = services.list_climbs_since(self.round.pk, since=version)
+        self.assertEqual(delta["changes"], [])
+        self.assertEqual(delta["deleted"], [self.anna_climb["id"]])
+        self.assertEqual(
+            services.list_climbs_since(self.round.pk, since=0)["deleted"], []
+        )
+
+    def test_startlist_since_includes_removed_entries(self):
+        version = services.list_startlist_since(self.round.pk, since=0)["version"]
+        entry = services.list_startlist(self.round.pk)[1]
+
+        services.remove_from_startlist(entry["id"], self.user)
+
+        delta = services.list_startlist_since(self.round.pk, since=version)
+        self.assertEqual(delta["changes"], [])
+        self.assertEqual(delta["deleted"], [entry["id"]])
+
+    def test_results_since_match_full_results(self):
+        version = get_competition_results_since(self.competition.pk, since=0)["version"]
+
+        # Björn overtakes Anna, so both rows change.
+        with self.captureOnCommitCallbacks(execute=True):
+            self.score(self.bjorn, self.routes[1], attempts_top=1, top=True)
+            self.score(self.bjorn, self.routes[2], attempts_top=1, top=True)
+
+        delta = get_competition_results_since(self.competition.pk, since=version)
+        full = get_competition_results(self.competition.pk)[0]["rounds"][0]["results"]
+
+        self.assertEqual(
+            [change["climber_id"] for change in delta["changes"]],
+            [self.bjorn.pk, self.anna.pk],
+        )
+        for change, row in zip(delta["changes"], full):
+            self.assertEqual(change["round_id"], self.round.pk)
+            self.assertEqual(change["category"], "Opinn flokkur KK")
+            self.assertEqual(
+                {key: value for key, value in change.items() if key in row}, row
+            )
+
+    def test_results_since_reports_removed_climbers(self):
+        version = get_competition_results_since(self.competition.pk, since=0)["version"]
+        entry = next(
+            e
+            for e in services.list_startlist(self.round.pk)
+            if e["climber_id"] == self.anna.pk
+        )
+
+        services.remove_from_startlist(entry["id"], self.user)
+
+        delta = get_competition_results_since(self.competition.pk, since=version)
+        self.assertEqual(
+            delta["deleted"], [{"round_id": self.round.pk, "climber_id": self.anna.pk}]
+        )
+
+    def test_unchanged_results_are_empty(self):
+        version = get_competition_results_since(self.competition.pk, since=0)["version"]
+
+        delta = get_competition_results_since(self.competition.pk, since=version)
+
+        self.assertEqual(delta["changes"], [])
+        self.assertEqual(delta["deleted"], [])
+
+    def test_views_validate_since(self):
+        client = APIClient()
+        url = f"/api/competitions/{self.competition.pk}/results/"
+
+        self.assertEqual(client.get(url, {"since": "yesterday"}).status_code, 400)
+        self.assertEqual(
+            client.get(
+                "/api/scoring/climbs/", {"round_id": self.round.pk, "since": "-1"}
+            ).status_code,
+            400,
+        )
+
+        response = client.get(url, {"since": 0})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("ETag", response)
+        self.assertEqual(len(response.json()["data"]["changes"]), 2)
+
+        response = client.get(
+            "/api/scoring/startlist/", {"round_id": self.round.pk, "since": 0}
+        )
+        self.assertEqual(len(response.json()["data"]["changes"]), 2)
@@ -0,0 +1,234 @@
+import random
+from io import StringIO
+from types import SimpleNamespace
+
+from django.core.management import call_command
+from django.test import SimpleTestCase
+
+from competitions.services import get_competition_results, get_competition_routes
+from scoring import services
+from scoring.engines import BoulderEngine, LeadEngine, get_engine
+from scoring.models import ClimberRoundScore, RoundResult
+from scoring.tests.base import ScoringTestCase
+
+
+def lead_score(climber_id, total, time=None):
+    return SimpleNamespace(
+        climber_id=climber_id, total_score_tenths=total, best_time_seconds=time
+    )
+
+
+class BoulderEngineTest(SimpleTestCase):
+    def test_aggregates_every_climber_in_one_pass(self):
+        rows = [
+            (1, True, True, 1, 1),
+            (1, False, True, 3, 2),
+            (2, False, False, 4, 4),
+            (2, True, True, 2, 1),
+        ]
+
+        aggregates = BoulderEngine().aggregate_round(rows)
+
+        self.assertEqual(
+            aggregates[1],
+            {
+                "total_score_tenths": 349,
+                "tops": 1,
+                "zones": 2,
+                "attempts_tops": 1,
+                "attempts_zones": 3,
+            },
+        )
+        self.assertEqual(aggregates[2]["total_score_tenths"], 249)
+
+    def test_tenths_match_point_formula(self):
+        rng = random.Random(36)
+        for _case in range(200):
+            rows = []
+            for _route in range(rng.randint(1, 8)):
+                top = rng.random() < 0.4
+                zone = top or rng.random() < 0.5
+                rows.append((1, top, zone, rng.randint(1, 30), rng.randint(1, 30)))
+
+            points = sum(
+                25 - 0.1 * (attempts_top - 1) if top else 10 - 0.1 * (attempts_zone - 1)
+                for _climber, top, zone, attempts_top, attempts_zone in rows
+                if top or zone
+            )
+
+            self.assertEqual(
+                BoulderEngine().aggregate_round(rows)[1]["total_score_tenths"],
+                round(round(points, 1) * 10),
+            )
+
+    def test_aggregate_matches_round_pass(self):
+        climbs = [
+            SimpleNamespace(
+                top_reached=True, zone_reached=True, attempts_top=3, attempts_zone=1
+            ),
+            SimpleNamespace(
+                top_reached=False, zone_reached=True, attempts_top=5, attempts_zone=5
+            ),
+        ]
+
+        self.assertEqual(
+            BoulderEngine().aggregate(climbs),
+            BoulderEngine().aggregate_round(
+                [(7, True, True, 3, 1), (7, False, True, 5, 5)]
+            )[7],
+        )
+
+
+class LeadEngineTest(SimpleTestCase):
+    def setUp(self):
+        self.engine = LeadEngine()
+
+    def test_plus_counts_half_a_hold(self):
+        aggregates = self.engine.aggregate_round(
+            [(1, 12, True, 200), (2, 12, False, 150), (3, 13, False, None)]
+        )
+
+        self.assertEqual(aggregates[1]["total_score_tenths"], 125)
+        self.assertEqual(aggregates[2]["total_score_tenths"], 120)
+        self.assertEqual(aggregates[3]["best_hold_reached"], 13)
+
+    def test_best_route_time_is_kept(self):
+        aggregates = self.engine.aggregate_round(
+            [(1, 20, False, 300), (1, 25, True, 280), (1, 25, True, 240)]
+        )
+
+        self.assertEqual(aggregates[1]["total_score_tenths"], 710)
+        self.assertEqual(aggregates[1]["best_hold_reached"], 25)
+        self.assertEqual(aggregates[1]["best_time_seconds"], 240)
+
+    def test_countback_before_time(self):
+        ranked = self.engine.rank(
+            [lead_score(1, 30, time=100), lead_score(2, 30, time=200)],
+            prev_rank_map={1: 4, 2: 1},
+        )
+
+        self.assertEqual([(s.climber_id, rank) for s, rank in ranked], [(2, 1), (1, 2)])
+
+    def test_time_breaks_remaining_ties(self):
+        ranked = self.engine.rank(
+            [
+                lead_score(1, 30),
+                lead_score(2, 30, time=200),
+                lead_score(3, 30, time=150),
+                lead_score(4, 31),
+            ],
+            prev_rank_map={},
+        )
+
+        self.assertEqual(
+            [(s.climber_id, rank) for s, rank in ranked],
+            [(4, 1), (3, 2), (2, 3), (1, 4)],
+        )
+
+    def test_unknown_discipline(self):
+        with self.assertRaises(ValueError):
+            get_engine("speed")
+
+
+class LeadScoringTest(ScoringTestCase):
+    def setUp(self):
+        super().setUp()
+        self.competition.discipline = "lead"
+        self.competition.save()
+        self.anna = self.create_climber("Anna")
+        self.bjarni = self.create_climber("Bjarni")
+
+    def lead(self, climber, hold, plus=False, time=None):
+        return services.create_climb(
+            user=self.user,
+            climber=climber.pk,
+            route=self.routes[0].pk,
+            hold_reached=hold,
+            plus_modifier=plus,
+            time_seconds=time,
+        )
+
+    def test_lead_climbs_are_scored_and_ranked(self):
+        climb = self.lead(self.anna, 18, plus=True, time=210)
+        self.lead(self.bjarni, 18, time=180)
+        services._update_round_results(self.round)
+
+        self.assertEqual(climb["hold_reached"], 18)
+        self.assertTrue(climb["plus_modifier"])
+        score = ClimberRoundScore.objects.get(climber=self.anna, round=self.round)
+        self.assertEqual(score.total_score_tenths, 185)
+        self.assertEqual(score.best_time_seconds, 210)
+        self.assertEqual(
+            dict(RoundResult.objects.values_list("climber_id", "rank")),
+            {self.anna.pk: 1, self.bjarni.pk: 2},
+        )
+
+    def test_results_include_lead_fields(self):
+        self.lead(self.anna, 18, plus=True, time=210)
+
+        [category] = get_competition_results(self.competition.pk)
+        [anna] = category["rounds"][0]["results"]
+
+        self.assertEqual(anna["total_score"], 18.5)
+        self.assertEqual(anna["best_hold_reached"], 18)
+        self.assertEqual(anna["best_time_seconds"], 210)
+        self.assertEqual(
+            [
+                (route["hold_reached"], route["plus_modifier"], route["time_seconds"])
+                for route in anna["routes"]
+            ],
+            [(18, True, 210), (0, False, None), (0, False, None), (0, False, None)],
+        )
+
+    def test_scores_list_lead_fields(self):
+        self.lead(self.anna, 18, plus=True, time=210)
+        self.lead(self.bjarni, 23)
+        services._update_round_results(self.round)
+
+        self.assertEqual(
+            services.list_scores(self.round.pk),
+            [
+                {
+                    "rank": 1,
+                    "climber_id": self.bjarni.pk,
+                    "climber_name": "Bjarni",
+                    "best_hold_reached": 23,
+                    "best_time_seconds": None,
+                    "total_score": 23.0,
+                },
+                {
+                    "rank": 2,
+                    "climber_id": self.anna.pk,
+                    "climber_name": "Anna",
+                    "best_hold_reached": 18,
+                    "best_time_seconds": 210,
+                    "total_score": 18.5,
+                },
+            ],
+        )
+
+    def test_routes_report_the_best_hold(self):
+        self.lead(self.anna, 18, plus=True, time=210)
+        self.lead(self.bjarni, 23)
+
+        [category] = get_competition_routes(self.competition.pk)
+        routes = category["rounds"][0]["routes"]
+
+        self.assertEqual(
+            [route["best_hold"] for route in routes], [23, None, None, None]
+        )
+
+    def test_negative_hold_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.lead(self.anna, -1)
+
+
+class ScoringBenchmarkCommandTest(SimpleTestCase):
+    def test_reports_both_engines(self):
+        out = StringIO()
+        call_command(
+            "scoring_benchmark", "--climbers", "20", "--repeat", "1", stdout=out
+        )
+
+        self.assertIn("boulder", out.getvalue())
+        self.assertIn("lead", out.getvalue())
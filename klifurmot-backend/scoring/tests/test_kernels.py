@@ -0,0 +1,112 @@
+import random
+from types import SimpleNamespace
+from unittest import skipUnless
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, override_settings
+
+from scoring.engines import ENGINES, assign_ranks
+from scoring.kernels import lexsort_ranks, numpy_available
+
+CASES = 300
+
+
+def random_scores(rng, engine, size):
+    """Scores drawn from small value ranges so every tie-break is exercised."""
+    scores = []
+    for climber_id in rng.sample(range(1, size * 4), size):
+        total = rng.choice([0, 100, 249, 250, 349, 598])
+        if engine.discipline == "lead":
+            scores.append(
+                SimpleNamespace(
+                    climber_id=climber_id,
+                    total_score_tenths=total,
+                    best_time_seconds=rng.choice([None, 90, 120, 120, 300]),
+                )
+            )
+        else:
+            scores.append(
+                SimpleNamespace(
+                    climber_id=climber_id,
+                    total_score_tenths=total,
+                    attempts_tops=rng.randint(0, 3),
+                    attempts_zones=rng.randint(0, 3),
+                )
+            )
+    return scores
+
+
+def random_prev_ranks(rng, scores):
+    return {
+        score.climber_id: rng.randint(1, 5) for score in scores if rng.random() < 0.6
+    }
+
+
+@skipUnless(numpy_available(), "NumPy is not installed")
+@override_settings(SCORING_NUMPY_MIN_CLIMBERS=0)
+class NumpyKernelEquivalenceTest(SimpleTestCase):
+    """The kernel must reproduce the Python ranking exactly, order included."""
+
+    def assert_equivalent(self, engine, scores, prev_rank_map):
+        expected = assign_ranks(
+            scores, key=lambda score: engine.rank_key(score, prev_rank_map)
+        )
+        actual = engine.rank(scores, prev_rank_map)
+
+        self.assertEqual(
+            [(score.climber_id, rank) for score, rank in actual],
+            [(score.climber_id, rank) for score, rank in expected],
+        )
+
+    def test_random_rounds_match_python_ranking(self):
+        rng = random.Random(20251019)
+        with patch("scoring.engines.lexsort_ranks", wraps=lexsort_ranks) as kernel:
+            for engine in ENGINES.values():
+                for _case in range(CASES):
+                    scores = random_scores(rng, engine, rng.randint(1, 60))
+                    with self.subTest(engine=engine.discipline, size=len(scores)):
+                        self.assert_equivalent(
+                            engine, scores, random_prev_ranks(rng, scores)
+                        )
+
+        self.assertEqual(kernel.call_count, CASES * len(ENGINES))
+
+    def test_empty_round(self):
+        for engine in ENGINES.values():
+            self.assertEqual(engine.rank([], {}), [])
+
+    def test_all_tied(self):
+        engine = ENGINES["boulder"]
+        scores = [
+            SimpleNamespace(
+                climber_id=climber_id,
+                total_score_tenths=250,
+                attempts_tops=1,
+                attempts_zones=1,
+            )
+            for climber_id in (5, 3, 9)
+        ]
+
+        self.assertEqual(
+            [(score.climber_id, rank) for score, rank in engine.rank(scores, {})],
+            [(5, 1), (3, 1), (9, 1)],
+        )
+
+    def test_missing_values_fall_back_to_python(self):
+        engine = ENGINES["boulder"]
+        scores = [
+            SimpleNamespace(
+                climber_id=1,
+                total_score_tenths=100,
+                attempts_tops=None,
+                attempts_zones=1,
+            ),
+            SimpleNamespace(
+                climber_id=2,
+                total_score_tenths=250,
+                attempts_tops=1,
+                attempts_zones=1,
+            ),
+        ]
+
+        self.assert_equivalent(engine, scores, {})
@@ -0,0 +1,67 @@
+import time
+from unittest import skipUnless
+from unittest.mock import Mock
+
+from django.db import connection
+
+from core.cascade import soft_delete
+from scoring.models import Climb, RoundResult
+from scoring.notifier import ResultsNotifier, notify_results
+from scoring.tests.base import ScoringTransactionTestCase
+
+
+@skipUnless(connection.vendor == "postgresql", "LISTEN/NOTIFY needs PostgreSQL")
+class ResultsNotifierTest(ScoringTransactionTestCase):
+    def setUp(self):
+        super().setUp()
+        self.climber = self.create_climber("Anna")
+        self.send = Mock()
+        self.notifier = ResultsNotifier(send=self.send, debounce=0.05, max_delay=1)
+        self.notifier.listen()
+
+    def tearDown(self):
+        self.notifier.close()
+        super().tearDown()
+
+    def drain(self):
+        deadline = time.monotonic() + 2
+        while time.monotonic() < deadline and not self.notifier.pending:
+            self.notifier.poll(0.1)
+        self.notifier.poll(0.1)
+
+    def test_direct_orm_write_is_pushed_once(self):
+        Climb.objects.create(
+            climber=self.climber, route=self.routes[0], attempts_top=1, top_reached=True
+        )
+        RoundResult.objects.filter(round=self.round).update(rank=1)
+
+        self.drain()
+        time.sleep(0.1)
+        self.notifier.flush()
+
+        self.send.assert_called_once_with(self.competition.pk)
+
+    def test_cascade_holds_row_triggers_back(self):
+        Climb.objects.create(
+            climber=self.climber, route=self.routes[0], attempts_top=1, top_reached=True
+        )
+        self.drain()
+        self.notifier.pending.clear()
+
+        soft_delete(self.round)
+        self.drain()
+        self.assertEqual(self.notifier.pending, {})
+
+        notify_results(self.competition.pk)
+        self.drain()
+        self.assertEqual(list(self.notifier.pending), [self.competition.pk])
+
+    def test_debounce_holds_push_while_busy(self):
+        self.notifier.debounce = 5
+        RoundResult.objects.filter(round=self.round).update(rank=1)
+        self.drain()
+
+        self.assertEqual(self.notifier.flush(), [])
+        self.send.assert_not_called()
+
+        self.assertEqual(self.notifier.flush(force=True), [self.competition.pk])
@@ -0,0 +1,159 @@
+from io import StringIO
+
+from django.core.management import call_command
+from rest_framework.test import APIClient
+
+from athletes.imports import import_registrations
+from competitions.services import get_competition_startlist
+from core.changes import current_version
+from scoring import ordering, services
+from scoring.models import RoundResult
+
+from .base import ScoringTestCase
+
+
+class StartlistMoveTest(ScoringTestCase):
+    def setUp(self):
+        super().setUp()
+        names = ["Anna", "Björn", "Katla", "Dagur"]
+        self.entries = [
+            RoundResult.objects.get(
+                climber=self.create_climber(name, start_order=order)
+            )
+            for name, order in zip(names, [1, 2, 3, 7])
+        ]
+
+    def listed(self):
+        return [
+            (entry["id"], entry["start_order"])
+            for entry in services.list_startlist(self.round.pk)
+        ]
+
+    def move(self, entry, after):
+        return services.move_startlist_entry(
+            entry.pk, self.user, after=after.pk if after else None
+        )
+
+    def test_move_writes_only_the_moved_row(self):
+        anna, bjorn, katla, dagur = self.entries
+        before = dict(RoundResult.objects.values_list("id", "last_modified_at"))
+
+        moved = self.move(dagur, after=anna)
+
+        self.assertEqual(moved["start_order"], 2)
+        self.assertEqual(moved["version"], 2)
+        after = dict(RoundResult.objects.values_list("id", "last_modified_at"))
+        self.assertEqual([pk for pk in before if before[pk] != after[pk]], [dagur.pk])
+        self.assertEqual(
+            self.listed(),
+            [(anna.pk, 1), (dagur.pk, 2), (bjorn.pk, 3), (katla.pk, 7)],
+        )
+
+        self.move(anna, after=None)
+        self.move(bjorn, after=katla)
+        self.assertEqual(
+            self.listed(),
+            [(anna.pk, 1), (dagur.pk, 2), (katla.pk, 3), (bjorn.pk, 7)],
+        )
+
+    def test_compact_stores_the_view(self):
+        anna, bjorn, katla, dagur = self.entries
+        self.move(anna, after=katla)
+        listed = self.listed()
+
+        rewritten = ordering.compact(self.round.pk)
+
+        self.assertEqual(rewritten, 3)
+        self.assertEqual(self.listed(), listed)
+        self.assertFalse(RoundResult.objects.filter(start_key__isnull=False).exists())
+        self.assertEqual(RoundResult.objects.get(pk=anna.pk).start_order, 3)
+
+    def test_repeated_moves_into_one_gap_compact_when_keys_run_out(self):
+        anna, bjorn, katla, dagur = self.entries
+        for _ in range(30):
+            self.move(dagur, after=anna)
+            self.move(katla, after=anna)
+
+        self.assertEqual(
+            [pk for pk, _ in self.listed()], [anna.pk, katla.pk, dagur.pk, bjorn.pk]
+        )
+
+    def test_views_and_changes_follow_the_move(self):
+        anna, bjorn, katla, dagur = self.entries
+        since = current_version()
+
+        self.move(katla, after=None)
+
+        startlist = get_competition_startlist(self.competition.pk)
+        athletes = startlist[0]["rounds"][0]["athletes"]
+        self.assertEqual(
+            [(athlete["full_name"], athlete["start_order"]) for athlete in athletes],
+            [("Katla", 1), ("Anna", 2), ("Björn", 3), ("Dagur", 7)],
+        )
+        changes = services.list_startlist_since(self.round.pk, since)["changes"]
+        self.assertEqual(
+            [(entry["id"], entry["start_order"]) for entry in changes], self.listed()
+        )
+
+    def test_setting_a_start_order_drops_the_move_key(self):
+        anna, bjorn, katla, dagur = self.entries
+        self.move(anna, after=dagur)
+
+        services.update_startlist(anna.pk, self.user, start_order=9)
+
+        self.assertEqual(self.listed()[-1], (anna.pk, 9))
+        self.assertEqual(ordering.rounds_to_compact(), [])
+
+    def test_start_orders_are_checked_against_the_listed_numbers(self):
+        anna, bjorn, katla, dagur = self.entries
+        self.move(dagur, after=anna)
+
+        with self.assertRaises(ValueError):
+            services.update_startlist(katla.pk, self.user, start_order=3)
+        updated = services.update_startlist(dagur.pk, self.user, start_order=2)
+
+        self.assertEqual(updated["start_order"], 2)
+        self.assertEqual(
+            self.listed(),
+            [(anna.pk, 1), (dagur.pk, 2), (bjorn.pk, 3), (katla.pk, 7)],
+        )
+
+    def test_appended_entries_go_after_moved_ones(self):
+        anna, bjorn, katla, dagur = self.entries
+        services.remove_from_startlist(anna.pk, self.user)
+        self.move(bjorn, after=dagur)
+
+        import_registrations(
+            self.user,
+            self.competition.pk,
+            [{"name": "Anna", "age": 25, "gender": "KK"}],
+            startlist=True,
+        )
+
+        self.assertEqual(
+            self.listed(),
+            [(katla.pk, 2), (dagur.pk, 3), (bjorn.pk, 7), (anna.pk, 9)],
+        )
+
+    def test_endpoint_and_command(self):
+        anna, bjorn, katla, dagur = self.entries
+        client = APIClient()
+        client.force_authenticate(self.user)
+
+        response = client.post(
+            f"/api/scoring/startlist/{bjorn.pk}/move/",
+            {"after": dagur.pk, "version": 1},
+            format="json",
+        )
+        stale = client.post(
+            f"/api/scoring/startlist/{bjorn.pk}/move/",
+            {"after": None, "version": 1},
+            format="json",
+        )
+        out = StringIO()
+        call_command("compact_start_orders", stdout=out)
+
+        self.assertEqual(response.json()["data"]["start_order"], 7)
+        self.assertEqual(stale.status_code, 409)
+        self.assertIn("Compacted 1 rounds", out.getvalue())
+        self.assertEqual(RoundResult.objects.get(pk=bjorn.pk).start_order, 7)
@@ -0,0 +1,193 @@
+import gzip
+import json
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from competitions import services as competition_services
+from competitions.versions import RESPONSE_KEY, competition_version
+from core import metrics
+from core.compression import IDENTITY
+
+from .base import ScoringTestCase
+
+
+class PublicResponseCacheTest(ScoringTestCase):
+    client: APIClient
+
+    def setUp(self):
+        super().setUp()
+        metrics.reset()
+        self.client = APIClient()
+        self.url = f"/api/competitions/{self.competition.pk}/results/"
+        self.climber = self.create_climber("Anna")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.score(self.climber, self.routes[0], attempts_top=1, top=True)
+
+    def get(self, url=None, **headers):
+        return self.client.get(url or self.url, **headers)
+
+    def test_gzip_body_matches_identity_body(self):
+        plain = self.get()
+        compressed = self.get(HTTP_ACCEPT_ENCODING="gzip")
+
+        self.assertNotIn("Content-Encoding", plain)
+        self.assertEqual(compressed["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", compressed["Vary"])
+        self.assertEqual(gzip.decompress(compressed.content), plain.content)
+        self.assertEqual(
+            json.loads(plain.content)["data"][0]["category"], "Opinn flokkur KK"
+        )
+
+    def test_compresses_once_per_version(self):
+        for _ in range(3):
+            self.get(HTTP_ACCEPT_ENCODING="gzip")
+
+        counters = metrics.snapshot()["counters"]
+        self.assertEqual(counters["response_cache.compressed.gzip"], 1)
+        self.assertEqual(counters["response_cache.hit"], 2)
+
+    def test_writes_retire_cached_bodies(self):
+        version = competition_version(self.competition.pk)
+        self.get(HTTP_ACCEPT_ENCODING="gzip")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.score(self.climber, self.routes[1], attempts_top=2, top=True)
+
+        self.assertGreater(competition_version(self.competition.pk), version)
+        data = json.loads(
+            gzip.decompress(self.get(HTTP_ACCEPT_ENCODING="gzip").content)
+        )
+        self.assertEqual(data["data"][0]["rounds"][0]["results"][0]["tops"], 2)
+
+    def test_errors_are_not_cached(self):
+        url = "/api/competitions/999999/results/"
+
+        self.assertEqual(self.get(url).status_code, 404)
+        self.assertEqual(self.get(url).status_code, 404)
+        self.assertNotIn("response_cache.hit", metrics.snapshot()["counters"])
+
+    def test_browsable_api_bypasses_cache(self):
+        response = self.get(HTTP_ACCEPT="text/html")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(metrics.snapshot()["counters"], {})
+
+    def test_metrics_record_bytes_on_wire_and_cpu(self):
+        response = self.get(HTTP_ACCEPT_ENCODING="gzip")
+
+        self.assertTrue(response["Server-Timing"].startswith("cpu;dur="))
+        stats = metrics.snapshot()["views"]["competition_results"]
+        self.assertEqual(stats["requests"], 1)
+        self.assertEqual(stats["bytes_sent"], len(response.content))
+        self.assertEqual(stats["encodings"], {"gzip": 1})
+
+    def test_metrics_endpoint_requires_admin(self):
+        self.assertIn(self.get("/api/metrics/").status_code, (401, 403))
+
+        self.client.force_authenticate(self.user)
+        response = self.get("/api/metrics/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("views", response.json()["data"])
+
+
+class ConditionalGetTest(ScoringTestCase):
+    def setUp(self):
+        super().setUp()
+        self.client = APIClient()
+        self.url = f"/api/competitions/{self.competition.pk}/results/"
+        self.climber = self.create_climber("Anna")
+
+    def test_matching_etag_returns_304_without_queries(self):
+        etag = self.client.get(self.url)["ETag"]
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response.content, b"")
+
+    def test_each_coding_has_its_own_etag(self):
+        plain = self.client.get(self.url)["ETag"]
+        compressed = self.client.get(self.url, HTTP_ACCEPT_ENCODING="gzip")["ETag"]
+
+        self.assertNotEqual(plain, compressed)
+        self.assertTrue(plain.startswith("W/"))
+        response = self.client.get(
+            self.url, HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH=plain
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_body_rendered_again_keeps_its_etag(self):
+        first = self.client.get(self.url)
+        key = RESPONSE_KEY.format(
+            self.competition.pk, "results", competition_version(self.competition.pk)
+        )
+        cache.delete(f"{key}:{IDENTITY}")
+
+        second = self.client.get(self.url, HTTP_IF_NONE_MATCH=first["ETag"])
+        rendered = self.client.get(self.url)
+
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(rendered["ETag"], first["ETag"])
+
+    def test_writes_change_the_etag(self):
+        etag = self.client.get(self.url)["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.score(self.climber, self.routes[0], attempts_top=1, top=True)
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_cache_control_follows_competition_status(self):
+        self.assertIn("max-age=2", self.client.get(self.url)["Cache-Control"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            competition_services.update_competition(
+                self.competition.pk,
+                self.user,
+                start_date=timezone.now() - timedelta(days=2),
+                end_date=timezone.now() - timedelta(days=1),
+            )
+
+        response = self.client.get(self.url)
+        self.assertIn("public", response["Cache-Control"])
+        self.assertIn("max-age=86400", response["Cache-Control"])
+
+    def test_missing_competition_is_not_found(self):
+        response = self.client.get("/api/competitions/999999/results/")
+
+        self.assertEqual(response.status_code, 404)
+        self.assertNotIn("ETag", response)
+
+    def test_competition_list_revalidates(self):
+        url = "/api/competitions/public/"
+        etag = self.client.get(url)["ETag"]
+
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304
+            )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            competition_services.create_competition(
+                title="Haustmót",
+                description="",
+                start_date=timezone.now() + timedelta(days=10),
+                end_date=timezone.now() + timedelta(days=11),
+                location="Klifurhúsið",
+                created_by=self.user,
+            )
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["data"]), 2)
+        # The list changes when the new competition starts.
+        max_age = int(response["Cache-Control"].split("max-age=")[1])
+        self.assertLessEqual(max_age, 60)
@@ -0,0 +1,92 @@
+from django.db import connection
+
+from athletes.models import CompetitionRegistration
+from scoring.models import START_POSITION, Climb, ClimberRoundScore, RoundResult
+
+from .base import ScoringTestCase
+
+# Partial indexes over live rows, per table. On fixture-sized tables the
+# planner picks among them freely, so the tests accept any index covering
+# the lookup's leading columns.
+CLIMB_ROUTE = ["climb_active_route_idx"]
+CLIMB_PAIR = [*CLIMB_ROUTE, "unique_active_climb"]
+ROUND_RESULTS = [
+    "roundresult_active_order_idx",
+    "roundresult_active_pos_idx",
+    "roundresult_active_rank_idx",
+    "unique_active_round_result",
+]
+ROUND_SCORES = ["roundscore_active_score_idx", "unique_active_round_score"]
+REGISTRATIONS = ["unique_active_registration"]
+
+
+class ActiveIndexPlanTest(ScoringTestCase):
+    """The hot lookups on live rows are answered from the partial indexes."""
+
+    def setUp(self):
+        super().setUp()
+        self.climber = self.create_climber("Anna")
+        self.score(self.climber, self.routes[0], attempts_top=1, top=True)
+
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                # The fixture tables are tiny, so a sequential scan would win.
+                cursor.execute("SET LOCAL enable_seqscan = off")
+                # Statistics gathered while earlier tests filled the tables
+                # can steer the planner to the plain `deleted` index.
+                for model in (Climb, ClimberRoundScore, RoundResult):
+                    cursor.execute(f"ANALYZE {model._meta.db_table}")
+
+    def assertUsesIndex(self, queryset, indexes):
+        plan = queryset.explain()
+        self.assertTrue(any(index in plan for index in indexes), plan)
+
+    def test_climbs_of_a_route(self):
+        self.assertUsesIndex(Climb.objects.filter(route=self.routes[0]), CLIMB_ROUTE)
+        self.assertUsesIndex(
+            Climb.objects.filter(route=self.routes[0], climber=self.climber),
+            CLIMB_PAIR,
+        )
+
+    def test_start_list_order(self):
+        self.assertUsesIndex(
+            RoundResult.objects.filter(round=self.round).order_by(START_POSITION),
+            ROUND_RESULTS,
+        )
+        self.assertUsesIndex(
+            RoundResult.objects.filter(round=self.round, start_order=1),
+            ROUND_RESULTS,
+        )
+
+    def test_round_ranking(self):
+        self.assertUsesIndex(
+            RoundResult.objects.filter(round=self.round, rank__isnull=False).order_by(
+                "rank"
+            ),
+            ROUND_RESULTS,
+        )
+        self.assertUsesIndex(
+            ClimberRoundScore.objects.filter(round=self.round).order_by(
+                "-total_score_tenths"
+            ),
+            ROUND_SCORES,
+        )
+
+    def test_registration_lookup(self):
+        # The partial unique constraint leads with (competition, climber),
+        # so it doubles as the lookup index.
+        self.assertUsesIndex(
+            CompetitionRegistration.objects.filter(
+                competition=self.competition, climber=self.climber
+            ),
+            REGISTRATIONS,
+        )
+
+    def test_soft_deleted_rows_are_hidden_by_default(self):
+        climb = Climb.objects.get(climber=self.climber)
+        Climb.objects.filter(pk=climb.pk).update(deleted=True)
+
+        self.assertFalse(Climb.objects.filter(pk=climb.pk).exists())
+        self.assertTrue(Climb.all_objects.get(pk=climb.pk).deleted)
+        climbs = self.routes[0].climb_set  # pyright: ignore[reportAttributeAccessIssue]
+        self.assertFalse(climbs.exists())
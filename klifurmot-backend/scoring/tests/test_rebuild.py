@@ -0,0 +1,103 @@
+from io import StringIO
+
+from django.core.management import call_command
+
+from competitions.models import Route
+from core.cascade import soft_delete
+from scoring import services
+from scoring.models import ClimberRoundScore, RoundResult
+from scoring.tests.base import ScoringTestCase
+
+
+class RebuildScoresCommandTest(ScoringTestCase):
+    def setUp(self):
+        super().setUp()
+        self.anna = self.create_climber("Anna")
+        self.bjarni = self.create_climber("Bjarni")
+        self.score(self.anna, self.routes[0], attempts_top=1, top=True)
+        self.score(self.bjarni, self.routes[0], attempts_top=1, top=True)
+        self.score(self.bjarni, self.routes[1], attempts_zone=2, zone=True)
+
+        self.final = self.create_round(2)
+        RoundResult.objects.create(round=self.final, climber=self.anna)
+        RoundResult.objects.create(round=self.final, climber=self.bjarni)
+        self.score(self.anna, self.final_routes()[0], attempts_top=1, top=True)
+        self.score(self.bjarni, self.final_routes()[0], attempts_top=1, top=True)
+
+        for round_obj in (self.round, self.final):
+            services._update_round_results(round_obj)
+
+    def final_routes(self):
+        return list(Route.objects.filter(round=self.final).order_by("route_number"))
+
+    def rebuild(self, *args):
+        out = StringIO()
+        call_command(
+            "rebuild_scores",
+            "--competition",
+            str(self.competition.pk),
+            "--workers",
+            "1",
+            *args,
+            stdout=out,
+        )
+        return out.getvalue()
+
+    def snapshot(self):
+        scores = dict(ClimberRoundScore.objects.values_list("id", "total_score_tenths"))
+        ranks = dict(RoundResult.objects.values_list("id", "rank"))
+        return scores, ranks
+
+    def test_rebuild_restores_scores_and_countback_ranks(self):
+        expected = self.snapshot()
+        self.assertEqual(
+            RoundResult.objects.get(round=self.final, climber=self.bjarni).rank, 1
+        )
+
+        ClimberRoundScore.objects.filter(climber=self.anna, round=self.round).delete()
+        ClimberRoundScore.objects.filter(climber=self.bjarni).update(total_score_tenths=0)
+        RoundResult.objects.update(rank=None)
+
+        output = self.rebuild()
+
+        scores, ranks = self.snapshot()
+        self.assertEqual(ranks, expected[1])
+        self.assertEqual(sorted(scores.values()), sorted(expected[0].values()))
+        self.assertIn("1 new and 2 updated scores", output)
+
+    def test_dry_run_reports_without_writing(self):
+        ClimberRoundScore.objects.filter(climber=self.bjarni, round=self.round).update(
+            total_score_tenths=0
+        )
+        RoundResult.objects.filter(round=self.round).update(rank=None)
+
+        output = self.rebuild("--dry-run")
+
+        self.assertRegex(
+            output, rf"climber {self.bjarni.pk}: total_score_tenths 0 -> 349"
+        )
+        self.assertIn("rank None -> 1", output)
+        self.assertEqual(
+            ClimberRoundScore.objects.get(climber=self.bjarni, round=self.round)
+            .total_score_tenths,
+            0,
+        )
+        self.assertFalse(
+            RoundResult.objects.filter(round=self.round, rank__isnull=False).exists()
+        )
+
+    def test_clean_tree_is_a_no_op(self):
+        output = self.rebuild("--dry-run")
+
+        self.assertIn("Would change 0 new and 0 updated scores, 0 ranks", output)
+
+    def test_scores_of_a_deleted_climber_stay_deleted(self):
+        soft_delete(self.anna)
+
+        output = self.rebuild()
+
+        self.assertIn("0 new and 0 updated scores", output)
+        self.assertFalse(ClimberRoundScore.objects.filter(climber=self.anna).exists())
+        self.assertEqual(
+            ClimberRoundScore.all_objects.filter(climber=self.anna).count(), 2
+        )
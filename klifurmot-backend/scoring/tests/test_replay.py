@@ -0,0 +1,153 @@
+from datetime import timedelta
+
+from django.db.models import F
+from django.utils import timezone
+
+from athletes import services as athlete_services
+from competitions import services as competition_services
+from competitions.models import Competition
+from scoring import replay, services
+from scoring.models import ClimbEvent, ClimberRoundScore, RoundResult
+from scoring.tests.base import ScoringTestCase
+
+
+class ClimbEventLogTest(ScoringTestCase):
+    def setUp(self):
+        super().setUp()
+        self.climber = self.create_climber("Anna")
+
+    def test_writes_are_logged_with_before_and_after(self):
+        climb = self.score(self.climber, self.routes[0], attempts_top=2, top=True)
+        services.update_climb(climb["id"], self.user, attempts_top=3, version=1)
+        services.delete_climb(climb["id"], self.user)
+
+        events = list(ClimbEvent.objects.order_by("id"))
+        self.assertEqual(
+            [event.action for event in events],
+            [ClimbEvent.CREATE, ClimbEvent.UPDATE, ClimbEvent.DELETE],
+        )
+        self.assertIsNone(events[0].before)
+        before, after = events[1].before, events[1].after
+        assert before is not None and after is not None
+        self.assertEqual(before["attempts_top"], 2)
+        self.assertEqual(after["attempts_top"], 3)
+        self.assertIsNone(events[2].after)
+        self.assertEqual(events[2].competition, self.competition)
+        self.assertEqual(events[2].judge, self.user)
+
+    def test_failed_update_is_not_logged(self):
+        climb = self.score(self.climber, self.routes[0], top=True, attempts_top=1)
+
+        with self.assertRaises(Exception):
+            services.update_climb(climb["id"], self.user, attempts_top=4, version=9)
+
+        self.assertEqual(ClimbEvent.objects.count(), 1)
+
+
+class ReplayTest(ScoringTestCase):
+    def setUp(self):
+        super().setUp()
+        self.anna = self.create_climber("Anna")
+        self.bjarni = self.create_climber("Bjarni")
+
+        self.score(self.anna, self.routes[0], attempts_top=1, top=True)
+        self.score(self.bjarni, self.routes[0], attempts_zone=1, zone=True)
+        self.score(self.bjarni, self.routes[1], attempts_top=2, top=True)
+
+    def _ranks(self):
+        return dict(
+            RoundResult.objects.filter(round=self.round, deleted=False).values_list(
+                "climber_id", "rank"
+            )
+        )
+
+    def _scores(self):
+        return dict(
+            ClimberRoundScore.objects.filter(round=self.round).values_list(
+                "climber_id", "total_score_tenths"
+            )
+        )
+
+    def test_replay_restores_scores_and_ranks(self):
+        expected_scores = self._scores()
+        services._update_round_results(self.round)
+        expected_ranks = self._ranks()
+
+        ClimberRoundScore.objects.filter(climber=self.anna).delete()
+        ClimberRoundScore.objects.filter(climber=self.bjarni).update(total_score_tenths=0)
+        RoundResult.objects.update(rank=None)
+
+        stats = replay.replay_competition(self.competition.pk)
+
+        self.assertEqual(stats["scores_created"], 1)
+        self.assertEqual(stats["scores_updated"], 1)
+        self.assertEqual(self._scores(), expected_scores)
+        self.assertEqual(self._ranks(), expected_ranks)
+
+    def test_replay_drops_climbs_of_removed_routes(self):
+        self.score(self.anna, self.routes[3], attempts_top=1, top=True)
+        Competition.objects.filter(pk=self.competition.pk).update(
+            start_date=timezone.now() + timedelta(days=1),
+            end_date=timezone.now() + timedelta(days=2),
+        )
+        competition_services.update_round(self.round.pk, self.user, route_count=2)
+
+        replay.replay_competition(self.competition.pk)
+
+        score = ClimberRoundScore.objects.get(round=self.round, climber=self.anna)
+        self.assertEqual((score.tops, score.total_score_tenths), (1, 250))
+        self.assertEqual(ClimbEvent.objects.filter(action=ClimbEvent.DELETE).count(), 1)
+
+    def test_cascade_restore_logs_the_climbs_it_brings_back(self):
+        athlete_services.delete_climber(self.bjarni.pk)
+        athlete_services.restore_climber(self.bjarni.pk, self.user)
+
+        self.assertEqual(
+            list(
+                ClimbEvent.objects.filter(climber=self.bjarni)
+                .order_by("id")
+                .values_list("action", flat=True)
+            ),
+            [ClimbEvent.CREATE] * 2 + [ClimbEvent.DELETE] * 2 + [ClimbEvent.CREATE] * 2,
+        )
+        state = replay.fold_events(ClimbEvent.objects.order_by("id"))
+        self.assertFalse(any(entry["deleted"] for entry in state.values()))
+
+    def test_backfill_covers_climbs_without_events(self):
+        ClimbEvent.objects.all().delete()
+
+        self.assertEqual(replay.backfill_events(self.competition.pk), 3)
+        self.assertEqual(replay.backfill_events(self.competition.pk), 0)
+
+    def test_results_as_of_before_a_correction(self):
+        ClimbEvent.objects.update(created_at=F("created_at") - timedelta(minutes=5))
+        before_correction = timezone.now() - timedelta(minutes=1)
+
+        anna_climb = services.list_climbs(self.round.pk, climber_id=self.anna.pk)[0]
+        services.update_climb(
+            anna_climb["id"], self.user, top_reached=False, zone_reached=False
+        )
+
+        def ranks(results):
+            return {row["climber_id"]: row["rank"] for row in results[0]["results"]}
+
+        past = replay.results_as_of(self.competition.pk, before_correction)
+        now = replay.results_as_of(self.competition.pk, timezone.now())
+
+        self.assertEqual(ranks(past), {self.bjarni.pk: 1, self.anna.pk: 2})
+        self.assertEqual(ranks(now), {self.bjarni.pk: 1, self.anna.pk: 2})
+        self.assertEqual(past[0]["results"][1]["total_score"], 25.0)
+        self.assertEqual(now[0]["results"][1]["total_score"], 0)
+
+    def test_snapshot_plus_tail_matches_full_fold(self):
+        replay.take_snapshot(self.competition.pk)
+        self.score(self.anna, self.routes[1], attempts_top=1, top=True)
+
+        results = replay.results_as_of(self.competition.pk, timezone.now())
+
+        scores = {row["climber_id"]: row["total_score"] for row in results[0]["results"]}
+        self.assertEqual(scores[self.anna.pk], 50.0)
+        self.assertEqual(
+            scores[self.bjarni.pk] * 10,
+            ClimberRoundScore.objects.get(climber=self.bjarni).total_score_tenths,
+        )
@@ -0,0 +1,316 @@
+from contextlib import contextmanager
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from accounts.models import UserAccount
+from athletes.models import Climber
+from competitions.models import Route
+from competitions.services import get_competition_results, get_competition_startlist
+from core.exceptions import ConflictError
+from scoring import coordinator, services
+from scoring.models import Climb, RoundResult
+from scoring.tests.base import ScoringTestCase
+from scoring.utils import UpdateRoundScoreForRoute
+
+
+class ClimbVersionTest(ScoringTestCase):
+    def setUp(self):
+        super().setUp()
+        self.climber = self.create_climber("Anna")
+        self.climb = self.score(self.climber, self.routes[0], attempts_top=2, top=True)
+
+    def test_create_returns_initial_version(self):
+        self.assertEqual(self.climb["version"], 1)
+
+    def test_update_bumps_version(self):
+        result = services.update_climb(
+            self.climb["id"], self.user, attempts_top=3, version=1
+        )
+
+        self.assertEqual(result["version"], 2)
+        self.assertEqual(Climb.objects.get(id=self.climb["id"]).version, 2)
+
+    def test_stale_version_raises_conflict_with_current_state(self):
+        services.update_climb(self.climb["id"], self.user, attempts_top=3, version=1)
+
+        with self.assertRaises(ConflictError) as ctx:
+            services.update_climb(
+                self.climb["id"], self.user, attempts_top=5, version=1
+            )
+
+        current = ctx.exception.current
+        assert current is not None
+        self.assertEqual(current["attempts_top"], 3)
+        self.assertEqual(current["version"], 2)
+        self.assertEqual(Climb.objects.get(id=self.climb["id"]).attempts_top, 3)
+
+    def test_update_without_version_uses_read_version(self):
+        result = services.update_climb(self.climb["id"], self.user, attempts_top=4)
+
+        self.assertEqual(result["attempts_top"], 4)
+        self.assertEqual(result["version"], 2)
+
+
+class StartlistVersionTest(ScoringTestCase):
+    def test_stale_startlist_edit_raises_conflict(self):
+        climber = self.create_climber("Björn", start_order=1)
+        entry = RoundResult.objects.get(round=self.round, climber=climber)
+
+        services.update_startlist(entry.pk, self.user, start_order=2, version=1)
+
+        with self.assertRaises(ConflictError) as ctx:
+            services.update_startlist(entry.pk, self.user, start_order=3, version=1)
+
+        current = ctx.exception.current
+        assert current is not None
+        self.assertEqual(current["start_order"], 2)
+        self.assertEqual(current["version"], 2)
+
+
+class RerankCoordinatorTest(ScoringTestCase):
+    def setUp(self):
+        super().setUp()
+        self.anna = self.create_climber("Anna")
+        self.bjorn = self.create_climber("Björn")
+
+    def test_ranks_written_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.score(self.anna, self.routes[0], attempts_top=1, top=True)
+            self.score(self.bjorn, self.routes[0], attempts_zone=1, zone=True)
+
+        ranks = dict(
+            RoundResult.objects.filter(round=self.round).values_list(
+                "climber_id", "rank"
+            )
+        )
+        self.assertEqual(ranks, {self.anna.pk: 1, self.bjorn.pk: 2})
+
+    def test_burst_collapses_to_single_rerank(self):
+        @contextmanager
+        def held_elsewhere(_round_id):
+            yield False
+
+        with patch("scoring.coordinator._rerank") as rerank:
+            with self.captureOnCommitCallbacks() as callbacks:
+                self.score(self.anna, self.routes[0], attempts_top=1, top=True)
+                self.score(self.bjorn, self.routes[0], attempts_top=1, top=True)
+
+            # While another worker holds the round lock, writers only mark
+            # the round dirty.
+            with patch("scoring.coordinator._round_lock", held_elsewhere):
+                for callback in callbacks:
+                    callback()
+            rerank.assert_not_called()
+
+            coordinator.request_rerank(self.round.pk)
+            rerank.assert_called_once_with(self.round.pk)
+
+    def test_writer_during_rerank_triggers_another_pass(self):
+        calls = []
+
+        def rerank(round_id):
+            calls.append(round_id)
+            if len(calls) == 1:
+                coordinator.request_rerank(round_id)
+
+        with patch("scoring.coordinator._rerank", side_effect=rerank):
+            coordinator.request_rerank(self.round.pk)
+
+        self.assertEqual(calls, [self.round.pk, self.round.pk])
+
+
+class RerankCascadeTest(ScoringTestCase):
+    def setUp(self):
+        super().setUp()
+        self.anna = self.create_climber("Anna")
+        self.bjorn = self.create_climber("Björn")
+        self.semifinal = self.create_round(round_order=2)
+        self.semifinal_routes = list(Route.objects.filter(round=self.semifinal))
+        for order, climber in enumerate([self.anna, self.bjorn], start=1):
+            RoundResult.objects.create(
+                round=self.semifinal, climber=climber, start_order=order
+            )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.score(self.anna, self.routes[0], attempts_top=1, top=True)
+            self.score(self.bjorn, self.routes[0], attempts_zone=1, zone=True)
+            # Tied in the semifinal, so countback to the qualifier decides.
+            self.score(self.anna, self.semifinal_routes[0], attempts_top=1, top=True)
+            self.score(self.bjorn, self.semifinal_routes[0], attempts_top=1, top=True)
+
+    def semifinal_ranks(self):
+        return dict(
+            RoundResult.objects.filter(round=self.semifinal).values_list(
+                "climber_id", "rank"
+            )
+        )
+
+    def test_qualifier_correction_reranks_semifinal(self):
+        self.assertEqual(self.semifinal_ranks(), {self.anna.pk: 1, self.bjorn.pk: 2})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.score(self.bjorn, self.routes[1], attempts_top=1, top=True)
+            self.score(self.bjorn, self.routes[2], attempts_top=1, top=True)
+
+        self.assertEqual(self.semifinal_ranks(), {self.anna.pk: 2, self.bjorn.pk: 1})
+
+    def test_no_cascade_when_qualifier_ranks_unchanged(self):
+        with patch("scoring.coordinator._dispatch_rerank") as dispatch:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.score(self.anna, self.routes[1], attempts_top=1, top=True)
+
+        dispatch.assert_not_called()
+
+    def test_dispatch_runs_inline_without_a_channel_layer(self):
+        with self.settings(SCORING_RERANK_CHANNEL="scoring-rerank"):
+            with patch("scoring.coordinator.get_channel_layer", return_value=None):
+                with patch("scoring.coordinator.request_rerank") as rerank:
+                    coordinator._dispatch_rerank(self.semifinal.pk)
+
+        rerank.assert_called_once_with(self.semifinal.pk)
+
+
+class ListScoresTest(ScoringTestCase):
+    def setUp(self):
+        super().setUp()
+        self.climbers = [self.create_climber(name) for name in "ABCDE"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            for index, climber in enumerate(self.climbers):
+                self.score(climber, self.routes[0], attempts_top=1, top=True)
+                if index % 2:
+                    self.score(climber, self.routes[1], attempts_zone=index, zone=True)
+
+    def test_matches_live_ranking(self):
+        live = [
+            (climber_id, rank, score.total_score_tenths / 10)
+            for climber_id, score, rank in services._rank_climbers_in_round(
+                self.round
+            )
+        ]
+
+        persisted = [
+            (row["climber_id"], row["rank"], row["total_score"])
+            for row in services.list_scores(self.round.pk)
+        ]
+
+        self.assertEqual(persisted, live)
+
+    def test_single_query(self):
+        with self.assertNumQueries(1):
+            services.list_scores(self.round.pk)
+
+    def test_unknown_round_returns_empty(self):
+        self.assertEqual(services.list_scores(999999), [])
+
+
+class ResultsQueryCountTest(ScoringTestCase):
+    def setUp(self):
+        super().setUp()
+        self.climbers = [self.create_climber(name) for name in "ABC"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            for climber in self.climbers:
+                self.score(climber, self.routes[0], attempts_top=1, top=True)
+
+    def results_queries(self):
+        with CaptureQueriesContext(connection) as captured:
+            get_competition_results(self.competition.pk)
+        return len(captured)
+
+    def test_results_queries_do_not_grow_with_climbs(self):
+        before = self.results_queries()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            for climber in self.climbers:
+                self.score(climber, self.routes[1], attempts_zone=1, zone=True)
+            self.score(
+                self.create_climber("D"), self.routes[2], attempts_zone=2, zone=True
+            )
+
+        self.assertEqual(self.results_queries(), before)
+
+    def test_rescore_reads_and_updates_once(self):
+        climb = Climb.objects.select_related(
+            "route__round__competition_category__competition"
+        ).get(climber=self.climbers[0], route=self.routes[0])
+
+        with self.assertNumQueries(2):
+            UpdateRoundScoreForRoute(climb)
+
+
+class ResultsPayloadTest(ScoringTestCase):
+    def setUp(self):
+        super().setUp()
+        self.anna = self.create_climber("Anna")
+        self.bjorn = self.create_climber("Björn")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.score(self.anna, self.routes[0], attempts_top=2, top=True)
+            self.score(self.bjorn, self.routes[1], attempts_zone=1, zone=True)
+
+    def round_results(self):
+        [category] = get_competition_results(self.competition.pk)
+        [round_data] = category["rounds"]
+        return round_data["results"]
+
+    def test_route_entries(self):
+        anna, bjorn = self.round_results()
+
+        self.assertEqual(anna["full_name"], "Anna")
+        self.assertEqual(
+            anna["routes"][0],
+            {
+                "route_number": 1,
+                "attempted": True,
+                "top_reached": True,
+                "zone_reached": True,
+                "attempts_top": 2,
+                "attempts_zone": 1,
+            },
+        )
+        self.assertEqual(
+            bjorn["routes"][0],
+            {
+                "route_number": 1,
+                "attempted": False,
+                "top_reached": False,
+                "zone_reached": False,
+                "attempts_top": 0,
+                "attempts_zone": 0,
+            },
+        )
+
+    def test_unattempted_routes_share_one_entry(self):
+        anna, bjorn = self.round_results()
+
+        self.assertIs(anna["routes"][2], bjorn["routes"][2])
+        self.assertIsNot(anna["routes"][2], anna["routes"][3])
+
+    def test_account_climber_name(self):
+        user = User.objects.create_user(username="gudrun", password="secret123")
+        account = UserAccount.objects.create(user=user, full_name="Guðrún")
+        climber = Climber.objects.create(user_account=account)
+        RoundResult.objects.create(round=self.round, climber=climber, start_order=3)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.score(climber, self.routes[0], attempts_top=1, top=True)
+
+        self.assertEqual(self.round_results()[0]["full_name"], "Guðrún")
+        self.assertEqual(
+            services.list_startlist(self.round.pk)[2]["climber_name"], "Guðrún"
+        )
+
+    def test_startlist(self):
+        [category] = get_competition_startlist(self.competition.pk)
+
+        self.assertEqual(
+            category["rounds"][0]["athletes"],
+            [
+                {"start_order": 1, "full_name": "Anna", "category_name": None},
+                {"start_order": 2, "full_name": "Björn", "category_name": None},
+            ],
+        )
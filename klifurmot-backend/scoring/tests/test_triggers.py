@@ -0,0 +1,105 @@
+from unittest import skipUnless
+
+from django.db import connection
+from django.test import override_settings
+
+from scoring import services, triggers
+from scoring.models import Climb, ClimberRoundScore
+from scoring.tests.base import ScoringTestCase
+from scoring.utils import UpdateRoundScoreForRoute
+
+SCORE_FIELDS = ("total_score_tenths", "tops", "zones", "attempts_tops", "attempts_zones")
+
+
+@skipUnless(connection.vendor == "postgresql", "Score triggers need PostgreSQL")
+class ClimberRoundScoreTriggerTest(ScoringTestCase):
+    def setUp(self):
+        super().setUp()
+        self.climbers = [self.create_climber(name) for name in "ABCD"]
+        self.climbs = []
+        for index, climber in enumerate(self.climbers):
+            for route_index, route in enumerate(self.routes):
+                attempts = index + route_index + 1
+                self.climbs.append(
+                    Climb(
+                        climber=climber,
+                        route=route,
+                        attempts_top=attempts,
+                        attempts_zone=max(1, attempts - 1),
+                        top_reached=(index + route_index) % 3 == 0,
+                        zone_reached=(index + route_index) % 3 != 2,
+                    )
+                )
+
+    def scores(self):
+        return {
+            row["climber_id"]: tuple(row[field] for field in SCORE_FIELDS)
+            for row in ClimberRoundScore.objects.filter(
+                round=self.round, deleted=False
+            ).values("climber_id", *SCORE_FIELDS)
+        }
+
+    def python_scores(self):
+        ClimberRoundScore.all_objects.filter(round=self.round).delete()
+        for climb in Climb.all_objects.filter(route__round=self.round):
+            UpdateRoundScoreForRoute(climb)
+        return self.scores()
+
+    def test_trigger_matches_python_aggregate(self):
+        triggers.set_trigger_enabled(True)
+        Climb.objects.bulk_create(self.climbs)
+        trigger_scores = self.scores()
+
+        self.assertEqual(trigger_scores, self.python_scores())
+
+    def test_trigger_tracks_updates_and_soft_deletes(self):
+        triggers.set_trigger_enabled(True)
+        Climb.objects.bulk_create(self.climbs)
+
+        Climb.objects.filter(climber=self.climbers[0], route=self.routes[0]).update(
+            attempts_top=1, top_reached=True, zone_reached=True
+        )
+        Climb.objects.filter(climber=self.climbers[1]).update(deleted=True)
+        trigger_scores = self.scores()
+
+        self.assertEqual(trigger_scores, self.python_scores())
+
+    @override_settings(SCORING_DB_TRIGGERS=True)
+    def test_services_defer_to_trigger(self):
+        triggers.set_trigger_enabled(True)
+
+        self.score(self.climbers[0], self.routes[0], attempts_top=2, top=True)
+
+        score = ClimberRoundScore.objects.get(
+            round=self.round, climber=self.climbers[0], deleted=False
+        )
+        self.assertEqual(score.total_score_tenths, 249)
+
+    def test_rebuild_restores_python_scores(self):
+        Climb.objects.bulk_create(self.climbs)
+        expected = self.python_scores()
+        ClimberRoundScore.objects.filter(round=self.round).update(total_score_tenths=0)
+
+        triggers.rebuild_scores(self.competition.pk)
+
+        self.assertEqual(self.scores(), expected)
+
+    @override_settings(SCORING_DB_TRIGGERS=True)
+    def test_lead_rounds_are_left_to_the_lead_engine(self):
+        self.competition.discipline = "lead"
+        self.competition.save()
+        triggers.set_trigger_enabled(True)
+
+        services.create_climb(
+            user=self.user,
+            climber=self.climbers[0].pk,
+            route=self.routes[0].pk,
+            hold_reached=21,
+            plus_modifier=True,
+        )
+
+        score = ClimberRoundScore.objects.get(
+            round=self.round, climber=self.climbers[0], deleted=False
+        )
+        self.assertEqual(score.total_score_tenths, 215)
+        self.assertEqual(score.best_hold_reached, 21)
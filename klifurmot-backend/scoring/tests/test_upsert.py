@@ -0,0 +1,112 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from athletes.models import Climber
+from core.upsert import (
+    CONFLICT,
+    CREATED,
+    REVIVED,
+    upsert,
+    upsert_one,
+    upsert_one_or_raise,
+)
+from scoring import services
+from scoring.models import RoundResult
+
+from .base import ScoringTestCase
+
+
+class UpsertTest(ScoringTestCase):
+    def entry(self, climber, start_order):
+        return RoundResult(
+            round=self.round,
+            climber=climber,
+            start_order=start_order,
+            created_by=self.user,
+        )
+
+    def test_creates_revives_and_reports_conflicts_in_order(self):
+        live = self.create_climber("Anna")
+        dead = self.create_climber("Björn")
+        dead_entry = RoundResult.objects.get(climber=dead)
+        RoundResult.objects.filter(pk=dead_entry.pk).update(deleted=True)
+        new = Climber.objects.create(
+            simple_name="Katla",
+            simple_age=25,
+            simple_gender="KVK",
+            is_simple_athlete=True,
+        )
+
+        results = upsert(
+            [self.entry(new, 7), self.entry(live, 8), self.entry(dead, 9)],
+            "unique_active_round_result",
+            revive_fields=["start_order"],
+        )
+
+        self.assertEqual(
+            [result.outcome for result in results], [CREATED, CONFLICT, REVIVED]
+        )
+        self.assertIsNone(results[1].obj)
+        revived = results[2].obj
+        if revived is None:
+            self.fail("The soft-deleted entry was not revived")
+        self.assertEqual(revived.pk, dead_entry.pk)
+        self.assertFalse(revived.deleted)
+        self.assertEqual(revived.start_order, 9)
+        self.assertEqual(revived.version, dead_entry.version + 1)
+        self.assertEqual(RoundResult.objects.get(climber=live).start_order, 1)
+        self.assertEqual(RoundResult.objects.count(), 3)
+
+    def test_returned_rows_match_the_database(self):
+        climber = self.create_climber("Anna")
+        RoundResult.objects.filter(climber=climber).update(deleted=True, rank=3)
+
+        result = upsert_one_or_raise(
+            self.entry(climber, 5),
+            "unique_active_round_result",
+            ["start_order"],
+            conflict="Climber is already in the start list",
+        )
+
+        stored = RoundResult.objects.get(pk=result.pk)
+        self.assertEqual(result.rank, 3)
+        self.assertEqual(result.created_at, stored.created_at)
+        self.assertEqual(result.last_modified_at, stored.last_modified_at)
+        with self.assertRaisesMessage(ValueError, "already in the start list"):
+            upsert_one_or_raise(
+                self.entry(climber, 6),
+                "unique_active_round_result",
+                ["start_order"],
+                conflict="Climber is already in the start list",
+            )
+
+    def test_postgres_writes_in_one_statement(self):
+        if connection.vendor != "postgresql":
+            self.skipTest("PostgreSQL only")
+        climber = self.create_climber("Anna")
+        RoundResult.objects.filter(climber=climber).update(deleted=True)
+
+        with CaptureQueriesContext(connection) as queries:
+            upsert_one(
+                self.entry(climber, 2), "unique_active_round_result", ["start_order"]
+            )
+
+        self.assertEqual(len(queries), 1)
+
+    def test_add_to_startlist_revives_removed_entry(self):
+        climber = self.create_climber("Anna")
+        entry = RoundResult.objects.get(climber=climber)
+        RoundResult.objects.filter(pk=entry.pk).update(rank=2)
+        services.remove_from_startlist(entry.pk, self.user)
+
+        result = services.add_to_startlist(
+            self.user, round=self.round.pk, climber=climber.pk, start_order=4
+        )
+
+        self.assertEqual(result["id"], entry.pk)
+        self.assertEqual(result["start_order"], 4)
+        self.assertIsNone(result["rank"])
+        with self.assertRaisesMessage(ValueError, "already in the start list"):
+            services.add_to_startlist(
+                self.user, round=self.round.pk, climber=climber.pk, start_order=5
+            )
@@ -0,0 +1,63 @@
+"""Optional PostgreSQL trigger mode for ClimberRoundScore.
+
+Migration 0004 installs `scoring_climb_score_trg`, which recomputes a
+climber's round aggregate in the same statement as the climb write. It is
+installed disabled; when it is enabled and `SCORING_DB_TRIGGERS` is set,
+the services skip the Python aggregate in `UpdateRoundScoreForRoute`.
+"""
+
+from typing import Optional
+
+from django.conf import settings
+from django.db import connection
+
+TRIGGER_NAME = "scoring_climb_score_trg"
+
+
+def triggers_supported() -> bool:
+    return connection.vendor == "postgresql"
+
+
+def triggers_active() -> bool:
+    """Whether climb writes rely on the database to maintain scores."""
+    return bool(getattr(settings, "SCORING_DB_TRIGGERS", False)) and (
+        triggers_supported()
+    )
+
+
+def trigger_enabled() -> Optional[bool]:
+    """Current trigger state in the database, or None if not installed."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT tgenabled FROM pg_trigger WHERE tgname = %s", [TRIGGER_NAME]
+        )
+        row = cursor.fetchone()
+
+    if row is None:
+        return None
+    return row[0] != "D"
+
+
+def set_trigger_enabled(enabled: bool) -> None:
+    action = "ENABLE" if enabled else "DISABLE"
+    with connection.cursor() as cursor:
+        cursor.execute(f"ALTER TABLE scoring_climb {action} TRIGGER {TRIGGER_NAME}")
+
+
+def rebuild_scores(competition_id: Optional[int] = None) -> int:
+    """Recompute every climber/round aggregate with the database function."""
+    sql = """
+        SELECT scoring_recompute_climber_round_score(pairs.climber_id, pairs.round_id)
+        FROM (
+            SELECT DISTINCT c.climber_id, r.round_id
+            FROM scoring_climb c
+            JOIN competitions_route r ON r.id = c.route_id
+            JOIN competitions_competitionround cr ON cr.id = r.round_id
+            JOIN competitions_competitioncategory cc
+                ON cc.id = cr.competition_category_id
+            WHERE %s IS NULL OR cc.competition_id = %s
+        ) AS pairs
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [competition_id, competition_id])
+        return cursor.rowcount
@@ -11,7 +11,17 @@ urlpatterns = [
         name="startlist_reorder",
     ),
     path("startlist/<int:result_id>/", views.startlist_detail, name="startlist_detail"),
+    path(
+        "startlist/<int:result_id>/move/",
+        views.startlist_move,
+        name="startlist_move",
+    ),
     path("scores/", views.scores, name="scores"),
+    path(
+        "rounds/advance/",
+        views.advance_round_order,
+        name="advance_round_order",
+    ),
     path(
         "rounds/<int:round_id>/advance/",
         views.advance_climbers,
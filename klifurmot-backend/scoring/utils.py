@@ -1,16 +1,55 @@
+import functools
 import logging
 
 from channels.layers import get_channel_layer
 from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.db import IntegrityError, connection, transaction
 
+from competitions.models import CompetitionRound
 from competitions.services import get_competition_results
-from scoring.models import ClimberRoundScore
+from competitions.versions import bump_competition_version
+from scoring.coordinator import schedule_rerank
+from scoring.engines import engine_for_round
+from scoring.models import Climb, ClimberRoundScore
+from scoring.notifier import notify_results
+from scoring.triggers import triggers_active
 
 
 logger = logging.getLogger(__name__)
 
 
 def BroadcastScoreUpdate(competition_id):
+    bump_competition_version(competition_id)
+
+    # The results notifier picks the change up from the database instead.
+    if settings.RESULTS_PUSH_VIA_NOTIFY and connection.vendor == "postgresql":
+        return
+
+    send_results(competition_id)
+
+
+def broadcast_bulk_change(competition_ids, round_ids=()):
+    """Announce a `core.cascade` soft-delete or restore, which holds the row
+    triggers back: one version bump and one results push per competition,
+    and a rerank of every live round in `round_ids`.
+    """
+    if round_ids:
+        live_rounds = CompetitionRound.objects.filter(id__in=set(round_ids))
+        for round_id in live_rounds.values_list("id", flat=True):
+            schedule_rerank(round_id)
+
+    for competition_id in set(competition_ids):
+        bump_competition_version(competition_id)
+        if settings.RESULTS_PUSH_VIA_NOTIFY and connection.vendor == "postgresql":
+            notify_results(competition_id)
+        else:
+            transaction.on_commit(
+                functools.partial(send_results, competition_id), robust=True
+            )
+
+
+def send_results(competition_id):
     data = get_competition_results(competition_id)
 
     channel_layer = get_channel_layer()
@@ -24,42 +63,38 @@ def BroadcastScoreUpdate(competition_id):
 
 
 def UpdateRoundScoreForRoute(climb):
-    climber = climb.climber
+    climber_id = climb.climber_id
     round_obj = climb.route.round
 
-    if not climber or not round_obj:
+    if not climber_id or not round_obj:
         return
 
-    route_climbs = climber.climb_set.filter(
-        route__round=round_obj,
-        deleted=False,
-    )
+    engine = engine_for_round(round_obj)
+    # The database trigger only implements boulder scoring.
+    if engine.discipline == "boulder" and triggers_active():
+        return
 
-    total_tops = sum(1 for c in route_climbs if c.top_reached)
-    total_zones = sum(1 for c in route_climbs if c.zone_reached)
-    attempts_tops = sum(c.attempts_top for c in route_climbs if c.top_reached)
-    attempts_zones = sum(c.attempts_zone for c in route_climbs if c.zone_reached)
-
-    zone_score = 0
-    top_score = 0
-
-    for c in route_climbs:
-        if c.top_reached:
-            top_score += 25 - 0.1 * (c.attempts_top - 1)
-        elif c.zone_reached:
-            zone_score += 10 - 0.1 * (c.attempts_zone - 1)
-
-    total_score = round(zone_score + top_score, 1)
-
-    ClimberRoundScore.objects.update_or_create(
-        climber=climber,
-        round=round_obj,
-        deleted=False,
-        defaults={
-            "total_score": total_score,
-            "tops": total_tops,
-            "zones": total_zones,
-            "attempts_tops": attempts_tops,
-            "attempts_zones": attempts_zones,
-        },
-    )
+    rows = Climb.objects.filter(
+        climber_id=climber_id,
+        route__round_id=round_obj.pk,
+    ).values_list("climber_id", *engine.climb_fields)
+    values = engine.aggregate_round(rows).get(climber_id) or engine.empty_aggregate()
+
+    updated = ClimberRoundScore.objects.filter(
+        climber_id=climber_id,
+        round_id=round_obj.pk,
+    ).update(**values)
+    if updated:
+        return
+
+    try:
+        with transaction.atomic():
+            ClimberRoundScore.objects.create(
+                climber_id=climber_id, round_id=round_obj.pk, **values
+            )
+    except IntegrityError:
+        # Another writer created the row first; apply this aggregate to it.
+        ClimberRoundScore.objects.filter(
+            climber_id=climber_id,
+            round_id=round_obj.pk,
+        ).update(**values)
@@ -7,6 +7,8 @@ from rest_framework.permissions import (
     IsAuthenticatedOrReadOnly,
 )
 from core import utils
+from core.changes import parse_version
+from core.exceptions import ConflictError
 import logging
 
 from . import services
@@ -46,10 +48,26 @@ def climbs(request):
                 )
             climber_id_int = int(climber_id)
 
-        result = services.list_climbs(
-            round_id=int(round_id),
-            climber_id=climber_id_int,
-        )
+        try:
+            since = parse_version(request.query_params.get("since"))
+        except ValueError as e:
+            return utils.error_response(
+                code="Invalid_parameter",
+                message=str(e),
+                status_code=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if since is not None:
+            result = services.list_climbs_since(
+                round_id=int(round_id),
+                since=since,
+                climber_id=climber_id_int,
+            )
+        else:
+            result = services.list_climbs(
+                round_id=int(round_id),
+                climber_id=climber_id_int,
+            )
 
         return utils.success_response(
             data=result,
@@ -130,6 +148,13 @@ def climb_detail(request, climb_id):
             return utils.success_response(
                 data=result, message="Climb updated successfully"
             )
+        except ConflictError as e:
+            return utils.error_response(
+                code="Version_conflict",
+                message=str(e),
+                details=e.current,
+                status_code=status.HTTP_409_CONFLICT,
+            )
         except PermissionError as e:
             return utils.error_response(
                 code="Access_denied",
@@ -199,7 +224,19 @@ def startlist(request):
                 status_code=status.HTTP_400_BAD_REQUEST,
             )
 
-        result = services.list_startlist(round_id=int(round_id))
+        try:
+            since = parse_version(request.query_params.get("since"))
+        except ValueError as e:
+            return utils.error_response(
+                code="Invalid_parameter",
+                message=str(e),
+                status_code=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if since is not None:
+            result = services.list_startlist_since(round_id=int(round_id), since=since)
+        else:
+            result = services.list_startlist(round_id=int(round_id))
 
         return utils.success_response(
             data=result,
@@ -274,6 +311,13 @@ def startlist_detail(request, result_id):
             return utils.success_response(
                 data=result, message="Start list updated successfully"
             )
+        except ConflictError as e:
+            return utils.error_response(
+                code="Version_conflict",
+                message=str(e),
+                details=e.current,
+                status_code=status.HTTP_409_CONFLICT,
+            )
         except PermissionError as e:
             return utils.error_response(
                 code="Access_denied",
@@ -363,6 +407,51 @@ def startlist_reorder(request):
         )
 
 
+@api_view(["POST"])
+@permission_classes([IsAuthenticated])
+def startlist_move(request, result_id):
+    serializer = serializers.MoveStartlistSerializer(data=request.data)
+    if not serializer.is_valid():
+        errors_dict = cast(Dict[str, Any], serializer.errors)
+        return utils.validation_error_response(serializer_errors=errors_dict)
+
+    try:
+        validated_data = cast(Dict[str, Any], serializer.validated_data)
+        result = services.move_startlist_entry(
+            result_id=result_id,
+            user=request.user,
+            **validated_data,
+        )
+        return utils.success_response(
+            data=result, message="Start list entry moved successfully"
+        )
+    except ConflictError as e:
+        return utils.error_response(
+            code="Version_conflict",
+            message=str(e),
+            details=e.current,
+            status_code=status.HTTP_409_CONFLICT,
+        )
+    except PermissionError as e:
+        return utils.error_response(
+            code="Access_denied",
+            message=str(e),
+            status_code=status.HTTP_403_FORBIDDEN,
+        )
+    except ValueError as e:
+        return utils.error_response(
+            code="Move_failed",
+            message=str(e),
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+    except Exception as e:
+        return utils.error_response(
+            code="Move_failed",
+            message=str(e),
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+
+
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def scores(request):
@@ -422,3 +511,46 @@ def advance_climbers(request, round_id):
             message=str(e),
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         )
+
+
+@api_view(["POST"])
+@permission_classes([IsAuthenticated])
+def advance_round_order(request):
+    serializer = serializers.AdvanceRoundOrderSerializer(data=request.data)
+    if not serializer.is_valid():
+        errors_dict = cast(Dict[str, Any], serializer.errors)
+        return utils.validation_error_response(serializer_errors=errors_dict)
+
+    try:
+        validated_data = cast(Dict[str, Any], serializer.validated_data)
+        result = services.advance_round_order(
+            competition_id=validated_data["competition"],
+            round_order=validated_data["round_order"],
+            user=request.user,
+        )
+
+        return utils.success_response(
+            data=result,
+            message=f"{result['advanced']} climbers advanced",
+        )
+
+    except PermissionError as e:
+        return utils.error_response(
+            code="Access_denied",
+            message=str(e),
+            status_code=status.HTTP_403_FORBIDDEN,
+        )
+
+    except ValueError as e:
+        return utils.error_response(
+            code="Invalid_round",
+            message=str(e),
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+
+    except Exception as e:
+        return utils.error_response(
+            code="Advance_failed",
+            message=str(e),
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
@@ -109,6 +109,7 @@ export interface RouteStats {
     number: number;
     tops: number;
     zones: number;
+    best_hold?: number | null;
 }
 
 export interface RoundRoutes {
@@ -8,6 +8,10 @@ export interface Climb {
     attempts_zone: number;
     top_reached: boolean;
     zone_reached: boolean;
+    hold_reached: number | null;
+    plus_modifier: boolean | null;
+    time_seconds: number | null;
+    version: number;
 }
 
 export interface CreateClimbRequest {
@@ -17,6 +21,9 @@ export interface CreateClimbRequest {
     attempts_zone?: number;
     top_reached?: boolean;
     zone_reached?: boolean;
+    hold_reached?: number;
+    plus_modifier?: boolean;
+    time_seconds?: number | null;
 }
 
 export interface UpdateClimbRequest {
@@ -24,6 +31,10 @@ export interface UpdateClimbRequest {
     attempts_zone?: number;
     top_reached?: boolean;
     zone_reached?: boolean;
+    hold_reached?: number;
+    plus_modifier?: boolean;
+    time_seconds?: number | null;
+    version?: number;
 }
 
 export interface StartlistEntry {
@@ -33,6 +44,7 @@ export interface StartlistEntry {
     start_order: number;
     gender: 'KK' | 'KVK' | null;
     rank: number | null;
+    version: number;
 }
 
 export interface CreateStartlistRequest {
@@ -43,6 +55,7 @@ export interface CreateStartlistRequest {
 
 export interface UpdateStartlistRequest {
     start_order?: number;
+    version?: number;
 }
 
 export interface Score {